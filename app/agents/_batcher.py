@@ -0,0 +1,108 @@
+"""AgentBatcher 📦
+────────────────────────────────────────────
+Coalesces concurrent prompts for one agent into a single batched call.
+
+- Requests wait at most `max_wait_ms` for companions
+- Up to `max_batch` prompts are folded into one `agent.ask_batch`
+- Batches dispatch concurrently (up to `max_inflight`), so a slow LLM
+  call never holds up the next batch
+- Bounded queue: producers block when full (backpressure = "block")
+"""
+
+import asyncio
+import logging
+from typing import Dict, List, Set, Tuple
+
+logger = logging.getLogger("agent.batcher")
+
+MAX_BATCH = 32
+MAX_WAIT_MS = 10
+MAX_QUEUE = 1024
+MAX_INFLIGHT = 8
+
+
+class AgentBatcher:
+    """Per-agent async micro-batcher.
+
+    Attributes:
+        agent: Agent exposing `async ask_batch(prompts) -> list[str]`
+        max_batch (int): Largest batch handed to the agent
+        max_wait_ms (int): How long the first prompt waits for companions
+        max_inflight (int): Batches allowed in flight at once
+    """
+
+    def __init__(self, agent, max_batch: int = MAX_BATCH, max_wait_ms: int = MAX_WAIT_MS,
+                 max_queue: int = MAX_QUEUE, max_inflight: int = MAX_INFLIGHT):
+        self.agent = agent
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self._queue: "asyncio.Queue[Tuple[str, asyncio.Future]]" = asyncio.Queue(maxsize=max_queue)
+        self._worker = None
+        self._inflight = asyncio.Semaphore(max_inflight)
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def submit(self, prompt: str) -> str:
+        """Queue a prompt and wait for its reply."""
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((prompt, future))
+        return await future
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            # Don't wait for the reply; just cap how many batches are out at once
+            await self._inflight.acquire()
+            task = asyncio.create_task(self._dispatch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._dispatch_done)
+
+    def _dispatch_done(self, task: asyncio.Task):
+        self._tasks.discard(task)
+        self._inflight.release()
+
+    async def _dispatch(self, batch: List[Tuple[str, asyncio.Future]]):
+        prompts = [prompt for prompt, _ in batch]
+        try:
+            replies = await self.agent.ask_batch(prompts)
+        except Exception as e:
+            logger.error(f"[{getattr(self.agent, 'name', '?')}] Batch of {len(batch)} failed: {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), reply in zip(batch, replies):
+            if not future.done():
+                future.set_result(reply)
+
+        # 🧯 Short reply list: fail the leftovers instead of leaving them hanging
+        if len(replies) < len(batch):
+            error = RuntimeError(f"ask_batch returned {len(replies)} replies for {len(batch)} prompts")
+            logger.error(f"[{getattr(self.agent, 'name', '?')}] {error}")
+            for _, future in batch[len(replies):]:
+                if not future.done():
+                    future.set_exception(error)
+
+
+_BATCHERS: Dict[str, AgentBatcher] = {}
+
+
+def get_batcher(key: str, agent) -> AgentBatcher:
+    """Return the shared batcher for an agent key, creating it around `agent` on first use."""
+    batcher = _BATCHERS.get(key)
+    if batcher is None:
+        batcher = _BATCHERS[key] = AgentBatcher(agent)
+    return batcher
@@ -3,53 +3,171 @@
 Shared GPT/memory/mood logic for all agents.
 """
 
+import asyncio
+import os
+
 from shared.ai.gpt_client import GPTClient
 from shared.state.session_manager import session
 from shared.state.mood_state_tracker import get_user_mood, set_user_mood
 from shared.memory.memory_router import MemoryRouter
-from shared.ai.mood_engine import detect_mood, mood_wrapped_prompt
+from shared.ai.mood_engine import MOOD_SYSTEM, detect_mood, mood_system_prompt
 from backend.app.core.utils.logger import get_logger
 from backend.app.core.utils.ai_helpers import truncate_text, extract_json_from_response
+from backend.app.core.cache.response_cache import ResponseCache
+from backend.app.redis_client import redis_bytes_client
 
-from backend.app.agents.mycocore_agent import Mycocore
+from backend.app.agents.mycocore_agent import mycocore
 
 
 
 class BaseLLMAgent:
-    def __init__(self, agent_name: str):
+    def __init__(self, agent_name: str, memory_mode: str = None, encrypt_memory: bool = True):
+        """
+        Args:
+            agent_name (str): Display name, also used for cache/log namespaces
+            memory_mode (str): MemoryRouter backend; defaults to $MEMORY_MODE or "sql"
+            encrypt_memory (bool): Wrap the memory backend in encryption
+        """
         self.name = agent_name
-        self.username = session.get_user_name()
-        self.role = session.get_user_role()
-        self.device_id = session.get_user_profile().get("device_id", "unknown")
-        self.memory = MemoryRouter(mode=os.getenv("MEMORY_MODE", "sql"), encrypt=encrypt_memory)
+        self.memory = MemoryRouter(mode=memory_mode or os.getenv("MEMORY_MODE", "sql"), encrypt=encrypt_memory)
         self.gpt = GPTClient(agent=agent_name)
-        
+        self.cache = ResponseCache(agent_name, redis=redis_bytes_client)
+        # Provider prompt-cache keys, formatted once per agent instead of per request
+        self._prompt_cache_keys = {mood: f"{agent_name}:{mood}" for mood in MOOD_SYSTEM}
 
         # ✅ Injected core dependencies
         self.logger = get_logger(agent_name)
         self.session = session
-        self.core = Mycocore()
+        self.core = mycocore
+
+    # === Caller identity ===
+    # Agents are shared singletons, so identity is resolved per call from the
+    # (memoized) session rather than captured at construction.
+
+    @property
+    def username(self) -> str:
+        return self.session.get_identity()["name"]
+
+    @property
+    def role(self) -> str:
+        return self.session.get_identity()["role"]
+
+    @property
+    def device_id(self) -> str:
+        return self.session.get_identity()["device_id"]
+
+    def _prompt_cache_key(self, mood: str) -> str:
+        return self._prompt_cache_keys.get(mood) or f"{self.name}:{mood}"
+
+    async def _cached_ask(self, prompt: str, mood: str = "neutral") -> str:
+        """Ask GPT through the response cache.
 
-    def handle_prompt(self, prompt: str) -> str:
-        """Handles GPT logic w/ mood + memory context."""
-        # Store the prompt in memory
+        The mood is sent as a static system prompt so the provider can reuse
+        the cached prefix. Non-neutral moods bypass the response cache so
+        replies stay personalized.
+        """
+        system_message = mood_system_prompt(mood)
+        cache_key = self._prompt_cache_key(mood)
+        if mood != "neutral":
+            return await self.gpt.ask(prompt, system_message=system_message, prompt_cache_key=cache_key)
 
-        # Get response from GPT
-        reply = self.gpt.ask(wrapped_prompt)
+        reply = await self.cache.get(prompt)
+        if reply is not None:
+            self.logger.debug(f"[{self.name}] Response cache hit")
+            return reply
+
+        reply = await self.gpt.ask(prompt, system_message=system_message, prompt_cache_key=cache_key)
+        await self.cache.set(prompt, reply)
+        return reply
+
+    async def handle_prompt(self, prompt: str) -> str:
+        """Handles GPT logic w/ mood + memory context.
+
+        GPT is awaited on the shared async client; the (sync) memory
+        backends run in worker threads so the event loop stays free.
+        """
+        mood = detect_mood(prompt)
+        set_user_mood(self.username, mood)
+        self.logger.info(f"[{self.name}] Prompt mood: {mood}")
 
-        # Store the response in memory
-        self.memory.store_response(
+        try:
+            # Single GPT round-trip per prompt
+            reply = await self._cached_ask(prompt, mood)
+        except Exception as e:
+            self.logger.error(f"[{self.name}] Error during GPT ask: {e}")
+            # Still record the prompt that failed
+            await asyncio.to_thread(
+                self.memory.store_interaction,
+                agent=self.name,
+                user=self.username,
+                prompt=prompt,
+                mood=mood
+            )
+            return f"⚠️ Error generating reply: {e}"
+
+        # Store prompt + response in one write
+        await asyncio.to_thread(
+            self.memory.store_exchange,
             agent=self.name,
             user=self.username,
+            prompt=prompt,
+            mood=mood,
             response=reply
         )
+        return reply
+
+    async def ask_batch(self, prompts: list) -> list:
+        """Answer several prompts at once (used by the micro-batcher)."""
+        if not self.core.is_safe():
+            return list(await asyncio.gather(*(self.ask(prompt) for prompt in prompts)))
+        return await self.handle_prompt_batch(prompts)
+
+    async def handle_prompt_batch(self, prompts: list) -> list:
+        """Batched `handle_prompt`: one GPT fan-out for all cache misses."""
+        moods = [detect_mood(prompt) for prompt in prompts]
+        user = self.username
+
+        for mood in moods:
+            set_user_mood(user, mood)
+
         try:
-            mood = detect_mood(prompt)
-            set_user_mood(self.username, mood)
-            wrapped_prompt = mood_wrapped_prompt(prompt, mood)
-            self.logger.info(f"[{self.name}] Prompt mood: {mood}; Wrapped: {wrapped_prompt}")
-            reply = self.gpt.ask(wrapped_prompt)
-            return reply
+            replies = await self._cached_ask_batch(prompts, moods)
         except Exception as e:
-            self.logger.error(f"[{self.name}] Error during GPT ask: {e}")
-            return f"⚠️ Error generating reply: {e}"
\ No newline at end of file
+            self.logger.error(f"[{self.name}] Error during GPT batch ask: {e}")
+
+            def _store_interactions():
+                for prompt, mood in zip(prompts, moods):
+                    self.memory.store_interaction(agent=self.name, user=user, prompt=prompt, mood=mood)
+
+            await asyncio.to_thread(_store_interactions)
+            return [f"⚠️ Error generating reply: {e}"] * len(prompts)
+
+        def _store_exchanges():
+            for prompt, mood, reply in zip(prompts, moods, replies):
+                self.memory.store_exchange(agent=self.name, user=user, prompt=prompt,
+                                           mood=mood, response=reply)
+
+        await asyncio.to_thread(_store_exchanges)
+        return replies
+
+    async def _cached_ask_batch(self, prompts: list, moods: list) -> list:
+        """Batched `_cached_ask`: only cache misses go to GPT, grouped by mood."""
+        replies = [None] * len(prompts)
+        misses = {}
+        for i, (prompt, mood) in enumerate(zip(prompts, moods)):
+            if mood == "neutral":
+                replies[i] = await self.cache.get(prompt)
+            if replies[i] is None:
+                misses.setdefault(mood, []).append(i)
+
+        for mood, indices in misses.items():
+            fresh = await self.gpt.ask_batch(
+                [prompts[i] for i in indices],
+                system_message=mood_system_prompt(mood),
+                prompt_cache_key=self._prompt_cache_key(mood),
+            )
+            for i, reply in zip(indices, fresh):
+                replies[i] = reply
+                if mood == "neutral":
+                    await self.cache.set(prompts[i], reply)
+        return replies
@@ -13,7 +13,7 @@ connecting all specialized agents.
 """
 
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, KeysView
 import threading
 
 from backend.app.core.utils.ai_helpers import truncate_text, extract_json_from_response
@@ -32,7 +32,7 @@ class Mycocore:
         _lock: Thread synchronization lock
         _safe_mode (bool): System safety mode flag
         _system_flags (Dict): System-wide flags and settings
-        _active_agents (Set): Currently registered agents
+        _active_agents (Dict): Currently registered agents (insertion-ordered keys)
         _agent_health (Dict): Health status of all agents
         _startup_time: System startup timestamp
     """
@@ -42,14 +42,21 @@ class Mycocore:
     def __new__(cls):
         """Singleton pattern implementation.
         
+        Uses double-checked locking so the common case is a plain
+        attribute read; the lock is only taken on first construction.
+
         Returns:
             Mycocore: The singleton instance
         """
-        with cls._lock:
-            if cls._instance is None:
-                cls._instance = super().__new__(cls)
-                cls._instance._init_mycocore()
-            return cls._instance
+        instance = cls._instance
+        if instance is None:
+            with cls._lock:
+                instance = cls._instance
+                if instance is None:
+                    instance = super().__new__(cls)
+                    instance._init_mycocore()
+                    cls._instance = instance
+        return instance
 
     def _init_mycocore(self):
         """Initialize the Mycocore system.
@@ -58,7 +65,7 @@ class Mycocore:
         """
         self._safe_mode = False
         self._system_flags: Dict[str, Any] = {}
-        self._active_agents = set()
+        self._active_agents: Dict[str, None] = {}
         logger.info("Mycocore initialized")
 
     def is_safe(self) -> bool:
@@ -112,7 +119,7 @@ class Mycocore:
         Args:
             agent_id (str): Unique agent identifier
         """
-        self._active_agents.add(agent_id)
+        self._active_agents[agent_id] = None
         logger.info(f"Agent registered: {agent_id}")
 
     def unregister_agent(self, agent_id: str):
@@ -121,13 +128,23 @@ class Mycocore:
         Args:
             agent_id (str): Unique agent identifier
         """
-        self._active_agents.discard(agent_id)
+        self._active_agents.pop(agent_id, None)
         logger.info(f"Agent unregistered: {agent_id}")
 
-    def get_active_agents(self) -> Set[str]:
-        """Get the set of currently active agents.
-        
+    def get_active_agents(self) -> KeysView[str]:
+        """Get the currently active agents.
+
+        Returns a read-only, set-like view instead of copying; wrap it in
+        `list()`/`frozenset()` if a snapshot is needed.
+
         Returns:
-            Set[str]: Set of active agent identifiers
+            KeysView[str]: View of active agent identifiers
         """
-        return self._active_agents.copy()
\ No newline at end of file
+        return self._active_agents.keys()
+
+
+# Legacy spelling used by older imports; same class
+MycoCore = Mycocore
+
+# 🧠 Module-level singleton — import this instead of calling Mycocore()
+mycocore = Mycocore()
@@ -13,15 +13,22 @@ NeuroweaveAgent combines LLM capabilities with financial
 domain knowledge to provide predictive insights.
 """
 
+import asyncio
+from typing import Optional
+
 from backend.app.agents.base_llm_agent import BaseLLMAgent
-from backend.app.agents.mycocore_agent import MycoCore
 from backend.app.core.utils.ai_helpers import truncate_text, extract_json_from_response
-from backend.app.core.memory.memory_router import MemoryRouter
 from backend.app.core.ai.mood_engine import detect_mood
 from backend.app.agent_features.financial_report import generate_prediction_report
 
 
 
+# Reply template split once at import; `respond` is a plain concat
+_RESPOND_PREFIX = "🧠 Neuroweave acknowledges: '"
+_RESPOND_SUFFIX = "' — processing signal..."
+_PDF_SEPARATOR = "\n\n---\n\n"
+
+
 class NeuroweaveAgent(BaseLLMAgent):
     """LLM-based predictive market analysis agent.
     
@@ -34,11 +41,9 @@ class NeuroweaveAgent(BaseLLMAgent):
         confidence_metrics (Dict): Metrics on prediction accuracy
     """
     def __init__(self):
-        super().__init__(agent_name="Neuroweave")
-        self.core = MycoCore()
-        self.memory = MemoryRouter(mode="redis", encrypt=True)  # 🔐 Encrypted Redis memory
+        super().__init__(agent_name="Neuroweave", memory_mode="redis", encrypt_memory=True)  # 🔐 Encrypted Redis memory
 
-    def ask(self, prompt: str, pdf_text: Optional[str] = None) -> str:
+    async def ask(self, prompt: str, pdf_text: Optional[str] = None) -> str:
         """Process a user question about market predictions.
         
         Args:
@@ -52,22 +57,22 @@ class NeuroweaveAgent(BaseLLMAgent):
 
         # Combine PDF text (if any) with prompt
         if pdf_text:
-            prompt = f"{pdf_text}\n\n---\n\n{prompt}"
+            prompt = pdf_text + _PDF_SEPARATOR + prompt
 
-        mood = detect_mood(prompt)  # calls mood_engine
-        self.memory.store_interaction(agent=self.agent_name, user=self.user, prompt=prompt, mood=mood)
-
-        raw_response = self.handle_prompt(prompt)
-
-        self.memory.store_response(agent=self.agent_name, user=self.user, response=raw_response)
+        # handle_prompt detects the mood and stores the exchange
+        raw_response = await self.handle_prompt(prompt)
 
         # Optionally wrap as PDF market report
         if "generate report" in prompt.lower():
             tickers, summaries = extract_from_response(raw_response)
-            return generate_prediction_report(tickers, summaries, user=self.user)
+            return generate_prediction_report(tickers, summaries, user=self.username)
 
         return raw_response
 
+    async def ask_batch(self, prompts: list) -> list:
+        """Answer prompts individually (report generation is per-prompt), concurrently."""
+        return list(await asyncio.gather(*(self.ask(prompt) for prompt in prompts)))
+
     def respond(self, input_text: str) -> str:
         """Provide a simple acknowledgment response.
         
@@ -77,4 +82,4 @@ class NeuroweaveAgent(BaseLLMAgent):
         Returns:
             str: Acknowledgment message
         """
-        return f"🧠 Neuroweave acknowledges: '{input_text}' — processing signal..."
+        return _RESPOND_PREFIX + input_text + _RESPOND_SUFFIX
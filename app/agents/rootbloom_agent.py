@@ -5,19 +5,22 @@ Emotionally intelligent personal aide.
 """
 
 from backend.app.agents.base_llm_agent import BaseLLMAgent
-from backend.app.agents.mycocore_agent import MycoCore
 from backend.app.core.utils.ai_helpers import truncate_text, extract_json_from_response
 
 
+# Reply template split once at import; `respond` is a plain concat
+_RESPOND_PREFIX = "📅 Rootbloom says: '"
+_RESPOND_SUFFIX = "' — added to your life log."
+
+
 class RootbloomAgent(BaseLLMAgent):
     def __init__(self):
         super().__init__(agent_name="Rootbloom")
-        self.core = MycoCore()
 
-    def ask(self, prompt: str) -> str:
+    async def ask(self, prompt: str) -> str:
         if not self.core.is_safe():
             return "🌸 Rootbloom is offline. Safe mode is active."
-        return self.handle_prompt(prompt)
+        return await self.handle_prompt(prompt)
 
     def respond(self, input_text: str) -> str:
-        return f"📅 Rootbloom says: '{input_text}' — added to your life log."
+        return _RESPOND_PREFIX + input_text + _RESPOND_SUFFIX
@@ -5,22 +5,24 @@ Future: Real-time sentiment & stock linking.
 """
 
 from backend.app.agents.base_llm_agent import BaseLLMAgent
-from backend.app.agents.mycocore_agent import MycoCore
 from backend.app.core.utils.ai_helpers import truncate_text, extract_json_from_response
 
+# Reply template split once at import; `respond` is a plain concat
+_RESPOND_PREFIX = "📡 Sporelink acknowledges: '"
+_RESPOND_SUFFIX = "'"
+
 class SporelinkAgent(BaseLLMAgent):
     def __init__(self):
         super().__init__(agent_name="Sporelink")
-        self.core = MycoCore()
 
-    def ask(self, prompt: str) -> str:
+    async def ask(self, prompt: str) -> str:
         if not self.core.is_safe():
             return "🛰️ Sporelink disabled in safe mode."
-        return self.handle_prompt(prompt)
+        return await self.handle_prompt(prompt)
 
 
     def fetch_news(self):
         return "[WIP] Fetching headlines from NewsAPI..."
 
     def respond(self, input_text: str) -> str:
-        return f"📡 Sporelink acknowledges: '{input_text}'"
+        return _RESPOND_PREFIX + input_text + _RESPOND_SUFFIX
@@ -9,9 +9,9 @@ Tracks:
 - Performance metrics and analytics
 """
 
-from sqlalchemy import Column, String, DateTime, JSON
+from sqlalchemy import Column, String, DateTime, JSON, Index, Uuid, func
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import declarative_base
-from datetime import datetime
 import uuid
 
 Base = declarative_base()
@@ -23,16 +23,19 @@ class SystemLog(Base):
     enabling comprehensive system monitoring and debugging.
     
     Attributes:
-        id (str): Unique identifier (UUID4)
+        id (uuid.UUID): Unique identifier (UUID4, native 16-byte UUID on PostgreSQL)
         agent (str): Name of the agent that triggered the event
         event (str): Type/description of the event
-        data (JSON): Additional event-specific data/payload
-        timestamp (DateTime): When the event occurred (UTC)
+        data (JSON): Additional event-specific data/payload (JSONB on PostgreSQL)
+        timestamp (DateTime): When the event occurred (set by the DB server)
     """
     __tablename__ = "system_logs"
-    
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    __table_args__ = (
+        Index("ix_systemlog_agent_ts", "agent", "timestamp"),
+    )
+
+    id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
     agent = Column(String, nullable=False)
     event = Column(String, nullable=False)
-    data = Column(JSON)
-    timestamp = Column(DateTime, default=datetime.utcnow)
\ No newline at end of file
+    data = Column(JSON().with_variant(JSONB(), "postgresql"))
+    timestamp = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
\ No newline at end of file
@@ -10,7 +10,7 @@ Manages:
 - Session and device tracking
 """
 
-from sqlalchemy import Column, String, Boolean, DateTime
+from sqlalchemy import Column, String, Boolean, DateTime, Index, Uuid, text
 from sqlalchemy.orm import declarative_base
 from datetime import datetime
 import uuid
@@ -24,10 +24,10 @@ class User(Base):
     including email verification, MFA, and role-based access.
     
     Attributes:
-        id (str): Unique identifier (UUID4)
+        id (uuid.UUID): Unique identifier (UUID4, native 16-byte UUID on PostgreSQL)
         username (str): Unique login name
         email (str): Verified email address
-        hashed_password (str): Bcrypt-hashed password
+        hashed_password (str): Argon2id (or legacy bcrypt) password hash
         role (str): Access control role
         last_login (DateTime): Most recent login timestamp
         device_id (str): Associated device identifier
@@ -37,9 +37,18 @@ class User(Base):
         token_expiry (DateTime): Verification token expiration
     """
     __tablename__ = "users"
+    __table_args__ = (
+        # Only unverified accounts carry a token, so index just those rows
+        Index(
+            "ix_user_verification_token",
+            "verification_token",
+            postgresql_where=text("verification_token IS NOT NULL"),
+            sqlite_where=text("verification_token IS NOT NULL"),
+        ),
+    )
 
     # Core identity
-    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(Uuid(as_uuid=True), primary_key=True, default=uuid.uuid4)
     username = Column(String, unique=True, index=True, nullable=False)
     email = Column(String, unique=True, index=True, nullable=False)
     hashed_password = Column(String, nullable=False)
@@ -10,8 +10,9 @@ Endpoints:
 
 from fastapi import APIRouter, HTTPException
 
-from backend.app.agents.core.executors import AgentChainExecutor
-from backend.app.agents.core.registry import AGENT_REGISTRY
+from backend.app.core.executors import AgentChainExecutor
+from backend.app.core.registry.agents import AGENT_REGISTRY
+from backend.app.agents._batcher import get_batcher
 
 from backend.app.core.utils.logger import get_request_log_context
 from backend.app.core.utils.validators import PromptRequest
@@ -47,7 +48,8 @@ async def ask_any_agent(agent: str, input: PromptRequest):
         raise HTTPException(status_code=404, detail=f"Agent '{agent}' not found")
 
     try:
-        reply = agent_obj.ask(input.prompt)
+        # Concurrent prompts for the same agent share one batched GPT call
+        reply = await get_batcher(agent.lower(), agent_obj).submit(input.prompt)
         return {"agent": agent, "response": reply}
     except Exception as e:
         logger.error(f"[{agent}] Agent error: {e}")
@@ -60,11 +62,11 @@ class ChainStep(BaseModel):
 @router.post("/agent/chain", tags=["agent"])
 async def execute_agent_chain_endpoint(steps: List[ChainStep]):
     """
-    🧠 Run a chain of agents with ordered prompts.
+    🧠 Run a chain of agents; prompts run concurrently, results keep their order.
     """
     try:
         executor = AgentChainExecutor()
-        result = executor.run([step.dict() for step in steps])
+        result = await executor.run_parallel([step.dict() for step in steps])
         return {"result": result}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Chain execution failed: {e}")
\ No newline at end of file
@@ -9,7 +9,7 @@ Handles WebSocket streams for live agent communication.
 """
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
-from backend.app.core.websocket_manager import manager
+from backend.app.core.utils.websocket_manager import manager
 import logging
 
 
@@ -1,15 +1,14 @@
 # backend/app/api/routes/auth_routes.py
 
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi import APIRouter, HTTPException, Depends, Response, Request, Cookie, Query, status
 from fastapi.security import HTTPBearer
 from pydantic import BaseModel, EmailStr
-from typing import Optional
+from typing import Dict, Optional
 from passlib.context import CryptContext
 from datetime import datetime, timedelta
-from limits import RateLimitItemPerMinute
-from limits.aio.storage.memory import MemoryStorage
-import secrets, logging
+import asyncio, secrets, logging, time
 
 from backend.app.api.models.user_model import User
 from backend.app.services.database import get_db
@@ -23,12 +22,20 @@ from backend.app.services.cookie_utils import (
     set_refresh_cookie,
     clear_refresh_cookie
 )
+from backend.app.core.state.session_manager import session
 
 router = APIRouter()
 security = HTTPBearer()
 
-# 🔐 Password encryption context using bcrypt algorithm
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# 🔐 Password hashing context: argon2id for new hashes, bcrypt still verified
+# (and transparently upgraded on the next successful login)
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__type="ID",
+    argon2__rounds=2,
+    argon2__memory_cost=65536,
+)
 logger = logging.getLogger("auth")
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -36,7 +43,7 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 def hash_password(password: str) -> str:
-    """🔑 Hashes a plaintext password using bcrypt"""
+    """🔑 Hashes a plaintext password using argon2id"""
     return pwd_context.hash(password)
 
 # 📦 Input model for user registration
@@ -60,22 +67,22 @@ class UserResponse(BaseModel):
 
 # 🔐 Register new user    
 @router.post("/auth/register", status_code=status.HTTP_201_CREATED, tags=["auth"])
-async def register_user(user: UserRegister, db: Session = Depends(get_db)):
+async def register_user(user: UserRegister, db: AsyncSession = Depends(get_db)):
     """
     🔐 Register a new user with hashed password
     
     - Checks for duplicate username/email
-    - Hashes the password using bcrypt
+    - Hashes the password using argon2id (off the event loop)
     - Generates a verification token for email verification
     """
     try:
-        existing_user = db.query(User).filter(
-            (User.username == user.username) | (User.email == user.email)
-        ).first()
+        existing_user = await db.scalar(
+            select(User).where((User.username == user.username) | (User.email == user.email)).limit(1)
+        )
         if existing_user:
             raise HTTPException(status_code=400, detail="Username or email already exists.")
 
-        hashed_pw = pwd_context.hash(user.password)
+        hashed_pw = await asyncio.to_thread(pwd_context.hash, user.password)
         verification_token = secrets.token_urlsafe(32)
 
         new_user = User(
@@ -87,43 +94,58 @@ async def register_user(user: UserRegister, db: Session = Depends(get_db)):
             verification_token=verification_token
         )
         db.add(new_user)
-        db.commit()
-        db.refresh(new_user)
+        await db.commit()
+        await db.refresh(new_user)
         logger.info(f"User {new_user.username} registered successfully", extra=get_request_log_context())
 
         return {
-            "id": new_user.id,
+            "id": str(new_user.id),
             "username": new_user.username,
             "email": new_user.email,
             "role": new_user.role
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Registration failed : {e}", extra=get_request_log_context())
         raise HTTPException(status_code=500, detail=f"Registration failed: {str(e)}")
 
 # 🔓 Login + JWT Issuance
 @router.post("/auth/login", response_model=UserResponse, tags=["auth"])
-async def login(request: Request, credentials: UserLogin, db: Session = Depends(get_db)):
+async def login(request: Request, credentials: UserLogin, db: AsyncSession = Depends(get_db)):
     """
     🔓 Authenticate a user using username and password
 
     - Validates credentials against stored hashed password
     - Issues a short-lived JWT access token
     - Applies rate limiting before validation (brute-force protection)
+    - Rehashes legacy bcrypt passwords to argon2id on success
     """
     await check_rate_limit(request)
-    user = db.query(User).filter(User.username == credentials.username).first()
-    
-    if not user or not pwd_context.verify(credentials.password, user.hashed_password):
+    user = await db.scalar(select(User).where(User.username == credentials.username))
+
+    # Hash verification is CPU-bound (~100ms); run it on a worker thread
+    valid, new_hash = (False, None)
+    if user:
+        valid, new_hash = await asyncio.to_thread(
+            pwd_context.verify_and_update, credentials.password, user.hashed_password
+        )
+
+    if not valid:
         logger.warning(f"Login failed for user: {credentials.username}", extra=get_request_log_context(request))
         raise HTTPException(status_code=401, detail="Invalid credentials")
 
+    if new_hash:
+        user.hashed_password = new_hash
+        await db.commit()
+
     token = create_access_token({"sub": user.username, "role": user.role})
+    session.invalidate_identity()
     logger.info(f"User {user.username} logged in successfully", extra=get_request_log_context(request))
     
     return UserResponse(
-        id=user.id,
+        id=str(user.id),
         username=user.username,
         role=user.role,
         token=token
@@ -138,6 +160,7 @@ async def logout(response: Response):
     - Invalidates refresh session client-side
     """
     clear_refresh_cookie(response)
+    session.invalidate_identity()
     logger.info("User logged out (refresh cookie cleared)", extra=get_request_log_context())
     return {"message": "Logged out successfully"}
 
@@ -202,11 +225,11 @@ async def auto_login(refresh_token: Optional[str] = Cookie(None)):
 
 # ✅ Email verification endpoint
 @router.get("/auth/verify_email", tags=["auth"])
-async def verify_email(token: str = Query(...), db: Session = Depends(get_db)):
+async def verify_email(token: str = Query(...), db: AsyncSession = Depends(get_db)):
     """
     Verifies user's email using a token from the verification link.
     """
-    user = db.query(User).filter(User.verification_token == token).first()
+    user = await db.scalar(select(User).where(User.verification_token == token))
 
     if not user:
         raise HTTPException(status_code=404, detail="Invalid verification token.")
@@ -216,7 +239,7 @@ async def verify_email(token: str = Query(...), db: Session = Depends(get_db)):
 
     user.verified = True
     user.verification_token = None
-    db.commit()
+    await db.commit()
     logger.info(f"Email verified for user {user.username}", extra=get_request_log_context())
     return {"message": "Email successfully verified. You may now log in."}
 
@@ -247,9 +270,43 @@ async def admin_check(user=Depends(require_role("admin"))):
     """
     return {"message": f"Hello, {user['sub']} 👑 You have admin access."}
 
-# 🚦 Create an in-memory rate limiter
-storage = MemoryStorage()
-rate_limit = RateLimitItemPerMinute(5)
+# 🚦 In-memory login token bucket (per IP, per worker process)
+# Each bucket is one packed int: last refill time in ms (high bits) and the
+# remaining token count (low 24 bits) — a single dict read/write per attempt.
+LOGIN_BUCKET_CAPACITY = 5
+LOGIN_WINDOW_MS = 60_000
+LOGIN_BUCKETS_MAX = 100_000
+_TOKEN_BITS = 24
+_TOKEN_MASK = (1 << _TOKEN_BITS) - 1
+_BUCKETS: Dict[str, int] = {}
+
+def _take_login_token(key: str) -> bool:
+    """Consume one token for `key`; False if the bucket is empty."""
+    now_ms = time.monotonic_ns() // 1_000_000
+    packed = _BUCKETS.get(key)
+    if packed is None:
+        last_ms, tokens = now_ms, LOGIN_BUCKET_CAPACITY
+    else:
+        last_ms, tokens = packed >> _TOKEN_BITS, packed & _TOKEN_MASK
+        refill = (now_ms - last_ms) * LOGIN_BUCKET_CAPACITY // LOGIN_WINDOW_MS
+        if refill:
+            tokens = min(LOGIN_BUCKET_CAPACITY, tokens + refill)
+            # Only advance by the time actually converted into tokens
+            last_ms = now_ms if tokens == LOGIN_BUCKET_CAPACITY else \
+                last_ms + refill * LOGIN_WINDOW_MS // LOGIN_BUCKET_CAPACITY
+
+    if tokens == 0:
+        return False
+
+    if packed is None and len(_BUCKETS) >= LOGIN_BUCKETS_MAX:
+        _prune_buckets(now_ms)
+    _BUCKETS[key] = (last_ms << _TOKEN_BITS) | (tokens - 1)
+    return True
+
+def _prune_buckets(now_ms: int):
+    """Drop buckets that have fully refilled (they carry no state)."""
+    for key in [k for k, v in _BUCKETS.items() if now_ms - (v >> _TOKEN_BITS) >= LOGIN_WINDOW_MS]:
+        del _BUCKETS[key]
 
 async def check_rate_limit(request: Request):
     """
@@ -260,5 +317,5 @@ async def check_rate_limit(request: Request):
     - Prevents brute-force login attacks
     """
     client_ip = request.client.host
-    if not await storage.acquire_entry(f"login:{client_ip}", rate_limit):
+    if not _take_login_token(f"login:{client_ip}"):
         raise HTTPException(status_code=429, detail="Too many login attempts. Try again later.")
@@ -15,12 +15,22 @@ Main Features:
 from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel, Field, constr
 from typing import List, Dict, Any
-import logging, secrets
-from datetime import datetime
+import asyncio, logging, secrets, time
+from datetime import datetime, timezone
+
+from backend.app.core.utils.validators import AgentName
+from backend.app.core.registry.agents import AGENT_REGISTRY
 
 router = APIRouter()
 logger = logging.getLogger("chain")
 
+# Hashed whitelist of dispatchable agents, fixed once the registry is built
+_AGENTS: frozenset = frozenset(AGENT_REGISTRY.keys())
+
+def _utc_now_naive() -> datetime:
+    # Same value/format as the deprecated datetime.utcnow()
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
 class AgentStep(BaseModel):
     """
     🧠 Represents a single step in the agent chain.
@@ -30,7 +40,7 @@ class AgentStep(BaseModel):
     - prompt: Instructional string sent to the agent
     - parameters: Optional config dictionary passed to agent execution
     """
-    agent: constr(pattern=r'^[a-zA-Z0-9_-]+$', min_length=1, max_length=50)
+    agent: AgentName
     prompt: str = Field(..., min_length=1, max_length=1000, description="Natural language question or command")
     parameters: Dict[str, Any] = Field(default_factory=dict)
 
@@ -87,30 +97,45 @@ async def execute_chain(request: ChainRequest):
     - Agent names must be alphanumeric with underscores/hyphens
     """
     logger.info(f"Executing chain with {len(request.chain)} steps", extra=get_request_log_context())
-    start_time = datetime.utcnow()
+    # Naive UTC, as the response contract has always carried it
+    start_time = _utc_now_naive()
+    t0 = time.perf_counter()
     
     try:
-        results = []
+        # Validate every step before dispatching any of them
         for step in request.chain:
-            # Validate agent exists
-            if step.agent not in ["neuroweave", "rootbloom", "sporelink"]:
+            if step.agent not in _AGENTS:
                 raise HTTPException(
                     status_code=400,
                     detail=f"Invalid agent: {step.agent}"
                 )
-            
-            # Stubbed execution - replace with actual agent routing
-            execution = dispatch_to_agent(step.agent, step.prompt, step.parameters)
-            execution.update({
-                "agent": step.agent,
-                "input": step.prompt
-            })
-            results.append(execution)
+
+        # Steps don't feed each other, so group them per agent (one batched
+        # call each) and run the groups concurrently
+        groups: Dict[str, List[int]] = {}
+        for i, step in enumerate(request.chain):
+            groups.setdefault(step.agent, []).append(i)
+
+        batches = await asyncio.gather(*(
+            dispatch_batch(
+                agent,
+                [request.chain[i].prompt for i in indices],
+                [request.chain[i].parameters for i in indices],
+            )
+            for agent, indices in groups.items()
+        ))
+
+        # Reassemble in original chain order
+        results: List[Dict[str, Any]] = [None] * len(request.chain)
+        for indices, executions in zip(groups.values(), batches):
+            for i, execution in zip(indices, executions):
+                step = request.chain[i]
+                results[i] = {**execution, "agent": step.agent, "input": step.prompt}
         
-        execution_time = (datetime.utcnow() - start_time).total_seconds()
+        execution_time = time.perf_counter() - t0
         
         return ChainResponse(
-            request_id=secrets.token_hex(8),
+            request_id=secrets.token_urlsafe(8),
             timestamp=start_time,
             chain=request.chain,
             results=results,
@@ -126,7 +151,7 @@ async def execute_chain(request: ChainRequest):
             detail="Failed to execute agent chain"
         )
     
-def dispatch_to_agent(agent: str, prompt: str, params: dict) -> dict:
+async def dispatch_to_agent(agent: str, prompt: str, params: dict) -> dict:
     """
     🚀 Routes prompt and parameters to a specific agent's backend.
 
@@ -141,6 +166,20 @@ def dispatch_to_agent(agent: str, prompt: str, params: dict) -> dict:
     """
     return {
         "output": f"{agent} processed: {prompt}",
-        "timestamp": datetime.utcnow().isoformat()
+        "timestamp": _utc_now_naive().isoformat()
     }
-    
\ No newline at end of file
+    
+
+async def dispatch_batch(agent: str, prompts: List[str], params: List[dict]) -> List[dict]:
+    """
+    📦 Routes several prompts for the same agent in one call.
+
+    Stubbed like `dispatch_to_agent`; once real agents are wired in, this
+    becomes a single `AGENT_REGISTRY[agent].ask_batch(prompts)` round-trip.
+
+    Returns:
+    - list of dicts (output + timestamp), in the same order as `prompts`
+    """
+    return list(await asyncio.gather(*(
+        dispatch_to_agent(agent, prompt, p) for prompt, p in zip(prompts, params)
+    )))
\ No newline at end of file
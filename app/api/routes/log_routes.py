@@ -10,22 +10,41 @@ Features:
 """
 
 from fastapi import APIRouter, HTTPException, Depends
-from fastapi.security import HTTPBearer
-from fastapi.responses import JSONResponse
+from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
-from typing import Dict, Any, List
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import AsyncIterator, Dict, Any, List
 import logging
+import orjson
 
 from backend.app.core.utils.logger import get_request_log_context
+from backend.app.core.utils.responses import ORJSONUTCResponse, ORJSON_UTC_OPTIONS
 from backend.app.api.models.system_log_model import SystemLog
-from backend.app.services.database import get_db
-from backend.app.services.token_service import verify_token
+from backend.app.services.database import AsyncSessionLocal, get_db
+from backend.app.services.log_writer import system_log_writer
+from backend.app.services.token_service import verify_token_cached
+from backend.app.core.utils.websocket_manager import manager
+from backend.app.api.routes.mycocore_routes import SystemEvent
 
 router = APIRouter()
 logger = logging.getLogger("logs")
 security = HTTPBearer()
 
+STREAM_THRESHOLD = 1000  # larger `limit`s are streamed from a server-side cursor
+
+async def admin_required(token: HTTPAuthorizationCredentials = Depends(security)) -> dict:
+    """
+    🔑 Async admin guard: cached JWT verification + role check, no threadpool hop.
+    """
+    payload = verify_token_cached(token.credentials)
+    if not payload:
+        raise HTTPException(status_code=401, detail="Invalid or missing token")
+    if payload.get("role") != "admin":
+        raise HTTPException(status_code=403, detail="Forbidden: insufficient privileges")
+    return payload
+
 class LogEntry(BaseModel):
     """
     📝 Represents a structured system log entry.
@@ -40,24 +59,20 @@ class LogEntry(BaseModel):
     data: Dict[str, Any]
 
 @router.post("/logs/save", tags=["logs"])
-async def save_log(entry: LogEntry, token=Depends(security), db: Session = Depends(get_db)):
+async def save_log(entry: LogEntry, payload: dict = Depends(admin_required)):
     """
     📝 Save a structured system log entry (Admin-Only)
 
     - Requires JWT access token
-    - Logs to DB and to file via Python logger
+    - Queues the row for the batched DB writer, and logs to file
+      via Python logger
     - Broadcasts event to connected WebSocket clients
     """
-    payload = verify_token(token.credentials)
-
-    if payload.get("role") != "admin":
-        raise HTTPException(status_code=403, detail="Forbidden: insufficient privileges")
-
     try:
-        # 🧠 Save to database
-        db_log = SystemLog(agent=entry.agent, event=entry.event, data=entry.data)
-        db.add(db_log)
-        db.commit()
+        # 🧠 Queue for the bulk writer (one INSERT + COMMIT per batch)
+        log_id = system_log_writer.submit(entry.agent, entry.event, entry.data)
+        if log_id is None:
+            raise HTTPException(status_code=503, detail="Log buffer full, retry later")
 
         # 📡 Broadcast event to WebSocket clients
         event = SystemEvent(type=entry.event, message=str(entry.data))
@@ -65,38 +80,64 @@ async def save_log(entry: LogEntry, token=Depends(security), db: Session = Depen
 
         # 🗂️ Also write to file
         logger.info(f"[{entry.agent}] {entry.event}: {entry.data}", extra=get_request_log_context())
-        return {"status": "ok", "log_id": db_log.id}
+        return {"status": "queued", "log_id": str(log_id)}
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to save log: {e}", extra=get_request_log_context())
         raise HTTPException(status_code=500, detail="Failed to save log entry")
 
     
 @router.get("/logs/query", tags=["logs"])
-async def query_logs(limit: int = 100, db: Session = Depends(get_db), token=Depends(security)):
+async def query_logs(limit: int = 100, db: AsyncSession = Depends(get_db),
+                     payload: dict = Depends(admin_required)):
     """
     🔎 Query system logs (Admin-Only)
 
     - Returns recent logs ordered by timestamp
     - Accessible from admin dashboard
     """
-    payload = verify_token(token.credentials)
-    if payload.get("role") != "admin":
-        raise HTTPException(status_code=403, detail="Forbidden: insufficient privileges")
+    # Column projection: plain Core rows, no ORM identity map
+    stmt = (
+        select(SystemLog.id, SystemLog.agent, SystemLog.event, SystemLog.data, SystemLog.timestamp)
+        .order_by(SystemLog.timestamp.desc())
+        .limit(limit)
+    )
+
+    if limit > STREAM_THRESHOLD:
+        logger.info(f"Streaming last {limit} logs", extra=get_request_log_context())
+        return StreamingResponse(_stream_logs(stmt), media_type="application/json")
 
     try:
-        logs = db.query(SystemLog).order_by(SystemLog.timestamp.desc()).limit(limit).all()
+        rows = (await db.execute(stmt)).all()
         logger.info(f"Queried last {limit} logs", extra=get_request_log_context())
-        return JSONResponse(content=[
-            {
-                "id": log.id,
-                "agent": log.agent,
-                "event": log.event,
-                "data": log.data,
-                "timestamp": log.timestamp.isoformat()
-            }
-            for log in logs
+        # orjson serializes UUID/datetime natively
+        return ORJSONUTCResponse([
+            {"id": id_, "agent": agent, "event": event, "data": data, "timestamp": ts}
+            for id_, agent, event, data, ts in rows
         ])
     except Exception as e:
         logger.error(f"Failed to query logs: {e}", extra=get_request_log_context())
-        raise HTTPException(status_code=500, detail="Failed to fetch logs")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail="Failed to fetch logs")
+
+async def _stream_logs(stmt) -> AsyncIterator[bytes]:
+    """
+    Yield a JSON array row by row from a server-side cursor.
+
+    Opens its own session: `get_db` is torn down before the response
+    body is sent, so the injected one is already closed here.
+    """
+    yield b"["
+    try:
+        async with AsyncSessionLocal() as db:
+            result = await db.stream(stmt)
+            first = True
+            async for row in result.mappings():
+                chunk = orjson.dumps(dict(row), option=ORJSON_UTC_OPTIONS)
+                yield chunk if first else b"," + chunk
+                first = False
+    except Exception as e:
+        # Headers are already sent; close the array so clients still parse it
+        logger.error(f"Failed to stream logs: {e}")
+    yield b"]"
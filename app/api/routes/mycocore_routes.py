@@ -9,20 +9,30 @@ Features:
 - 🧩 Includes broadcast and disconnect handling
 """
 
-from fastapi import APIRouter, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi import APIRouter, HTTPException, Response, WebSocket, WebSocketDisconnect
 from pydantic import BaseModel, Field
 
-from typing import List
+from typing import List, Optional
 
-import logging, asyncio, psutil
+import logging, asyncio, psutil, time
+import orjson
+from concurrent.futures import ThreadPoolExecutor
 
 from datetime import datetime, timedelta
 
-from backend.app.core.websocket_manager import manager
+from backend.app.core.utils.websocket_manager import manager
+from backend.app.core.utils.clock import utc_now_iso
 
 router = APIRouter()
 logger = logging.getLogger("mycocore")
 
+SNAPSHOT_INTERVAL = 1.0  # seconds between background psutil samples
+LIVE_CPU_INTERVAL = 0.5  # blocking sample window for ?live=true
+
+# Dedicated pool for blocking live samples; bounds concurrency without
+# shrinking the loop's default executor used elsewhere
+_PSUTIL_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="psutil")
+
 # 🧬 Response schema for system snapshot
 class Snapshot(BaseModel):
     status: str
@@ -37,27 +47,63 @@ class SystemEvent(BaseModel):
     message: str
     timestamp: datetime = Field(default_factory=datetime.utcnow)
 
+# 📊 Background sampler — psutil runs once per interval, not per request
+_snapshot: Optional[Snapshot] = None
+_sampler_task: Optional[asyncio.Task] = None
+
+def _build_snapshot(cpu_interval: Optional[float] = None) -> Snapshot:
+    """Read host metrics; blocks for `cpu_interval` seconds when given."""
+    uptime_seconds = time.time() - psutil.boot_time()
+    return Snapshot(
+        status="ok",
+        uptime=str(timedelta(seconds=int(uptime_seconds))),
+        memory_usage=psutil.virtual_memory().percent,
+        cpu_usage=psutil.cpu_percent(interval=cpu_interval),
+        agents=["neuroweave", "rootbloom", "sporelink"]  # TODO: Replace with dynamic agent fetch
+    )
+
+async def _sample_snapshots():
+    global _snapshot
+    psutil.cpu_percent(interval=None)  # prime the delta counter
+    while True:
+        await asyncio.sleep(SNAPSHOT_INTERVAL)
+        try:
+            _snapshot = _build_snapshot()
+        except Exception as e:
+            logger.warning(f"MycoCore snapshot sample failed: {e}")
+
+async def start_snapshot_sampler():
+    global _sampler_task
+    if _sampler_task is None or _sampler_task.done():
+        _sampler_task = asyncio.create_task(_sample_snapshots())
+
+async def stop_snapshot_sampler():
+    global _sampler_task
+    if _sampler_task is not None:
+        _sampler_task.cancel()
+        try:
+            await _sampler_task
+        except asyncio.CancelledError:
+            pass
+        _sampler_task = None
+
 # 📊 Snapshot endpoint for CPU, memory, uptime, etc.
 @router.get("/mycocore/snapshot", response_model=Snapshot, tags=["mycocore"])
-async def get_mycocore_snapshot():
+async def get_mycocore_snapshot(response: Response, live: bool = False):
     """
     📊 Get system performance snapshot
 
-    Returns uptime, CPU%, memory%, and active agent list.
+    Returns uptime, CPU%, memory%, and active agent list, as last sampled
+    by the background task (at most ~1s old). `?live=true` takes a fresh
+    0.5s CPU sample in a worker thread instead.
     """
     try:
-        uptime_seconds = datetime.utcnow().timestamp() - psutil.boot_time()
-        uptime = str(timedelta(seconds=int(uptime_seconds)))
-        memory = psutil.virtual_memory().percent
-        cpu = psutil.cpu_percent(interval=0.5)
-
-        return Snapshot(
-            status="ok",
-            uptime=uptime,
-            memory_usage=memory,
-            cpu_usage=cpu,
-            agents=["neuroweave", "rootbloom", "sporelink"]  # TODO: Replace with dynamic agent fetch
-        )
+        if live:
+            response.headers["Cache-Control"] = "no-store"
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(_PSUTIL_POOL, _build_snapshot, LIVE_CPU_INTERVAL)
+        response.headers["Cache-Control"] = f"max-age={int(SNAPSHOT_INTERVAL)}"
+        return _snapshot or _build_snapshot()
     except Exception as e:
         logger.error(f"MycoCore snapshot error: {e}")
         raise HTTPException(status_code=500, detail="Unable to fetch MycoCore data.")
@@ -68,51 +114,35 @@ async def agent_log_stream(websocket: WebSocket):
     """
     🌐 WebSocket endpoint for real-time system event streaming
     """
-    await websocket.accept()
+    # Heartbeats come from the manager's shared timer, not a per-socket wait_for
+    client_id = f"mycocore:{id(websocket)}"
+    await manager.connect(websocket, client_id)
     logger.info("WebSocket connection established for /mycocore/stream")
 
     try:
-        await websocket.send_json({
+        await websocket.send_text(orjson.dumps({
             "type": "connection_established",
             "message": "Connected to MycoCore stream",
-            "timestamp": datetime.utcnow().isoformat()
-        })
+            "timestamp": utc_now_iso()
+        }).decode())
 
         while True:
-            try:
-                msg = await asyncio.wait_for(websocket.receive_text(), timeout=30)
-
-                if msg.lower() == "ping":
-                    await websocket.send_json({
-                        "type": "pong",
-                        "timestamp": datetime.utcnow().isoformat()
-                    })
-
-            except asyncio.TimeoutError:
-                # 🔁 Send heartbeat every 30s
-                await websocket.send_json({
-                    "type": "heartbeat",
-                    "timestamp": datetime.utcnow().isoformat()
-                })
+            msg = await websocket.receive_text()
+            manager.record_received(client_id)
+
+            if msg.lower() == "ping":
+                await websocket.send_text(orjson.dumps({
+                    "type": "pong",
+                    "timestamp": utc_now_iso()
+                }).decode())
 
     except WebSocketDisconnect:
         logger.info("WebSocket client disconnected from /mycocore/stream")
-        await handle_disconnect(websocket)
+        await manager.disconnect(client_id)
 
     except Exception as e:
         logger.error(f"WebSocket error: {e}")
-        await handle_disconnect(websocket)
-
-# 🔌 Disconnect handler
-async def handle_disconnect(websocket: WebSocket):
-    """
-    Handle WebSocket disconnection cleanup
-    """
-    try:
-        logger.info("Cleaning up disconnected WebSocket")
-        await websocket.close()
-    except Exception as e:
-        logger.warning(f"Error during WebSocket cleanup: {e}")
+        await manager.disconnect(client_id)
 
 # 📡 Broadcast helper
 async def broadcast_event(event: SystemEvent):
@@ -60,7 +60,7 @@ async def execute_plugin(request: PluginRequest):
 @router.post("/plugins/chain", tags=["plugins"])
 async def execute_chain(chain: PluginChain):
     """
-    🔗 Execute a chain of plugins in sequence
+    🔗 Execute a chain of independent plugins concurrently
 
     - Executes plugins via PluginChainExecutor
     - Returns individual result statuses
@@ -68,7 +68,7 @@ async def execute_chain(chain: PluginChain):
     try:
         executor = PluginChainExecutor()
         steps = [{"plugin": p.name, "input": p.input} for p in chain.plugins]
-        results = executor.run(steps)
+        results = await executor.run_parallel(steps)
         return {"status": "ok", "results": results}
     except Exception as e:
         logger.error(f"Plugin execution failed: {e}", extra=get_request_log_context())
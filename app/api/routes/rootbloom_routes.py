@@ -12,6 +12,7 @@ Features:
 
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 
 import logging
@@ -19,12 +20,13 @@ import logging
 from backend.app.core.utils.logger import get_request_log_context
 from backend.app.core.monitoring.agent_tracker import track_agent
 from backend.app.core.utils.validators import PromptRequest
-from backend.app.shared.workflows.agent_chain_executor import AGENT_REGISTRY
+from backend.app.core.registry.agents import AGENT_REGISTRY
 
 
 router = APIRouter()
 logger = logging.getLogger("rootbloom")
 
+
 class RootBloomResponse(BaseModel):
     """
     🌸 Structured response from RootBloom agent.
@@ -40,7 +42,7 @@ class RootBloomResponse(BaseModel):
 async def generate_rootbloom(input: PromptRequest):
     logger.info(f"[rootbloom] Prompt: {input.prompt}", extra=get_request_log_context())
     try:
-        result = AGENT_REGISTRY["rootbloom"].ask(input.prompt)
+        result = await AGENT_REGISTRY["rootbloom"].ask(input.prompt)
         return {"agent": "RootBloom", "response": result}
     except Exception as e:
         logger.error(f"RootBloom error: {e}", extra=get_request_log_context())
@@ -51,12 +53,15 @@ async def generate_rootbloom(input: PromptRequest):
 async def tracked_generate_rootbloom(input: PromptRequest):
     logger.info(f"[rootbloom][tracked] Prompt: {input.prompt}", extra=get_request_log_context())
     try:
-        result = AGENT_REGISTRY["rootbloom"].ask(input.prompt)
+        result = await AGENT_REGISTRY["rootbloom"].ask(input.prompt)
         return {"agent": "RootBloom", "response": result}
     except Exception as e:
         logger.error(f"RootBloom tracked error: {e}", extra=get_request_log_context())
         raise HTTPException(status_code=500, detail="Agent failed to respond")
 
+# Constant probe reply, rendered once at import
+_TEST_OK = ORJSONResponse({"status": "ok", "agent": "rootbloom"})
+
 @router.get("/rootbloom/test", tags=["rootbloom"])
 async def test_rootbloom():
-    return {"status": "ok", "agent": "rootbloom"}
\ No newline at end of file
+    return _TEST_OK
\ No newline at end of file
@@ -9,13 +9,15 @@ Features:
 - Used by agents or UI to reflect backend brain/memory state
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 import logging
+import orjson
 
 from backend.app.core.utils.logger import get_request_log_context
-from backend.app.core.memory.redis_memory_engine import RedisMemoryEngine
+from backend.app.core.utils.responses import ORJSONUTCResponse
+from backend.app.redis_client import get_redis
 
 router = APIRouter()
 logger = logging.getLogger("state")
@@ -84,31 +86,25 @@ class MemoryEntry(BaseModel):
     content: str
 
 @router.get("/state/memory/chain/{user}", response_model=List[MemoryEntry], tags=["state"])
-async def get_user_memory_chain(user: str):
+async def get_user_memory_chain(user: str, redis=Depends(get_redis)):
     """
     🧬 Visualize structured memory chain for a user.
 
-    - Returns a time-ordered list of prompt/response entries
+    - Returns a time-ordered list of prompt/response entries (Redis ZSET)
     - Each entry includes mood, agent, timestamp
     """
     try:
-        redis_engine = RedisMemoryEngine()
-        keys = redis_engine.redis.keys(f"*{user}:last_*")
+        # The chain ZSET is scored by write time, so ZRANGE is already ordered
+        raw_values = await redis.zrange(f"mem:{user}", 0, -1)
         entries = []
-
-        for key in keys:
-            raw = redis_engine.redis.get(key)
-            if raw:
-                try:
-                    parsed = json.loads(raw)
-                    if isinstance(parsed, dict):
-                        entries.append(parsed)
-                except Exception:
-                    pass
-
-        # Sort by timestamp
-        entries.sort(key=lambda x: x.get("timestamp", ""))
-        return entries
+        for raw in raw_values:
+            try:
+                entries.append(orjson.loads(raw))
+            except orjson.JSONDecodeError:
+                pass
+
+        # Entries are already plain dicts; skip response_model re-validation
+        return ORJSONUTCResponse(entries)
     except Exception as e:
         logger.error(f"Memory chain error: {e}", extra=get_request_log_context())
         raise HTTPException(status_code=500, detail="Unable to visualize memory chain")
\ No newline at end of file
@@ -9,27 +9,34 @@ Features:
 - 🧠 Integrated logging for audit visibility
 """
 
-from fastapi.responses import FileResponse
+from fastapi.responses import StreamingResponse
 from fastapi import APIRouter, HTTPException, Depends
 
 from pydantic import BaseModel
-from typing import Dict, Any
+from typing import Dict, Any, List
 
-import logging, json, tempfile
+import heapq, logging
+import orjson
 
 from backend.app.utils.pdf_exporter import PDFExporter
 from backend.app.services.dependencies import require_role
-from backend.app.agents.mycocore_agent import Mycocore
+from backend.app.agents.mycocore_agent import mycocore
 
 from backend.app.core.registry.agents import get_registered_agents
+from backend.app.core.users.roles import load_roles, set_role
 from backend.app.core.utils.logger import get_request_log_context
-from backend.app.core.cache.redis_cache import get_redis_client  # or directly use RedisMemoryEngine
-from backend.app.core.memory.redis_memory_engine import RedisMemoryEngine
+from backend.app.core.cache.redis_cache import redis_client, scan_keys
+from backend.app.core.memory.redis_memory_engine import PREFIX_COUNTS_KEY
 
 
 router = APIRouter()
 logger = logging.getLogger("system")
-core = Mycocore()
+core = mycocore
+
+# Keys fetched per MGET round-trip when bulk-reading memory
+MGET_CHUNK = 500
+# Bytes per chunk when streaming a rendered PDF
+PDF_STREAM_CHUNK = 64 * 1024
 
 # 🧠 Represents current system state snapshot
 class SystemState(BaseModel):
@@ -105,19 +112,18 @@ def toggle_safe_mode():
         core.disable_safe_mode()
 
 @router.get("/system/memory/{user}", tags=["system"])
-def view_redis_memory(user: str, actor=Depends(require_role("admin"))):
+async def view_redis_memory(user: str, actor=Depends(require_role("admin"))):
     """
     🧠 View all Redis memory for a specific user.
     Admin-only endpoint. Used for debugging and trace inspection.
     """
     try:
-        memory_engine = RedisMemoryEngine()
-        keys = memory_engine.redis.keys(f"{user}:*")
+        keys = [key async for key in scan_keys(redis_client, f"{user}:*")]
+        vals = await redis_client.mget(keys) if keys else []
         memory_dump = {}
-        for key in keys:
-            val = memory_engine.redis.get(key)
+        for key, val in zip(keys, vals):
             try:
-                memory_dump[key] = json.loads(val)
+                memory_dump[key] = orjson.loads(val)
             except Exception:
                 memory_dump[key] = val
         return memory_dump
@@ -144,18 +150,14 @@ def update_user_role(update: RoleUpdateRequest, actor=Depends(require_role("owne
     - Accepts email + new role
     - Persists to roles.json
     """
-    roles = load_roles()
-    roles[update.email] = update.role
-
     try:
-        with open(ROLES_FILE, "w") as f:
-            json.dump(roles, f, indent=2)
+        set_role(update.email, update.role)
         return {"status": "updated", "user": update.email, "role": update.role}
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Failed to update roles: {str(e)}")
     
 @router.get("/system/dashboard", tags=["system"])
-def get_dashboard_summary(actor=Depends(require_role("admin"))):
+async def get_dashboard_summary(actor=Depends(require_role("admin"))):
     """
     📊 HyphaeOS Global System Dashboard
     ------------------------------------
@@ -167,13 +169,8 @@ def get_dashboard_summary(actor=Depends(require_role("admin"))):
     - Role assignments
     """
     try:
-        redis_engine = RedisMemoryEngine()
-        keys = redis_engine.redis.keys("*")
-        key_summary = {}
-
-        for key in keys:
-            user_prefix = key.split(":")[0]
-            key_summary[user_prefix] = key_summary.get(user_prefix, 0) + 1
+        counts = await redis_client.hgetall(PREFIX_COUNTS_KEY)
+        key_summary = {prefix: int(n) for prefix, n in counts.items()}
 
         return {
             "safe_mode": not core.is_safe(),
@@ -186,38 +183,65 @@ def get_dashboard_summary(actor=Depends(require_role("admin"))):
         raise HTTPException(status_code=500, detail="Dashboard error: " + str(e))
 
 @router.get("/system/export/pdf/{user}", tags=["system"])
-def export_user_memory_pdf(user: str, actor=Depends(require_role("admin"))):
+async def export_user_memory_pdf(user: str, actor=Depends(require_role("admin"))):
     """
     🖨️ Export a user's memory chain into a structured PDF report.
     """
     try:
-        redis_engine = RedisMemoryEngine()
-        keys = redis_engine.redis.keys(f"*{user}:last_*")
-        entries = []
-
-        for key in keys:
-            raw = redis_engine.redis.get(key)
-            try:
-                data = json.loads(raw)
-                if isinstance(data, dict):
-                    entries.append(data)
-            except Exception:
-                continue
-
-        entries.sort(key=lambda x: x.get("timestamp", ""))
+        batches = await _sorted_entry_batches(f"*{user}:last_*")
 
         pdf = PDFExporter(title=f"HyphaeOS Memory Export for {user}")
         pdf.add_header()
 
-        for entry in entries:
+        for entry in heapq.merge(*batches, key=_entry_ts):
             block = (
                 f"[{entry['timestamp']}] {entry['type'].upper()} - {entry['agent']}\n"
                 f"Mood: {entry.get('mood', 'N/A')}\n\n{entry['content']}\n"
             )
             pdf.add_section(entry['type'].capitalize(), block)
 
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
-            path = pdf.generate(tmp.name)
-            return FileResponse(path, filename=f"{user}_memory_export.pdf", media_type="application/pdf")
+        return StreamingResponse(
+            _iter_chunks(pdf.to_bytes()),
+            media_type="application/pdf",
+            headers={"Content-Disposition": f'attachment; filename="{user}_memory_export.pdf"'},
+        )
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"PDF export failed: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"PDF export failed: {str(e)}")
+
+
+def _entry_ts(entry: dict) -> str:
+    return entry.get("timestamp", "")
+
+
+async def _sorted_entry_batches(pattern: str) -> List[List[dict]]:
+    """SCAN + MGET memory records in MGET_CHUNK pages, each page sorted by timestamp."""
+    batches = []
+    page = []
+    async for key in scan_keys(redis_client, pattern):
+        page.append(key)
+        if len(page) == MGET_CHUNK:
+            batches.append(await _load_sorted_page(page))
+            page = []
+    if page:
+        batches.append(await _load_sorted_page(page))
+    return batches
+
+
+async def _load_sorted_page(keys: List[str]) -> List[dict]:
+    entries = []
+    for raw in await redis_client.mget(keys):
+        try:
+            data = orjson.loads(raw)
+            if isinstance(data, dict):
+                entries.append(data)
+        except Exception:
+            continue
+    entries.sort(key=_entry_ts)
+    return entries
+
+
+def _iter_chunks(data: bytes, chunk_size: int = PDF_STREAM_CHUNK):
+    """Yield `data` in fixed-size slices without copying the whole buffer up front."""
+    view = memoryview(data)
+    for i in range(0, len(view), chunk_size):
+        yield view[i:i + chunk_size].tobytes()
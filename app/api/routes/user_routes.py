@@ -11,10 +11,11 @@ Features:
 
 from fastapi import APIRouter, HTTPException, Depends
 from fastapi.security import HTTPBearer
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from pydantic import BaseModel, EmailStr
 from typing import List, Optional
-import logging
+import logging, uuid
 
 from backend.app.services.dependencies import require_role
 from backend.app.services.database import get_db
@@ -46,31 +47,34 @@ class UserList(BaseModel):
 
 
 @router.get("/users", response_model=UserList, tags=["users"])
-async def list_users(user=Depends(require_role("admin")), db: Session = DB):
+async def list_users(user=Depends(require_role("admin")), db: AsyncSession = DB):
     """
     🔍 Get list of system users (Admin-Only)
 
     - Requires admin role via JWT
     - Returns full list of registered users
-    - Queries actual database using SQLAlchemy
+    - Queries actual database using SQLAlchemy (column projection, no ORM objects)
     """
     try:
-        users = db.query(User).all()
-        return {"users": [UserProfile(
-            id=u.id,
-            username=u.username,
-            email=u.email,
-            role=u.role,
-            verified=u.verified,
-            last_login=u.last_login.isoformat() if u.last_login else None
-        ) for u in users]}
+        rows = (await db.execute(select(
+            User.id, User.username, User.email, User.role, User.verified, User.last_login
+        ))).all()
+        # DB values are trusted, so skip per-row validation
+        return UserList.model_construct(users=[UserProfile.model_construct(
+            id=str(r.id),
+            username=r.username,
+            email=r.email,
+            role=r.role,
+            verified=r.verified,
+            last_login=r.last_login.isoformat() if r.last_login else None
+        ) for r in rows])
     except Exception as e:
         logger.error(f"Failed to list users: {e}", extra=get_request_log_context())
         raise HTTPException(status_code=500, detail="Failed to fetch users")
 
 
 @router.get("/users/{user_id}", response_model=UserProfile, tags=["users"])
-async def get_user(user_id: str, requester=Depends(security), db: Session = DB):
+async def get_user(user_id: str, requester=Depends(security), db: AsyncSession = DB):
     """
     🧑‍💼 Retrieve a user profile by ID
 
@@ -86,13 +90,16 @@ async def get_user(user_id: str, requester=Depends(security), db: Session = DB):
         raise HTTPException(status_code=403, detail="Access denied")
 
     try:
-        user = db.query(User).filter(User.id == user_id).first()
+        try:
+            user = await db.scalar(select(User).where(User.id == uuid.UUID(user_id)))
+        except ValueError:
+            user = None  # not a UUID, so no such user
 
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
 
         return UserProfile(
-            id=user.id,
+            id=str(user.id),
             username=user.username,
             email=user.email,
             role=user.role,
@@ -100,6 +107,8 @@ async def get_user(user_id: str, requester=Depends(security), db: Session = DB):
             last_login=user.last_login.isoformat() if user.last_login else None
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to get user {user_id}: {e}", extra=get_request_log_context())
         raise HTTPException(status_code=500, detail="Failed to fetch user")
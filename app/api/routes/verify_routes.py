@@ -12,13 +12,15 @@ Features:
 
 
 from fastapi import APIRouter, HTTPException, Request, Depends
-from fastapi.security import HTTPBeare
+from fastapi.security import HTTPBearer
 from pydantic import BaseModel
 import pyotp, time, secrets, logging
 from typing import Optional
-from sqlalchemy.orm import Session
-from back
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from backend.app.api.models.user_model import User
+from backend.app.core.cache.redis_cache import redis_client
 from backend.app.services.database import get_db
 from backend.app.services.token_service import verify_token
 
@@ -26,15 +28,26 @@ router = APIRouter()
 logger = logging.getLogger("verify")
 security = HTTPBearer()
 
-# 💥 Brute force lockout check
-key = f"verify:lockout:{user_id}"
-attempts_key = f"verify:attempts:{user_id}"
-if redis_client.get(key):
-    raise HTTPException(status_code=429, detail="Too many attempts. Try again later.")
-
 # Constants for brute force mitigation
 MAX_ATTEMPTS = 5
 LOCKOUT_DURATION = 600  # 10 minutes
+LOCKED_OUT = -1
+
+# ⚛️ Lockout check + attempt bookkeeping in one atomic round-trip
+# KEYS: lockout, attempts | ARGV: max attempts, ttl, success (1/0)
+_VERIFY_ATTEMPT_LUA = """
+if redis.call('GET', KEYS[1]) then return -1 end
+if ARGV[3] == '1' then
+    redis.call('DEL', KEYS[1], KEYS[2])
+    return 0
+end
+local n = redis.call('INCR', KEYS[2])
+if n == 1 then redis.call('EXPIRE', KEYS[2], ARGV[2]) end
+if n >= tonumber(ARGV[1]) then redis.call('SET', KEYS[1], '1', 'EX', ARGV[2]) end
+return n
+"""
+# Sent via EVALSHA; the script is (re)loaded automatically on NOSCRIPT
+record_verify_attempt = redis_client.register_script(_VERIFY_ATTEMPT_LUA)
 
 # 🔢 Verification input payload
 class VerifyRequest(BaseModel):
@@ -47,7 +60,7 @@ class VerifyResponse(BaseModel):
     message: Optional[str] = None
 
 @router.post("/verify", response_model=VerifyResponse, tags=["verify"])
-async def verify_code(request: VerifyRequest, token=Depends(security), db: Session = Depends(get_db)):
+async def verify_code(request: VerifyRequest, token=Depends(security), db: AsyncSession = Depends(get_db)):
     """
     🔐 Verify a 6-digit PIN or TOTP code.
 
@@ -60,17 +73,17 @@ async def verify_code(request: VerifyRequest, token=Depends(security), db: Sessi
             raise HTTPException(status_code=400, detail="Invalid code format")
 
         payload = verify_token(token.credentials)
-        user_id = payload.get("sub")
-        user = db.query(User).filter(User.id == user_id).first()
+        if not payload:
+            raise HTTPException(status_code=401, detail="Invalid or expired token")
+        # Access tokens carry the username as `sub` (see auth_routes.login)
+        username = payload.get("sub")
+        user = await db.scalar(select(User).where(User.username == username))
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
 
         # 💥 Redis brute-force protection
-        key = f"verify:lockout:{user_id}"
-        attempts_key = f"verify:attempts:{user_id}"
-
-        if redis_client.get(key):
-            raise HTTPException(status_code=429, detail="Too many attempts. Try again later.")
+        key = f"verify:lockout:{username}"
+        attempts_key = f"verify:attempts:{username}"
 
         # 🔑 Actual verification
         if request.type == "pin":
@@ -83,35 +96,36 @@ async def verify_code(request: VerifyRequest, token=Depends(security), db: Sessi
         else:
             raise HTTPException(status_code=400, detail="Invalid verification type")
 
-        # 🧠 Redis tracking
-        if success:
-            redis_client.delete(attempts_key)
-            redis_client.delete(key)
-        else:
-            attempts = redis_client.incr(attempts_key)
-            if attempts == 1:
-                redis_client.expire(attempts_key, LOCKOUT_DURATION)
-            if attempts >= MAX_ATTEMPTS:
-                redis_client.set(key, "1", ex=LOCKOUT_DURATION)
+        # 🧠 Redis tracking (lockout is checked atomically with the attempt)
+        attempts = await record_verify_attempt(
+            keys=[key, attempts_key],
+            args=[MAX_ATTEMPTS, LOCKOUT_DURATION, int(success)],
+        )
+        if attempts == LOCKED_OUT:
+            raise HTTPException(status_code=429, detail="Too many attempts. Try again later.")
 
-        logger.info(f"[verify] user={user_id} success={success}")
+        logger.info(f"[verify] user={username} success={success}")
         return VerifyResponse(
             success=success,
             message="Verification successful" if success else "Invalid code"
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Verification failed: {e}")
         raise HTTPException(status_code=500, detail="Verification failed")
     
 @router.post("/verify/setup", tags=["verify"])
-async def setup_verification(token=Depends(security), db: Session = Depends(get_db)):
+async def setup_verification(token=Depends(security), db: AsyncSession = Depends(get_db)):
     """
     🧪 Setup new TOTP secret for a user and return the URI.
     """
     try:
         payload = verify_token(token.credentials)
-        user_id = payload.get("sub")
+        if not payload:
+            raise HTTPException(status_code=401, detail="Invalid or expired token")
+        username = payload.get("sub")
 
         secret = pyotp.random_base32()
         uri = pyotp.totp.TOTP(secret).provisioning_uri(
@@ -119,16 +133,18 @@ async def setup_verification(token=Depends(security), db: Session = Depends(get_
             issuer_name="HyphaeOS"
         )
 
-        user = db.query(User).filter(User.id == user_id).first()
+        user = await db.scalar(select(User).where(User.username == username))
         if not user:
             raise HTTPException(status_code=404, detail="User not found")
 
         user.totp_secret = secret
-        db.commit()
+        await db.commit()
 
-        logger.info(f"TOTP secret set for user {user_id}")
+        logger.info(f"TOTP secret set for user {username}")
         return {"secret": secret, "uri": uri}
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"TOTP setup failed: {e}")
         raise HTTPException(status_code=500, detail="Failed to setup verification")
\ No newline at end of file
@@ -1,11 +1,33 @@
-import os
-from openai import OpenAI
+import asyncio
+import httpx
+from openai import AsyncOpenAI
 from shared.config.env_loader import get_env_variable, is_test_env
 
+# One client per worker: every agent shares the same HTTP/2 keep-alive pool,
+# so TLS handshakes are amortized and concurrent requests multiplex.
+_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+
+
+def _build_shared_client():
+    if is_test_env():
+        return None
+    try:
+        return AsyncOpenAI(
+            api_key=get_env_variable("OPENAI_API_KEY", optional=False),
+            http_client=httpx.AsyncClient(http2=True, limits=_HTTP_LIMITS),
+        )
+    except Exception as e:
+        print(f"❌ Shared OpenAI client init failed: {e}")
+        return None
+
+
+_SHARED_CLIENT = _build_shared_client()
+
+
 class GPTClient:
     def __init__(self, agent="HyphaeOS", model="gpt-4"):
         """
-        Initializes the GPT client with the appropriate API key and model.
+        Binds an agent name and model to the shared OpenAI client.
 
         Args:
             agent (str): Logical agent name (used in logs)
@@ -14,20 +36,12 @@ class GPTClient:
         self.agent_name = agent
         self.model = model
         self.test_mode = is_test_env()
+        self.client = _SHARED_CLIENT
 
         if self.test_mode:
             print(f"⚠️ GPTClient initialized in test mode for {agent}")
-            self.api_key = "test-key"
-            self.client = None
-        else:
-            try:
-                self.api_key = get_env_variable("OPENAI_API_KEY", optional=False)
-                self.client = OpenAI(api_key=self.api_key)
-            except Exception as e:
-                print(f"❌ GPTClient init failed: {e}")
-                self.client = None
-
-    def ask(self, prompt, temperature=0.7, system_message=None, max_tokens=500):
+
+    async def ask(self, prompt, temperature=0.7, system_message=None, max_tokens=500, prompt_cache_key=None):
         """
         Sends a prompt to OpenAI (or returns fallback in test mode).
 
@@ -36,6 +50,7 @@ class GPTClient:
             temperature (float): Creativity level
             system_message (str): Optional system prompt
             max_tokens (int): Max output tokens
+            prompt_cache_key (str): Optional routing key for provider prompt caching
 
         Returns:
             str or None: Response string
@@ -48,14 +63,36 @@ class GPTClient:
             messages.append({"role": "system", "content": system_message})
         messages.append({"role": "user", "content": prompt})
 
+        extra_body = {"prompt_cache_key": prompt_cache_key} if prompt_cache_key else None
+
         try:
-            response = self.client.chat.completions.create(
+            response = await self.client.chat.completions.create(
                 model=self.model,
                 messages=messages,
                 temperature=temperature,
                 max_tokens=max_tokens,
+                extra_body=extra_body,
             )
             return response.choices[0].message.content.strip()
         except Exception as e:
             print(f"❌ GPTClient[{self.agent_name}] failed: {e}")
-            return None
\ No newline at end of file
+            return None
+
+    async def ask_batch(self, prompts, temperature=0.7, system_message=None, max_tokens=500, prompt_cache_key=None):
+        """
+        Sends several prompts concurrently over the shared HTTP/2 pool.
+
+        Args:
+            prompts (list[str]): User messages
+            temperature (float): Creativity level
+            system_message (str): Optional system prompt shared by the batch
+            max_tokens (int): Max output tokens
+            prompt_cache_key (str): Optional routing key for provider prompt caching
+
+        Returns:
+            list[str or None]: Responses, in the same order as `prompts`
+        """
+        return list(await asyncio.gather(*(
+            self.ask(prompt, temperature, system_message, max_tokens, prompt_cache_key)
+            for prompt in prompts
+        )))
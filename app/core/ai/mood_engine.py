@@ -1,3 +1,46 @@
+try:
+    import ahocorasick
+except ImportError:  # Optional accelerator; falls back to substring scans
+    ahocorasick = None
+
+# Static system prompts, one per mood bucket. Keeping these immutable lets
+# the provider serve the shared prefix from its prompt cache.
+MOOD_SYSTEM = {
+    "neutral": None,
+    "sad": "Respond with compassion and softness.",
+    "frustrated": "Respond with patience and clarity.",
+    "happy": "Respond positively and warmly.",
+    "excited": "Respond with enthusiasm and energy.",
+}
+
+# Keyword lexicon in priority order — the first mood with a hit wins.
+# Built once at import so detection does no per-call list/generator setup.
+MOOD_LEXICON = (
+    ("sad", ("sad", "tired", "depressed", "down")),
+    ("frustrated", ("angry", "frustrated", "annoyed", "stuck")),
+    ("happy", ("yay", "awesome", "great", "happy")),
+    ("excited", ("let's go", "ready", "hype", "excited")),
+)
+
+
+def _build_mood_automaton():
+    """Compile every lexicon keyword into one Aho-Corasick automaton.
+
+    Each keyword maps to its mood's priority index, so a single pass over
+    the prompt finds all hits regardless of lexicon size.
+    """
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for priority, (_, keywords) in enumerate(MOOD_LEXICON):
+        for word in keywords:
+            automaton.add_word(word, priority)
+    automaton.make_automaton()
+    return automaton
+
+
+_MOOD_AUTOMATON = _build_mood_automaton()
+
 def detect_mood(input_text: str) -> str:
     """
     Analyze the input and return a simplified mood.
@@ -10,17 +53,21 @@ def detect_mood(input_text: str) -> str:
     """
     text = input_text.lower()
 
+    if _MOOD_AUTOMATON is not None:
+        best = len(MOOD_LEXICON)
+        for _, priority in _MOOD_AUTOMATON.iter(text):
+            if priority < best:
+                best = priority
+                if best == 0:
+                    break
+        return MOOD_LEXICON[best][0] if best < len(MOOD_LEXICON) else "neutral"
+
     # Basic keyword mapping — replace with ML later
-    if any(word in text for word in ["sad", "tired", "depressed", "down"]):
-        return "sad"
-    elif any(word in text for word in ["angry", "frustrated", "annoyed", "stuck"]):
-        return "frustrated"
-    elif any(word in text for word in ["yay", "awesome", "great", "happy"]):
-        return "happy"
-    elif any(word in text for word in ["let's go", "ready", "hype", "excited"]):
-        return "excited"
-    else:
-        return "neutral"
+    for mood, keywords in MOOD_LEXICON:
+        for word in keywords:
+            if word in text:
+                return mood
+    return "neutral"
 
 def mood_wrapped_prompt(prompt: str, mood: str) -> str:
     """
@@ -41,4 +88,16 @@ def mood_wrapped_prompt(prompt: str, mood: str) -> str:
         return f"Respond positively and warmly: {prompt}"
     elif mood == "excited":
         return f"Respond with enthusiasm and energy: {prompt}"
-    return prompt
\ No newline at end of file
+    return prompt
+
+def mood_system_prompt(mood: str):
+    """
+    Return the static system prompt for a mood bucket.
+
+    Args:
+        mood (str): Detected mood
+
+    Returns:
+        str or None: System prompt, or None for neutral/unknown moods
+    """
+    return MOOD_SYSTEM.get(mood)
@@ -9,6 +9,8 @@ Use:
 - Add persistence, memory, logging, etc. hooks
 """
 
+import asyncio
+import inspect
 from abc import ABC, abstractmethod
 from typing import List, Dict, Any
 
@@ -22,6 +24,13 @@ class BaseChainExecutor(ABC):
         """Override: Logic for one step in the chain"""
         pass
 
+    async def execute_step_async(self, step: Dict[str, Any]) -> Dict[str, Any]:
+        """Awaitable `execute_step`; override to offload blocking steps."""
+        result = self.execute_step(step)
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
     def run(self, chain: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Executes a sequence of steps using the `execute_step` logic.
@@ -31,14 +40,72 @@ class BaseChainExecutor(ABC):
 
         Returns:
             list: Result history
+
+        Raises:
+            TypeError: if `execute_step` is async (use `run_async` instead)
         """
-        for step in chain:
+        out: List[Dict[str, Any]] = [None] * len(chain)
+        for i, step in enumerate(chain):
             try:
                 result = self.execute_step(step)
-                self.history.append(result)
             except Exception as e:
-                self.history.append({
+                out[i] = {
                     "step": step,
                     "error": str(e)
-                })
+                }
+                continue
+            if inspect.isawaitable(result):
+                if inspect.iscoroutine(result):
+                    result.close()  # never awaited; close it to skip the warning
+                raise TypeError(
+                    f"{type(self).__name__}.execute_step is async; use run_async() or run_parallel()"
+                )
+            out[i] = result
+        self.history.extend(out)
+        return self.history
+
+    async def run_async(self, chain: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Async `run`: awaits `execute_step` when it is a coroutine.
+
+        Args:
+            chain (list): List of steps (agent or plugin)
+
+        Returns:
+            list: Result history
+        """
+        out: List[Dict[str, Any]] = [None] * len(chain)
+        for i, step in enumerate(chain):
+            try:
+                result = self.execute_step(step)
+                if inspect.isawaitable(result):
+                    result = await result
+                out[i] = result
+            except Exception as e:
+                out[i] = {
+                    "step": step,
+                    "error": str(e)
+                }
+        self.history.extend(out)
+        return self.history
+
+    async def run_parallel(self, chain: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Runs every step concurrently; results keep the chain's order.
+        Only for chains whose steps don't depend on each other.
+
+        Args:
+            chain (list): List of steps (agent or plugin)
+
+        Returns:
+            list: Result history
+        """
+        results = await asyncio.gather(
+            *(self.execute_step_async(step) for step in chain),
+            return_exceptions=True
+        )
+        self.history.extend(
+            {"step": step, "error": str(result)} if isinstance(result, Exception) else result
+            for step, result in zip(chain, results)
+        )
         return self.history
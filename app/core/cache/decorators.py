@@ -15,13 +15,13 @@ def cached(expire: int = 3600):
             key = hashlib.md5(json.dumps(key_parts).encode()).hexdigest()
 
             # Try to get from cache
-            result = cache.get(key)
+            result = await cache.get(key)
             if result is not None:
                 return result
 
             # Execute function and cache result
             result = await func(*args, **kwargs)
-            cache.set(key, result, expire)
+            await cache.set(key, result, expire)
             return result
         return wrapper
     return decorator
\ No newline at end of file
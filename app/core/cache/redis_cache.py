@@ -1,37 +1,50 @@
-import aioredis
-from typing import Any, Optional
-from shared.config.env_loader import get_env_variable
+import orjson
+import logging
+from typing import Any, AsyncIterator, Optional
 
-REDIS_URL = get_env_variable("REDIS_URL", "redis://localhost:6379")
+# One bounded async pool per process, shared with `get_redis` routes, the
+# rate limiter and the verify scripts (see backend.app.redis_client)
+from backend.app.redis_client import async_pool as pool, async_bytes_pool, redis_async_client as redis_client
 
-pool = redis.ConnectionPool.from_url(
-    REDIS_URL,
-    max_connections=10,
-    decode_responses=True
-)
+logger = logging.getLogger(__name__)
 
-redis_client = redis.Redis(connection_pool=pool)
+
+async def scan_keys(r, pattern: str, count: int = 1000) -> AsyncIterator[str]:
+    """Yield keys matching `pattern` via cursor-based SCAN (never blocks Redis like KEYS)."""
+    cursor = 0
+    while True:
+        cursor, batch = await r.scan(cursor=cursor, match=pattern, count=count)
+        for key in batch:
+            yield key
+        if cursor == 0:
+            break
 
 
 class RedisCache:
     def __init__(self):
-        self.redis = redis.Redis(connection_pool=pool)
+        self.redis = redis_client
 
-    def get(self, key: str) -> Optional[Any]:
+    async def get(self, key: str) -> Optional[Any]:
         try:
             value = await self.redis.get(key)
-            return json.loads(value) if value else None
+            if not value:
+                return None
+            try:
+                return orjson.loads(value)
+            except orjson.JSONDecodeError:
+                return value
         except Exception as e:
             logger.error(f"Redis get error: {e}")
             return None
 
-    def set(self, key: str, value: Any, expire: int = 3600):
+    async def set(self, key: str, value: Any, expire: int = 3600):
         try:
-            self.redis.setex(key, expire, json.dumps(value))
+            payload = value if isinstance(value, (str, bytes)) else orjson.dumps(value)
+            await self.redis.setex(key, expire, payload)
         except Exception as e:
             logger.error(f"Redis set error: {e}")
 
-    def delete(self, key: str):
+    async def delete(self, key: str):
         try:
             await self.redis.delete(key)
         except Exception as e:
@@ -39,4 +52,9 @@ class RedisCache:
 
 
 cache = RedisCache()
-is sq2l
\ No newline at end of file
+
+
+async def close_pool():
+    """Release pooled connections on shutdown."""
+    await pool.disconnect()
+    await async_bytes_pool.disconnect()
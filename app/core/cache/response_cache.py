@@ -0,0 +1,169 @@
+"""ResponseCache 🧊
+────────────────────────────────────────────
+Two-tier cache for LLM replies, checked before any GPT round-trip.
+
+Tiers:
+- L1: in-process LRU keyed by SHA256(agent|normalized prompt)
+- L2: Redis (`llm:{agent}:{key}`) shared across workers, TTL-bound,
+  values msgpack-encoded (needs an asyncio bytes client, not decode_responses)
+- Semantic fallback: cosine similarity over recent prompt embeddings
+  (only when `sentence-transformers` + `faiss` are installed); model load,
+  encode and index search run in worker threads, never on the event loop
+"""
+
+import asyncio
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+import msgpack
+
+try:
+    import numpy as np
+    import faiss
+    from sentence_transformers import SentenceTransformer
+except ImportError:  # Semantic tier is optional
+    np = faiss = SentenceTransformer = None
+
+from backend.app.core.utils.ai_helpers import normalize_prompt
+
+logger = logging.getLogger(__name__)
+
+L1_MAX_ENTRIES = 1024
+L2_TTL_SECONDS = 3600
+SEMANTIC_THRESHOLD = 0.95
+SEMANTIC_MAX_ENTRIES = 2048
+EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+
+
+class ResponseCache:
+    """Exact-match + semantic reply cache for a single agent.
+
+    Attributes:
+        agent (str): Agent name used to namespace keys
+        redis: Optional bytes-mode `redis.asyncio` client for the shared L2 tier
+    """
+
+    _encoder = None
+    _encoder_lock = threading.Lock()
+
+    def __init__(self, agent: str, redis=None):
+        self.agent = agent
+        self.redis = redis
+        self._l1: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._index = None
+        self._replies: list = []
+
+    # === Keys ===
+
+    def make_key(self, prompt: str) -> str:
+        """Build the exact-match key for a prompt (case/whitespace-insensitive)."""
+        return hashlib.sha256(self.agent.encode() + b"|" + normalize_prompt(prompt)).hexdigest()
+
+    def _redis_key(self, key: str) -> str:
+        return f"llm:{self.agent}:{key}"
+
+    # === Lookup ===
+
+    async def get(self, prompt: str) -> Optional[str]:
+        """Return a cached reply for `prompt`, or None on a full miss."""
+        key = self.make_key(prompt)
+
+        with self._lock:
+            reply = self._l1.get(key)
+            if reply is not None:
+                self._l1.move_to_end(key)
+                return reply
+
+        if self.redis is not None:
+            try:
+                raw = await self.redis.get(self._redis_key(key))
+                reply = msgpack.unpackb(raw, raw=False) if raw is not None else None
+            except Exception as e:
+                logger.warning(f"[{self.agent}] Response cache L2 get failed: {e}")
+                reply = None
+            if reply is not None:
+                self._remember(key, reply)
+                return reply
+
+        if self._index is None or SentenceTransformer is None:
+            return None
+        return await asyncio.to_thread(self._semantic_get, prompt)
+
+    # === Store ===
+
+    async def set(self, prompt: str, reply: str):
+        """Store a reply in every available tier."""
+        if reply is None:
+            return
+        key = self.make_key(prompt)
+        self._remember(key, reply)
+
+        if self.redis is not None:
+            try:
+                await self.redis.setex(self._redis_key(key), L2_TTL_SECONDS,
+                                       msgpack.packb(reply, use_bin_type=True))
+            except Exception as e:
+                logger.warning(f"[{self.agent}] Response cache L2 set failed: {e}")
+
+        if SentenceTransformer is not None:
+            await asyncio.to_thread(self._semantic_add, prompt, reply)
+
+    def _remember(self, key: str, reply: str):
+        with self._lock:
+            self._l1[key] = reply
+            self._l1.move_to_end(key)
+            if len(self._l1) > L1_MAX_ENTRIES:
+                self._l1.popitem(last=False)
+
+    # === Semantic tier (sync; called via asyncio.to_thread) ===
+
+    @classmethod
+    def _get_encoder(cls):
+        if SentenceTransformer is None:
+            return None
+        with cls._encoder_lock:
+            if cls._encoder is None:
+                cls._encoder = SentenceTransformer(EMBEDDING_MODEL)
+            return cls._encoder
+
+    def _embed(self, prompt: str):
+        encoder = self._get_encoder()
+        if encoder is None:
+            return None
+        vec = encoder.encode([normalize_prompt(prompt).decode()], normalize_embeddings=True)
+        return np.asarray(vec, dtype="float32")
+
+    def _semantic_get(self, prompt: str) -> Optional[str]:
+        if self._index is None or self._index.ntotal == 0:
+            return None
+        vec = self._embed(prompt)
+        if vec is None:
+            return None
+        with self._lock:
+            scores, ids = self._index.search(vec, 1)
+            if ids[0][0] >= 0 and scores[0][0] >= SEMANTIC_THRESHOLD:
+                return self._replies[ids[0][0]]
+        return None
+
+    def _semantic_add(self, prompt: str, reply: str):
+        vec = self._embed(prompt)
+        if vec is None:
+            return
+        with self._lock:
+            if self._index is None or self._index.ntotal >= SEMANTIC_MAX_ENTRIES:
+                # Flat index has no deletes; start a fresh window when full
+                self._index = faiss.IndexFlatIP(vec.shape[1])
+                self._replies = []
+            self._index.add(vec)
+            self._replies.append(reply)
+
+    def clear(self):
+        """Drop the in-process tiers (L2 entries expire via TTL)."""
+        with self._lock:
+            self._l1.clear()
+            self._index = None
+            self._replies = []
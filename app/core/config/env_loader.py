@@ -1,14 +1,18 @@
 import os
+from functools import lru_cache
 from dotenv import load_dotenv
 
 # Load .env file into environment automatically (if it exists in project root)
 load_dotenv()
 
+@lru_cache(maxsize=256)
 def get_env_variable(key: str, default=None, optional=True):
     """
     get_env_variable() 🔍
 
     Attempts to load an environment variable from the system or `.env` file.
+    Results are memoized per (key, default, optional); call
+    `get_env_variable.cache_clear()` after changing the environment at runtime.
 
     Args:
         key (str): The name of the environment variable.
@@ -5,33 +5,29 @@ Handles agent and plugin chain execution via shared base executor.
 Includes agent registry, plugin resolver, and safety logic.
 """
 
+import asyncio
+
 from shared.state.session_manager import session
-from backend.app.agents.mycocore_agent import Mycocore
-from backend.app.agents.core.base_chain_executor import BaseChainExecutor
+from backend.app.agents.mycocore_agent import mycocore
+from backend.app.core.base_chain_executor import BaseChainExecutor
 from backend.app.core.plugins.plugin_executor import execute_plugin
 
-# ⬇️ Consolidated Agent Registry (No separate registry.py)
-from backend.agents.neuroweave_agent import NeuroweaveAgent
-from backend.agents.sporelink_agent import SporelinkAgent
-from backend.agents.rootbloom_agent import RootbloomAgent
-
-AGENT_REGISTRY = {
-    "neuroweave": NeuroweaveAgent(),
-    "rootbloom": RootbloomAgent(),
-    "sporelink": SporelinkAgent(),
-}
+# ⬇️ Shared agent singletons (built once per worker, on first use)
+from backend.app.core.registry.agents import get_agent
 
 
 class AgentChainExecutor(BaseChainExecutor):
     """
     AgentChainExecutor 🧠
     Executes a sequence of prompts across registered agents.
+    Steps await the agents' async `ask`; drive it with `run_async`
+    or, for independent prompts, `run_parallel`.
     """
     def __init__(self):
         super().__init__()
-        self.core = Mycocore()
+        self.core = mycocore
 
-    def execute_step(self, step: dict) -> dict:
+    async def execute_step(self, step: dict) -> dict:
         if not self.core.is_safe():
             return {
                 "agent": "mycocore",
@@ -41,7 +37,7 @@ class AgentChainExecutor(BaseChainExecutor):
 
         agent_name = step.get("agent")
         prompt = step.get("prompt")
-        agent = AGENT_REGISTRY.get(agent_name.lower())
+        agent = get_agent(agent_name)
 
         if not agent:
             return {
@@ -51,7 +47,7 @@ class AgentChainExecutor(BaseChainExecutor):
             }
 
         try:
-            output = agent.ask(prompt)
+            output = await agent.ask(prompt)
             return {
                 "agent": agent.name,
                 "input": prompt,
@@ -68,7 +64,8 @@ class AgentChainExecutor(BaseChainExecutor):
 class PluginChainExecutor(BaseChainExecutor):
     """
     PluginChainExecutor 🔌
-    Handles execution of plugin chains (plugin steps in order).
+    Handles execution of plugin chains (plugin steps in order, or
+    concurrently in worker threads via `run_parallel`).
     """
     def execute_step(self, step: dict) -> dict:
         plugin_name = step.get("plugin")
@@ -77,4 +74,8 @@ class PluginChainExecutor(BaseChainExecutor):
 
         # Optionally store in session memory
         session.get_memory()["last_plugin_chain"] = result
-        return result
\ No newline at end of file
+        return result
+
+    async def execute_step_async(self, step: dict) -> dict:
+        # Plugins are plain sync callables; keep them off the event loop
+        return await asyncio.to_thread(self.execute_step, step)
\ No newline at end of file
@@ -1,17 +1,21 @@
+from datetime import datetime
+
 from shared.memory.in_memory_engine import InMemoryEngine
 from shared.memory.file_memory_engine import FileMemoryEngine
 from shared.state.session_manager import session
+from backend.app.core.memory.redis_memory_engine import RedisMemoryEngine, redis_memory
 
 class MemoryRouter:
     """
     Central abstraction for memory. Supports:
     - Plaintext SQL
     - Encrypted SQL
+    - Redis (plaintext records are also appended to a per-user chain ZSET)
     """
     def __init__(self, mode="sql", encrypt=True):
         if mode == "redis":
-            engine = RedisMemoryEngine()
-        if mode == "sql":
+            engine = redis_memory
+        elif mode == "sql":
             from shared.memory.sql_memory_engine import SQLMemoryEngine
             engine = SQLMemoryEngine()
         else:
@@ -21,30 +25,61 @@ class MemoryRouter:
             self.engine = EncryptedMemoryEngine(engine)
         else:
             self.engine = engine
+        # Only plaintext Redis feeds the chain; encrypted values stay opaque
+        self.chain = engine if isinstance(engine, RedisMemoryEngine) and not encrypt else None
         self.user = session.get_user_name()
     def save(self, key, value):
         return self.engine.save(self.user, key, value)
+    def save_many(self, pairs):
+        """Save (key, value) pairs together; pipelined when the engine supports it."""
+        if hasattr(self.engine, "save_many"):
+            return self.engine.save_many(self.user, pairs)
+        for key, value in pairs:
+            self.engine.save(self.user, key, value)
     def fetch(self, key):
         return self.engine.fetch(self.user, key)
     def clear(self):
         self.engine.clear(self.user)
-    def store_interaction(self, agent: str, user: str, prompt: str, mood: str):
-    record = {
-        "type": "prompt",
-        "agent": agent,
-        "user": user,
-        "mood": mood,
-        "timestamp": datetime.now().isoformat(),
-        "content": prompt
-    }
-    self.save(f"{agent}:{user}:last_prompt", record)
+    @staticmethod
+    def _prompt_record(agent: str, user: str, prompt: str, mood: str) -> dict:
+        return {
+            "type": "prompt",
+            "agent": agent,
+            "user": user,
+            "mood": mood,
+            "timestamp": datetime.now().isoformat(),
+            "content": prompt
+        }
 
-    def store_response(self, agent: str, user: str, response: str):
-        record = {
+    @staticmethod
+    def _response_record(agent: str, user: str, response: str) -> dict:
+        return {
             "type": "response",
             "agent": agent,
             "user": user,
             "timestamp": datetime.now().isoformat(),
             "content": response
         }
+
+    def store_interaction(self, agent: str, user: str, prompt: str, mood: str):
+        record = self._prompt_record(agent, user, prompt, mood)
+        self.save(f"{agent}:{user}:last_prompt", record)
+        if self.chain is not None:
+            self.chain.append_chain(user, record)
+
+    def store_response(self, agent: str, user: str, response: str):
+        record = self._response_record(agent, user, response)
         self.save(f"{agent}:{user}:last_response", record)
+        if self.chain is not None:
+            self.chain.append_chain(user, record)
+
+    def store_exchange(self, agent: str, user: str, prompt: str, mood: str, response: str):
+        """store_interaction + store_response in one batched write."""
+        prompt_record = self._prompt_record(agent, user, prompt, mood)
+        response_record = self._response_record(agent, user, response)
+        self.save_many([
+            (f"{agent}:{user}:last_prompt", prompt_record),
+            (f"{agent}:{user}:last_response", response_record),
+        ])
+        if self.chain is not None:
+            self.chain.append_chain(user, prompt_record, response_record)
@@ -1,19 +1,167 @@
 import redis
-import json
+import orjson
+import secrets
+import time
+from itertools import islice
+
+# Per-user chain of prompt/response records, scored by epoch-ns timestamp
+CHAIN_KEY = "mem:{user}"
+CHAIN_MAX_ENTRIES = 1000
+
+# Per-user memory key counts, kept in step with save/clear for the dashboard
+PREFIX_COUNTS_KEY = "dashboard:prefix_counts"
+
+# Backfill state: "done" once pre-existing keys are counted, else a run's
+# token (with a TTL, so a crashed run can be retried) or missing
+PREFIX_COUNTS_BACKFILL_KEY = "dashboard:prefix_counts:backfill"
+# Until the backfill is done: keys created since deploy (already counted
+# live, so the SCAN must skip them) and users cleared (their scanned
+# totals are stale)
+PREFIX_COUNTS_NEW_KEYS = "dashboard:prefix_counts:new_keys"
+PREFIX_COUNTS_CLEARED = "dashboard:prefix_counts:cleared"
+BACKFILL_LOCK_TTL = 300
+
+# Prefixes owned by caches, rate limiters, lockouts and chains, not the memory engine
+_NON_MEMORY_PREFIXES = frozenset({"agent", "dashboard", "ip", "llm", "login", "mem",
+                                  "ratelimit", "user", "verify"})
+
+# Keys per UNLINK call when clearing a user's memory (and per SCAN batch in the backfill)
+UNLINK_BATCH = 500
+
+# SET the value, bumping the owner's count only when the key is new
+_SAVE_LUA = """
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    redis.call('HINCRBY', KEYS[2], ARGV[2], 1)
+    if redis.call('GET', KEYS[3]) ~= 'done' then
+        redis.call('SADD', KEYS[4], KEYS[1])
+    end
+end
+return redis.call('SET', KEYS[1], ARGV[1])
+"""
+_SAVE_KEYS = (PREFIX_COUNTS_KEY, PREFIX_COUNTS_BACKFILL_KEY, PREFIX_COUNTS_NEW_KEYS)
+
+# Drop the user's count, remembering the clear while a backfill may still merge
+_CLEAR_COUNT_LUA = """
+redis.call('HDEL', KEYS[1], ARGV[1])
+if redis.call('GET', KEYS[2]) ~= 'done' then
+    redis.call('SADD', KEYS[3], ARGV[1])
+end
+"""
+
+# Add the scanned totals on top of the live counts and mark the backfill
+# done, atomically, and only if this run still holds the lock
+_MERGE_BACKFILL_LUA = """
+if redis.call('GET', KEYS[2]) ~= ARGV[1] then
+    return -1
+end
+for i = 2, #ARGV, 2 do
+    if redis.call('SISMEMBER', KEYS[4], ARGV[i]) == 0 then
+        redis.call('HINCRBY', KEYS[1], ARGV[i], ARGV[i + 1])
+    end
+end
+redis.call('SET', KEYS[2], 'done')
+redis.call('DEL', KEYS[3], KEYS[4])
+return 1
+"""
+
+REDIS_HOST = 'localhost'
+REDIS_PORT = 6379
+
+# Process-wide pool shared by every engine on the default server
+_pool = redis.ConnectionPool(host=REDIS_HOST, port=REDIS_PORT, db=0,
+                             decode_responses=True, max_connections=50)
+
+def _encode(value):
+    # Strings/bytes are stored as-is (like SQLMemoryEngine); everything else as JSON
+    return value if isinstance(value, (str, bytes)) else orjson.dumps(value)
+
+def _decode(val):
+    if not val:
+        return None
+    try:
+        return orjson.loads(val)
+    except orjson.JSONDecodeError:
+        return val
 
 class RedisMemoryEngine:
-    def __init__(self, host='localhost', port=6379, db=0):
-        self.redis = redis.Redis(host=host, port=port, db=db, decode_responses=True)
+    def __init__(self, host=REDIS_HOST, port=REDIS_PORT, db=0):
+        if (host, port, db) == (REDIS_HOST, REDIS_PORT, 0):
+            self.redis = redis.Redis(connection_pool=_pool)
+        else:
+            self.redis = redis.Redis(host=host, port=port, db=db, decode_responses=True)
+        self._save = self.redis.register_script(_SAVE_LUA)
+        self._clear_count = self.redis.register_script(_CLEAR_COUNT_LUA)
+        self._merge_backfill = self.redis.register_script(_MERGE_BACKFILL_LUA)
 
     def save(self, user, key, value):
         compound_key = f"{user}:{key}"
-        self.redis.set(compound_key, json.dumps(value))
+        self._save(keys=[compound_key, *_SAVE_KEYS], args=[_encode(value), user])
+
+    def save_many(self, user, pairs):
+        """Save several (key, value) pairs for `user` in one pipelined round-trip."""
+        pipe = self.redis.pipeline(transaction=False)
+        for key, value in pairs:
+            self._save(keys=[f"{user}:{key}", *_SAVE_KEYS],
+                       args=[_encode(value), user], client=pipe)
+        pipe.execute()
 
     def fetch(self, user, key):
-        val = self.redis.get(f"{user}:{key}")
-        return json.loads(val) if val else None
+        return _decode(self.redis.get(f"{user}:{key}"))
 
     def clear(self, user):
-        keys = self.redis.keys(f"{user}:*")
-        for k in keys:
-            self.redis.delete(k)
+        keys = self.redis.scan_iter(match=f"{user}:*", count=1000)
+        while batch := list(islice(keys, UNLINK_BATCH)):
+            self.redis.unlink(*batch)
+        self._clear_count(keys=[PREFIX_COUNTS_KEY, PREFIX_COUNTS_BACKFILL_KEY, PREFIX_COUNTS_CLEARED],
+                          args=[user])
+
+    def backfill_prefix_counts(self):
+        """
+        Count the keys saved before the counts hash existed, once per Redis instance.
+
+        Safe alongside live saves: keys created since deploy are counted by
+        the save script and recorded in a set, which the SCAN skips, and the
+        scanned totals are HINCRBY'd in on top of the live counts rather
+        than overwriting them. Users cleared meanwhile keep their live count.
+        Returns the number of keys counted, or None if another run holds
+        the lock, already finished, or lost the lock mid-scan.
+        """
+        token = secrets.token_hex(8)
+        if not self.redis.set(PREFIX_COUNTS_BACKFILL_KEY, token, nx=True, ex=BACKFILL_LOCK_TTL):
+            return None
+        try:
+            counts = {}
+            keys = self.redis.scan_iter(match="*:*", count=1000, _type="string")
+            while batch := list(islice(keys, UNLINK_BATCH)):
+                # A key SCAN returns already existed, so if it is new its SADD already happened
+                is_new = self.redis.smismember(PREFIX_COUNTS_NEW_KEYS, batch)
+                for key, new in zip(batch, is_new):
+                    user = key.split(":", 1)[0]
+                    if not new and user not in _NON_MEMORY_PREFIXES:
+                        counts[user] = counts.get(user, 0) + 1
+                self.redis.expire(PREFIX_COUNTS_BACKFILL_KEY, BACKFILL_LOCK_TTL)
+            args = [token]
+            for user, n in counts.items():
+                args += [user, n]
+            merged = self._merge_backfill(
+                keys=[PREFIX_COUNTS_KEY, PREFIX_COUNTS_BACKFILL_KEY,
+                      PREFIX_COUNTS_NEW_KEYS, PREFIX_COUNTS_CLEARED],
+                args=args)
+        except Exception:
+            # Release the lock so the next startup retries (unless another run took it)
+            if self.redis.get(PREFIX_COUNTS_BACKFILL_KEY) == token:
+                self.redis.delete(PREFIX_COUNTS_BACKFILL_KEY)
+            raise
+        return sum(counts.values()) if merged == 1 else None
+
+    def append_chain(self, user, *records):
+        """Add records to the user's time-ordered chain (ZSET), keeping the newest entries."""
+        chain_key = CHAIN_KEY.format(user=user)
+        now = time.time_ns()
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.zadd(chain_key, {orjson.dumps(record): now + i for i, record in enumerate(records)})
+        pipe.zremrangebyrank(chain_key, 0, -(CHAIN_MAX_ENTRIES + 1))
+        pipe.execute()
+
+
+redis_memory = RedisMemoryEngine()
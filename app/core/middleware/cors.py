@@ -0,0 +1,15 @@
+# cors.py 🌍
+# --------------------------
+# Starlette's CORSMiddleware with the origin allowlist frozen into a set:
+# the per-request origin check becomes an O(1) hash lookup instead of a list
+# scan, and the allowlist can't be mutated after startup.
+
+from fastapi.middleware.cors import CORSMiddleware
+
+class FrozenOriginCORSMiddleware(CORSMiddleware):
+    """
+    🧊 CORSMiddleware whose `allow_origins` is a frozenset.
+    """
+    def __init__(self, app, allow_origins=(), **kwargs):
+        super().__init__(app, allow_origins=allow_origins, **kwargs)
+        self.allow_origins = frozenset(self.allow_origins)
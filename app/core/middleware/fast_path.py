@@ -0,0 +1,23 @@
+# fast_path.py 🚀
+# --------------------------
+# Pure ASGI middleware that hands a fixed set of paths (liveness probe,
+# Prometheus scrape) to a bare side app before any other user middleware runs.
+# Mounting a sub-app isn't enough: routing happens *inside* the middleware
+# stack, so a mounted app still pays CORS, rate limiting, logging, etc.
+
+from typing import Iterable
+
+class FastPathMiddleware:
+    """
+    🩺 Dispatches HTTP requests for `paths` straight to `fast_app`.
+    Register it last so it sits outermost.
+    """
+    def __init__(self, app, fast_app, paths: Iterable[str]):
+        self.app = app
+        self.fast_app = fast_app
+        self.paths = frozenset(paths)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"] in self.paths:
+            return await self.fast_app(scope, receive, send)
+        await self.app(scope, receive, send)
@@ -0,0 +1,80 @@
+# observability.py 🔭
+# --------------------------
+# One pure ASGI middleware for everything every HTTP response needs:
+# - Security headers appended on `http.response.start`
+# - Prometheus request count (method, endpoint, status) + latency (method, endpoint)
+# - One structured log line (method, path, status, duration, client IP)
+# One send wrapper, one perf_counter pair, one pass over the headers.
+# The counters feed /metrics (served by the probes app) for Grafana.
+
+import logging
+import time
+from functools import lru_cache
+
+from backend.app.core.monitoring.metrics import REQUEST_COUNT, REQUEST_LATENCY
+from backend.app.core.utils.client_ip import client_ip
+
+# 🧱 Built once at import; each response only extends its header list
+SECURITY_HEADERS = (
+    (b"x-content-type-options", b"nosniff"),
+    (b"x-frame-options", b"DENY"),
+    (b"x-xss-protection", b"1; mode=block"),
+    (b"strict-transport-security", b"max-age=31536000; includeSubDomains"),
+)
+
+# 🧷 Labeled children bound once per (method, endpoint[, status])
+@lru_cache(maxsize=4096)
+def _req_ctr(method: str, endpoint: str, status: int):
+    return REQUEST_COUNT.labels(method=method, endpoint=endpoint, status=status)
+
+@lru_cache(maxsize=4096)
+def _req_lat(method: str, endpoint: str):
+    return REQUEST_LATENCY.labels(method=method, endpoint=endpoint)
+
+class ObservabilityMiddleware:
+    """
+    🛡️📈🧾 Security headers, request metrics and request logging in a single layer.
+    """
+    def __init__(self, app, logger: logging.Logger = None):
+        self.app = app
+        self.logger = logger or logging.getLogger(__name__)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        start = time.perf_counter()
+        status_code = 500  # 💥 Unless a response actually starts
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                # 🧬 Fresh list: shared response singletons hand out their own raw_headers
+                headers = list(message.get("headers", ()))
+                headers.extend(SECURITY_HEADERS)
+                message["headers"] = headers
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration = time.perf_counter() - start
+            method = scope["method"]
+
+            # 🧭 Label by route template (/users/{user_id}) to bound cardinality;
+            # the router writes the matched route back into this scope
+            route = scope.get("route")
+            endpoint = route.path if route is not None else scope["path"]
+            _req_ctr(method, endpoint, status_code).inc()
+            _req_lat(method, endpoint).observe(duration)
+
+            if self.logger.isEnabledFor(logging.INFO):
+                self.logger.info(
+                    "%s %s", method, scope["path"],
+                    extra={
+                        "duration_ms": round(duration * 1000, 2),
+                        "status_code": status_code,
+                        "client_ip": client_ip(scope),
+                    }
+                )
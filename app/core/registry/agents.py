@@ -0,0 +1,67 @@
+"""
+agents.py 🗂️
+────────────────────────────────────────────
+Process-wide agent registry.
+
+Each agent is built at most once per worker, on first use, and then
+shared by every route and executor, so memory routers, GPT clients and
+the Mycocore link are never rebuilt per request — and agents a worker
+never serves are never built at all.
+"""
+
+import functools
+from collections.abc import Mapping
+
+from backend.app.agents.neuroweave_agent import NeuroweaveAgent
+from backend.app.agents.sporelink_agent import SporelinkAgent
+from backend.app.agents.rootbloom_agent import RootbloomAgent
+
+_AGENT_CLASSES = {
+    "neuroweave": NeuroweaveAgent,
+    "rootbloom": RootbloomAgent,
+    "sporelink": SporelinkAgent,
+}
+
+
+@functools.cache
+def _build_agent(name: str):
+    return _AGENT_CLASSES[name]()
+
+
+class _LazyAgentRegistry(Mapping):
+    """Read-only name -> agent mapping that builds agents on first lookup."""
+
+    def __getitem__(self, name: str):
+        if name not in _AGENT_CLASSES:
+            raise KeyError(name)
+        return _build_agent(name)
+
+    def __iter__(self):
+        return iter(_AGENT_CLASSES)
+
+    def __len__(self) -> int:
+        return len(_AGENT_CLASSES)
+
+    def __contains__(self, name) -> bool:
+        return name in _AGENT_CLASSES
+
+
+AGENT_REGISTRY = _LazyAgentRegistry()
+
+
+def get_agent(name: str):
+    """
+    Look up a registered agent by key (case-insensitive).
+
+    Returns:
+        BaseLLMAgent | None: The shared agent instance, or None if unknown
+    """
+    return AGENT_REGISTRY.get(name.lower())
+
+
+def get_registered_agents() -> list:
+    """
+    Returns:
+        list[str]: Keys of all registered agents
+    """
+    return list(AGENT_REGISTRY)
@@ -1,30 +1,43 @@
 import jwt, os
 from fastapi import Request, HTTPException
 
-from backend.app.core.users.roles import get_user_role, is_authorized
+from backend.app.core.users.roles import get_user_role, make_role_check
 
 JWT_SECRET = os.environ.get("JWT_SECRET")
 
+# Built once; jwt.decode is called on every authenticated request
+_JWT_ALGORITHMS = ("HS256",)
+_JWT_OPTS = {"require": ["exp", "sub"], "verify_aud": False}
+_BEARER = "Bearer "
+
 def get_current_email(request: Request) -> str:
     """
     Extract and validate JWT token from Authorization header.
     Returns email encoded in token.
     """
     auth = request.headers.get("authorization", "")
-    if not auth.startswith("Bearer "):
+    if not auth.startswith(_BEARER):
         raise HTTPException(401, "Missing or invalid token.")
 
     try:
-        token = auth.replace("Bearer ", "")
-        payload = jwt.decode(token, JWT_SECRET, algorithms=["HS256"])
+        token = auth[len(_BEARER):]
+        # Reuse a payload already decoded for this token earlier in the request
+        if getattr(request.state, "jwt_token", None) == token:
+            payload = request.state.jwt_payload
+        else:
+            payload = jwt.decode(token, JWT_SECRET, algorithms=_JWT_ALGORITHMS, options=_JWT_OPTS)
+            request.state.jwt_token = token
+            request.state.jwt_payload = payload
         return payload.get("email")
     except Exception:
         raise HTTPException(401, "Invalid or expired token.")
     
 def require_role(required: str = "admin"):
+    is_allowed = make_role_check(required)
+
     def role_checker(request: Request):
         email = get_current_email(request)
-        if not is_authorized(email, required):
+        if not is_allowed(email):
             raise HTTPException(403, "Forbidden: insufficient privileges.")
         return email
     return role_checker
\ No newline at end of file
@@ -1,7 +1,11 @@
 import os
+import time
 import getpass
 from backend.app.shared.users.user_identity import UserIdentity
 
+# How long a resolved name/device_id is reused before re-resolving (per worker process)
+IDENTITY_TTL_SECONDS = 300
+
 class SessionManager:
     """
     Tracks user session metadata including profile, context flags, memory, and role identity.
@@ -13,6 +17,8 @@ class SessionManager:
         self._profile = {}     # Dict-based user profile
         self._memory = {}      # Transient in-session memory, if needed
         self.user_identity = UserIdentity()  # Handles role resolution
+        self._identity = None  # Memoized name/device_id (this process only)
+        self._identity_expires = 0.0
 
     # === Profile Handling ===
 
@@ -22,6 +28,7 @@ class SessionManager:
         """
         self._profile = profile
         self._context["username"] = profile.get("name", "unknown")
+        self.invalidate_identity()
 
     def get_user_profile(self) -> dict:
         """
@@ -46,6 +53,34 @@ class SessionManager:
         """
         return self.user_identity.get_role(self.get_user_name())
 
+    def get_identity(self) -> dict:
+        """
+        Returns the resolved {name, role, device_id} for the current user.
+
+        name/device_id are memoized in this worker process for
+        IDENTITY_TTL_SECONDS, or until the profile changes /
+        `invalidate_identity()` is called (login/logout); other workers
+        keep their own copy. The role is never memoized: it is read from
+        roles.json (via load_roles()) on every call, so `set_role` and
+        file edits apply immediately in every worker.
+        """
+        now = time.monotonic()
+        identity = self._identity
+        if identity is None or now >= self._identity_expires:
+            identity = {
+                "name": self.get_user_name(),
+                "device_id": self._profile.get("device_id", "unknown"),
+            }
+            self._identity = identity
+            self._identity_expires = now + IDENTITY_TTL_SECONDS
+        return {**identity, "role": self.user_identity.get_role(identity["name"])}
+
+    def invalidate_identity(self):
+        """
+        Drop the memoized identity so the next lookup re-resolves it.
+        """
+        self._identity = None
+
     # === Runtime Flags ===
 
     def get_flag(self, key: str):
@@ -1,22 +1,69 @@
-import json, os
+import os
+import threading
+from functools import lru_cache
+import orjson
 
 # 🔐 RBAC role loader from JSON config
 ROLES_FILE = os.path.join(os.path.dirname(__file__), "roles.json")
 
+# Parsed roles.json, re-read only when the file's mtime changes
+_cache = {"mtime": 0, "data": None}
+
 def load_roles():
+    """Return the role map; callers must copy before mutating."""
+    try:
+        mtime = os.stat(ROLES_FILE).st_mtime_ns
+    except OSError:
+        return {}
+    if mtime == _cache["mtime"] and _cache["data"] is not None:
+        return _cache["data"]
     try:
-        with open(ROLES_FILE, "r") as f:
-            return json.load(f)
+        with open(ROLES_FILE, "rb") as f:
+            data = orjson.loads(f.read())
     except Exception:
         return {}
+    _cache["mtime"], _cache["data"] = mtime, data
+    return data
+
+_roles_lock = threading.Lock()
 
-ROLE_MAP = load_roles()
+def set_role(email: str, role: str) -> dict:
+    """
+    Persist one role change and return the updated map.
+
+    Serialized by a lock (no lost updates between concurrent writers) and
+    written to a temp file then swapped in with os.replace, so readers
+    never see a partial file. The cache is primed with the new map, so
+    the next load_roles() does not re-read it.
+    """
+    with _roles_lock:
+        roles = dict(load_roles())
+        roles[email] = role
+        tmp = ROLES_FILE + ".tmp"
+        with open(tmp, "wb") as f:
+            f.write(orjson.dumps(roles, option=orjson.OPT_INDENT_2))
+        os.replace(tmp, ROLES_FILE)
+        _cache["data"] = roles
+        _cache["mtime"] = os.stat(ROLES_FILE).st_mtime_ns
+        return roles
+
+# Privilege order; unknown roles rank as guest
+_ROLE_RANK = {"guest": 0, "user": 1, "admin": 2, "owner": 3}
 
 def get_user_role(email: str) -> str:
-    return ROLE_MAP.get(email, "guest")  # default to guest
+    return load_roles().get(email, "guest")  # default to guest
 
 def is_authorized(email: str, required_role: str) -> bool:
-    roles = ["guest", "user", "admin", "owner"]
-    user_rank = roles.index(get_user_role(email)) if get_user_role(email) in roles else 0
-    required_rank = roles.index(required_role)
-    return user_rank >= required_rank
+    rank = _ROLE_RANK.get(get_user_role(email), 0)
+    return rank >= _ROLE_RANK[required_role]
+
+@lru_cache(maxsize=None)
+def make_role_check(required_role: str):
+    """Return an `email -> bool` check with `required_role`'s rank bound in (one per role)."""
+    required_rank = _ROLE_RANK[required_role]
+    rank_of = _ROLE_RANK.get
+
+    def check(email: str) -> bool:
+        # Role comes from load_roles() per call, so roles.json edits apply
+        return rank_of(load_roles().get(email, "guest"), 0) >= required_rank
+    return check
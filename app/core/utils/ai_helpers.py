@@ -11,9 +11,16 @@ This module provides utilities for:
 """
 
 import re
+import orjson
 from typing import Dict, Any, List, Optional, Union
 import time
 
+# How far back truncate_text looks for a sentence end
+SENTENCE_LOOKBACK = 500
+
+# First fenced block (```json or bare ```), compiled once
+_JSON_BLOCK_RE = re.compile(r'```(?:json)?\s*(.*?)\s*```', re.DOTALL)
+
 def count_tokens(text: str, model: str = "gpt-4") -> int:
     """Estimate token count for a given text and model.
     
@@ -26,7 +33,35 @@ def count_tokens(text: str, model: str = "gpt-4") -> int:
     """
     # Simple estimation: ~4 chars per token for English text
     # In production, would use tiktoken or similar
-    return len(text) // 4
+    return len(text) >> 2
+
+def count_tokens_batch(texts: List[str], model: str = "gpt-4") -> List[int]:
+    """Estimate token counts for many texts (e.g. a message history) at once.
+
+    Same estimate as `count_tokens`, without a Python call per text.
+
+    Args:
+        texts (List[str]): Texts to analyze
+        model (str): Model name to estimate tokens for
+
+    Returns:
+        List[int]: Estimated token count per text, in order
+    """
+    return [len(t) >> 2 for t in texts]
+
+def normalize_prompt(text: str) -> bytes:
+    """Canonicalize a prompt for cache keys and embedding lookups.
+
+    Lowercases and collapses every whitespace run to a single space, so
+    prompts differing only in case/spacing share a cache entry.
+
+    Args:
+        text (str): Raw prompt
+
+    Returns:
+        bytes: UTF-8 encoded canonical form
+    """
+    return " ".join(text.lower().split()).encode()
 
 def format_system_prompt(template: str, variables: Dict[str, str]) -> str:
     """Format a system prompt template with variables.
@@ -38,7 +73,8 @@ def format_system_prompt(template: str, variables: Dict[str, str]) -> str:
     Returns:
         str: Formatted prompt
     """
-    return template.format(**variables)
+    # format_map reads the mapping directly (no **kwargs dict copy)
+    return template.format_map(variables)
 
 def extract_json_from_response(response: str) -> Dict[str, Any]:
     """Extract JSON object from an LLM response text.
@@ -53,30 +89,31 @@ def extract_json_from_response(response: str) -> Dict[str, Any]:
         ValueError: If invalid JSON is found
     """
     # Find content between JSON markers or code blocks
-    json_pattern = r'```(?:json)?\s*([\s\S]*?)\s*```'
-    matches = re.findall(json_pattern, response)
+    match = _JSON_BLOCK_RE.search(response)
     
-    if matches:
-        import json
+    if match:
         try:
-            return json.loads(matches[0])
-        except json.JSONDecodeError as e:
+            return orjson.loads(match.group(1))
+        except orjson.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in response: {e}")
     
     return {}
 
-def truncate_text(text: str, max_tokens: int, model: str = "gpt-4") -> str:
+def truncate_text(text: str, max_tokens: int, model: str = "gpt-4",
+                  current_tokens: Optional[int] = None) -> str:
     """Truncate text to fit within token limit.
     
     Args:
         text (str): Text to truncate
         max_tokens (int): Maximum tokens allowed
         model (str): Model name for token estimation
+        current_tokens (int, optional): Precomputed `count_tokens(text, model)`
         
     Returns:
         str: Truncated text
     """
-    current_tokens = count_tokens(text, model)
+    if current_tokens is None:
+        current_tokens = count_tokens(text, model)
     
     if current_tokens <= max_tokens:
         return text
@@ -85,9 +122,9 @@ def truncate_text(text: str, max_tokens: int, model: str = "gpt-4") -> str:
     ratio = max_tokens / current_tokens
     char_limit = int(len(text) * ratio)
     
-    # Try to truncate at sentence boundary
+    # Try to truncate at a sentence boundary, looking back at most one sentence
     truncated = text[:char_limit]
-    last_period = truncated.rfind('.')
+    last_period = truncated.rfind('.', max(0, char_limit - SENTENCE_LOOKBACK))
     
     if last_period > 0:
         return truncated[:last_period + 1] + " [truncated]"
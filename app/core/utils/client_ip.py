@@ -0,0 +1,35 @@
+"""
+client_ip.py 🧭
+────────────────────────────────────────────
+Client address straight from an ASGI scope (no Request object).
+
+- `header_value(scope, name)`: first value of a raw header, latin-1 decoded
+- `client_ip(scope)`: first X-Forwarded-For hop, else X-Real-IP, else the
+  socket peer; headers are walked once
+"""
+
+from typing import Optional
+
+
+def header_value(scope, name: bytes) -> Optional[str]:
+    """Return the first `name` header (lowercase bytes) as str, or None."""
+    for key, value in scope["headers"]:
+        if key == name:
+            return value.decode("latin-1")
+    return None
+
+
+def client_ip(scope) -> Optional[str]:
+    """Best-effort client IP for logging and rate-limit keys."""
+    real_ip = None
+    for key, value in scope["headers"]:
+        if key == b"x-forwarded-for":
+            # First hop only; no list allocation for the common single-IP header
+            comma = value.find(b",")
+            return (value[:comma] if comma >= 0 else value).strip().decode("latin-1")
+        if key == b"x-real-ip" and real_ip is None:
+            real_ip = value.strip().decode("latin-1")
+    if real_ip:
+        return real_ip
+    client = scope.get("client")
+    return client[0] if client else None
@@ -0,0 +1,30 @@
+"""
+clock.py ⏱️
+────────────────────────────────────────────
+Cheap timestamps for hot paths (heartbeats, per-request payloads).
+
+- `utc_now_iso()` formats the current UTC second once and reuses the
+  string until the second rolls over
+- Use `time.perf_counter()` (not datetime math) for elapsed time
+"""
+
+import time
+from datetime import datetime, timezone
+
+_cached_sec = -1
+_cached_iso = ""
+
+
+def utc_now_iso() -> str:
+    """
+    Current UTC time as an ISO 8601 string, at one-second resolution.
+
+    Returns:
+        str: e.g. "2025-01-01T12:00:00+00:00"
+    """
+    global _cached_sec, _cached_iso
+    now = int(time.time())
+    if now != _cached_sec:
+        _cached_iso = datetime.fromtimestamp(now, timezone.utc).isoformat()
+        _cached_sec = now
+    return _cached_iso
@@ -7,13 +7,12 @@ Features:
 - Centralized handler for custom AppError
 - Handles common exception classes: validation, JWT, SQLAlchemy
 - Unified logging output with contextual metadata
+- Error bodies rendered with orjson (same response class as the app default)
 """
 
 from fastapi import FastAPI, Request, status
-from fastapi.responses import JSONResponse
+from backend.app.core.utils.responses import ORJSONUTCResponse
 from fastapi.exceptions import RequestValidationError
-from sqlalchemy.exc import SQLAlchemyError
-from jose.exceptions import JWTError
 from typing import Dict, Any
 import logging
 
@@ -30,6 +29,9 @@ class AppError(Exception):
 
 # 🔧 Hook into FastAPI to register custom handlers
 def setup_error_handlers(app: FastAPI):
+    # Resolved when handlers are registered, not when this module is imported
+    from sqlalchemy.exc import SQLAlchemyError
+    from jose.exceptions import JWTError
 
     # 🧠 Handles custom AppError exceptions
     @app.exception_handler(AppError)
@@ -42,7 +44,7 @@ def setup_error_handlers(app: FastAPI):
                 "path": request.url.path
             }
         )
-        return JSONResponse(
+        return ORJSONUTCResponse(
             status_code=exc.status_code,
             content={
                 "error": exc.message,
@@ -58,7 +60,7 @@ def setup_error_handlers(app: FastAPI):
             "errors": exc.errors(),
             "path": request.url.path
         })
-        return JSONResponse(
+        return ORJSONUTCResponse(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             content={
                 "error": "Validation error",
@@ -73,7 +75,7 @@ def setup_error_handlers(app: FastAPI):
         logger.warning(f"JWT error: {str(exc)}", extra={
             "path": request.url.path
         })
-        return JSONResponse(
+        return ORJSONUTCResponse(
             status_code=status.HTTP_401_UNAUTHORIZED,
             content={
                 "error": "Invalid authentication credentials",
@@ -87,7 +89,7 @@ def setup_error_handlers(app: FastAPI):
         logger.error(f"Database error: {str(exc)}", extra={
             "path": request.url.path
         })
-        return JSONResponse(
+        return ORJSONUTCResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             content={
                 "error": "Database error occurred",
@@ -101,7 +103,7 @@ def setup_error_handlers(app: FastAPI):
         logger.error(f"Unhandled error: {str(exc)}", exc_info=True, extra={
             "path": request.url.path
         })
-        return JSONResponse(
+        return ORJSONUTCResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             content={
                 "error": "Internal server error",
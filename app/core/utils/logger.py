@@ -1,27 +1,33 @@
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
 from datetime import datetime
 from typing import Optional
 from fastapi import Request
 from backend.app.shared.state.session_manager import session
 
-# 🛡️ Safe formatter to prevent logging errors from missing fields (e.g., user, device_id)
-class SafeFormatter(logging.Formatter):
-    def format(self, record):
-        if not hasattr(record, 'user'):
-            record.user = 'N/A'
-        if not hasattr(record, 'device_id'):
-            record.device_id = 'N/A'
-        return super().format(record)
+# Library loggers never carry session context
+_NO_CONTEXT_PREFIXES = ("uvicorn", "sqlalchemy")
 
-# 🧠 Context filter adds user/session info to every log automatically
+# 🧠 Context filter adds user/session info to every log automatically.
+# It sits on the only root handler, so every record leaves it with
+# user/device_id set and a plain Formatter can rely on them.
 class RequestContextFilter(logging.Filter):
     def filter(self, record):
+        if record.name.startswith(_NO_CONTEXT_PREFIXES):
+            record.__dict__.setdefault("user", "N/A")
+            record.__dict__.setdefault("device_id", "N/A")
+            return True
         record.user = session.get_user_name() or "N/A"
         record.device_id = session.get_flag("device_id") or "N/A"
         return True
 
+# 📬 Background listener that owns every file/console handler
+_listener: Optional[logging.handlers.QueueListener] = None
+_queue_handler: Optional[logging.handlers.QueueHandler] = None
+
 # 🛠️ Initialize structured logging with rotation and session metadata
 def setup_logging(
     log_level: str = "INFO",
@@ -32,33 +38,34 @@ def setup_logging(
     Set up logging with both console + rotating file outputs.
     - Includes dynamic session context (user/device_id)
     - Uses custom format with timestamp, log level, etc.
+    - Callers only enqueue records; formatting and file/console writes
+      happen on a QueueListener thread, off the event loop
     """
+    global _listener, _queue_handler
     os.makedirs(log_dir, exist_ok=True)
 
-    log_file = f"{log_dir}/{app_name}_{datetime.now().strftime('%Y%m%d')}.log"
-    agent_logger = logging.getLogger("agent.sporelink")
-    agent_logger.setLevel(logging.INFO)
-    agent_handler = RotatingFileHandler("logs/agent/sporelink_20240527.log")
-    agent_logger.addHandler(agent_handler)
-        
+    log_date = datetime.now().strftime('%Y%m%d')
+    log_file = f"{log_dir}/{app_name}_{log_date}.log"
 
-    formatter = SafeFormatter(
+    formatter = logging.Formatter(
         '[%(asctime)s] [%(levelname)s] [%(name)s] '
         '(user=%(user)s device=%(device_id)s) %(message)s'
     )
+    handlers = []
     
     # --- Agent log rotation ---
     agent_names = ['sporelink', 'neuroweave', 'rootbloom', 'system']
+    os.makedirs(f"{log_dir}/agents", exist_ok=True)
     for agent in agent_names:
-        os.makedirs(f"{log_dir}/agents", exist_ok=True)
         agent_log_path = f"{log_dir}/agents/{agent}_{log_date}.log"
         handler = logging.handlers.RotatingFileHandler(
             agent_log_path, maxBytes=10 * 1024 * 1024, backupCount=10
         )
         handler.setFormatter(formatter)
-        logger = logging.getLogger(f"agent.{agent}")
-        logger.setLevel(getattr(logging, log_level.upper()))
-        logger.addHandler(handler)
+        # Only this agent's records reach its file
+        handler.addFilter(logging.Filter(f"agent.{agent}"))
+        logging.getLogger(f"agent.{agent}").setLevel(getattr(logging, log_level.upper()))
+        handlers.append(handler)
 
     # 🔁 Rotating file handler (keeps 10x 10MB logs)
     file_handler = logging.handlers.RotatingFileHandler(
@@ -67,24 +74,46 @@ def setup_logging(
         backupCount=10
     )
     file_handler.setFormatter(formatter)
+    handlers.append(file_handler)
 
     # 🖥️ Output logs to console as well
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(formatter)
+    handlers.append(console_handler)
+
+    # 📬 Queue in front of all handlers; the listener thread does the I/O
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    # 🧠 Capture user/device context in the calling thread, before enqueueing
+    queue_handler.addFilter(RequestContextFilter())
 
-    # 🧩 Set root logger configuration
     root_logger = logging.getLogger()
-    root_logger.setLevel(getattr(logging, log_level.upper()))
-    root_logger.addHandler(file_handler)
-    root_logger.addHandler(console_handler)
+    # ♻️ Re-running setup replaces the previous queue/listener pair
+    if _queue_handler is not None:
+        root_logger.removeHandler(_queue_handler)
+    if _listener is not None:
+        _listener.stop()
+    else:
+        atexit.register(stop_logging)
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    _queue_handler = queue_handler
 
-    # 🧠 Add user/device context into every log
-    root_logger.addFilter(RequestContextFilter())
+    # 🧩 Set root logger configuration
+    root_logger.setLevel(getattr(logging, log_level.upper()))
+    root_logger.addHandler(queue_handler)
 
     # 📉 Reduce noise from external libraries
     logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
     logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
 
+def stop_logging() -> None:
+    """Flush queued records and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
 # 🔍 Enrich individual logs with HTTP context (method, path, IP)
 def get_request_log_context(request: Optional[Request] = None) -> dict:
     """
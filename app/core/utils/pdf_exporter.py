@@ -1,8 +1,10 @@
-from fpdf import FPDF
 from backend.app.utils.pdf_exporter import PDFExporter
-from fastapi.responses import FileResponse
+from fastapi.responses import StreamingResponse
 
-import datetime, tempfile7yuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuuJM ,qwla65t
+import datetime, io
+import orjson
+
+from backend.app.core.memory.redis_memory_engine import redis_memory
 
 class PDFExporter:
     """
@@ -10,6 +12,8 @@ class PDFExporter:
     """
 
     def __init__(self, title="HyphaeOS Report"):
+        # Deferred: only workers that actually export pay for importing fpdf
+        from fpdf import FPDF
         self.pdf = FPDF()
         self.title = title
 
@@ -27,27 +31,35 @@ class PDFExporter:
         for line in content.split("\n"):
             self.pdf.multi_cell(0, 8, line)
 
-    def generate(self, filename="report.pdf"):
+    def generate(self, filename=None):
+        """Write to `filename`, or return the PDF bytes when no filename is given."""
+        if filename is None:
+            return self.to_bytes()
         self.pdf.output(filename)
         return filename
 
+    def to_bytes(self) -> bytes:
+        """Render the document in memory (no temp file)."""
+        out = self.pdf.output(dest="S")
+        return out.encode("latin-1") if isinstance(out, str) else bytes(out)
+
 @router.get("/system/export/pdf/{user}", tags=["system"])
 def export_user_memory_pdf(user: str, actor=Depends(require_role("admin"))):
     """
     🖨️ Export a user's memory chain into a structured PDF report.
     """
     try:
-        redis_engine = RedisMemoryEngine()
-        keys = redis_engine.redis.keys(f"*{user}:last_*")
+        r = redis_memory.redis
+        keys = list(r.scan_iter(match=f"*{user}:last_*", count=500))
+        raws = r.mget(keys) if keys else []
         entries = []
 
-        for key in keys:
-            raw = redis_engine.redis.get(key)
+        for key, raw in zip(keys, raws):
             try:
-                data = json.loads(raw)
+                data = orjson.loads(raw)
                 if isinstance(data, dict):
                     entries.append(data)
-            except Exception:
+            except (orjson.JSONDecodeError, TypeError):
                 continue
 
         entries.sort(key=lambda x: x.get("timestamp", ""))
@@ -62,8 +74,10 @@ def export_user_memory_pdf(user: str, actor=Depends(require_role("admin"))):
             )
             pdf.add_section(entry['type'].capitalize(), block)
 
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
-            path = pdf.generate(tmp.name)
-            return FileResponse(path, filename=f"{user}_memory_export.pdf", media_type="application/pdf")
+        return StreamingResponse(
+            io.BytesIO(pdf.generate()),
+            media_type="application/pdf",
+            headers={"Content-Disposition": f'attachment; filename="{user}_memory_export.pdf"'},
+        )
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"PDF export failed: {str(e)}")
\ No newline at end of file
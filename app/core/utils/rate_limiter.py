@@ -1,17 +1,42 @@
-from fastapi import HTTPException, Request, Depends
 from typing import Tuple
-import time, logging
-from backend.app.core.cache.redis_cache import cache
-from backend.app.services.token_service import verify_token
+import os, time, logging
+from backend.app.core.cache.redis_cache import redis_client
+from backend.app.core.utils.client_ip import client_ip, header_value
+from backend.app.core.utils.responses import ORJSONUTCResponse
+from backend.app.services.token_service import verify_token_cached
 from fastapi.security import HTTPBearer
 from jose.exceptions import JWTError
 
 logger = logging.getLogger(__name__)
 security = HTTPBearer()
 
+# INCRBY (this hit + hits allowed locally since the last sync) + first-hit
+# EXPIRE + TTL in one round-trip; returns {count, ttl}
+_RATE_LIMIT_LUA = """
+local c = redis.call('INCRBY', KEYS[1], ARGV[2])
+if c == tonumber(ARGV[2]) then redis.call('EXPIRE', KEYS[1], ARGV[1]) end
+return {c, redis.call('TTL', KEYS[1])}
+"""
+
+# Hits below this share of the limit are allowed from the local counter
+LOCAL_ALLOW_RATIO = 0.8
+# Worker processes sharing each Redis counter (same default as gunicorn_conf.py)
+WORKERS = max(1, int(os.getenv("WEB_CONCURRENCY", (os.cpu_count() or 1) * 2 + 1)))
+# Each worker may approve this share of the limit between Redis syncs, so
+# all workers together run at most limit * (1 - LOCAL_ALLOW_RATIO) ahead
+# of Redis: the real per-client ceiling is ~1.2x limit, whatever WORKERS is
+LOCAL_BUDGET_RATIO = (1 - LOCAL_ALLOW_RATIO) / WORKERS
+LOCAL_MAX_KEYS = 10_000
+
+# Probe paths are served ahead of this middleware; skip them defensively anyway
+EXEMPT_PATHS = frozenset({"/health", "/metrics"})
+
 class RateLimiter:
     def __init__(self):
-        self.cache = cache
+        self.redis = redis_client
+        self._script = self.redis.register_script(_RATE_LIMIT_LUA)
+        # L1: key -> [count, window_start (monotonic), hits not yet sent to Redis]
+        self._local = {}
         
         self.default_limits = {
             "GET": 120,
@@ -26,45 +51,56 @@ class RateLimiter:
             "/api/rootbloom/generate": 40
         }
 
-    def _get_real_ip(self, request: Request) -> str:
-        """Get real IP accounting for proxies"""
-        forwarded = request.headers.get("X-Forwarded-For")
-        if forwarded:
-            return forwarded.split(",")[0].strip()
-        return request.client.host
-
-    async def _get_client_id(self, request: Request) -> str:
+    async def _get_client_id(self, scope) -> str:
         """Get client identifier (user ID or IP)"""
         try:
-            auth_header = request.headers.get("Authorization")
+            auth_header = header_value(scope, b"authorization")
             if auth_header:
                 token = auth_header.split(" ")[1]
-                payload = verify_token(token)
-                return f"user:{payload.get('sub')}"
+                # Repeat tokens hit the short-TTL verify cache, not HMAC
+                payload = verify_token_cached(token)
+                if payload is not None:
+                    return f"user:{payload.get('sub')}"
         except (IndexError, JWTError):
             pass
 
-        return f"ip:{self._get_real_ip(request)}"
+        return f"ip:{client_ip(scope)}"
+
+    async def check_rate_limit(self, scope) -> Tuple[bool, int, int]:
+        """Check if request is within rate limits (takes an ASGI scope or a Request).
 
-    async def check_rate_limit(self, request: Request) -> Tuple[bool, int, int]:
-        """Check if request is within rate limits"""
-        client_id = await self._get_client_id(request)
-        method = request.method
-        endpoint = request.url.path
+        Counts are approximate across workers: each worker approves up to
+        limit * LOCAL_BUDGET_RATIO hits locally before syncing with Redis,
+        so a client can get up to ~limit * (2 - LOCAL_ALLOW_RATIO) requests
+        per window in the worst case.
+        """
+        client_id = await self._get_client_id(scope)
+        method = scope["method"]
+        endpoint = scope["path"]
         
         limit = self.endpoint_limits.get(endpoint, self.default_limits.get(method, 60))
         window = 60  # 1 minute window
         
         key = f"ratelimit:{client_id}:{method}:{endpoint}"
         
+        now = time.monotonic()
+        entry = self._local.get(key)
+        if (entry is not None and now - entry[1] < window
+                and entry[0] + 1 < limit * LOCAL_ALLOW_RATIO
+                and entry[2] + 1 <= limit * LOCAL_BUDGET_RATIO):
+            # Comfortably under the limit with local budget left: count locally, skip the Redis RTT
+            entry[0] += 1
+            entry[2] += 1
+            return True, limit - entry[0], int(window - (now - entry[1]))
+
+        pending = entry[2] if entry is not None and now - entry[1] < window else 0
         try:
-            # Use Redis for atomic increment
-            current = await self.cache.incr(key)
-            
-            if current == 1:
-                await self.cache.expire(key, window)
-                
-            ttl = await self.cache.ttl(key)
+            # Atomic increment (incl. locally allowed hits) + window TTL in a single EVALSHA
+            current, ttl = await self._script(keys=[key], args=[window, pending + 1])
+
+            if len(self._local) >= LOCAL_MAX_KEYS:
+                self._prune_local(now, window)
+            self._local[key] = [current, now - (window - max(ttl, 0)), 0]
             
             if current > limit:
                 logger.warning(f"Rate limit exceeded: {client_id} on {method} {endpoint}")
@@ -76,25 +112,48 @@ class RateLimiter:
             logger.error(f"Rate limiter error: {e}")
             return True, 0, 60  # Fail open with warning
 
+    def _prune_local(self, now: float, window: int):
+        """Drop L1 entries whose window has ended."""
+        for key in [k for k, e in self._local.items() if now - e[1] >= window]:
+            del self._local[key]
+
 rate_limiter = RateLimiter()
 
-async def rate_limit_middleware(request: Request, call_next):
-    """Middleware to enforce rate limits"""
-    is_allowed, remaining, reset_in = await rate_limiter.check_rate_limit(request)
-    
-    if not is_allowed:
-        raise HTTPException(
-            status_code=429,
-            detail={
-                "error": "Too many requests",
-                "retry_after": reset_in
-            }
+class RateLimitMiddleware:
+    """Pure ASGI middleware enforcing `rate_limiter` on every HTTP request.
+
+    Rejections are answered here with a 429 (the exception handlers sit
+    inside the middleware stack, so raising would surface as a 500).
+    """
+
+    def __init__(self, app, limiter: RateLimiter = None):
+        self.app = app
+        self.limiter = limiter or rate_limiter
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] in EXEMPT_PATHS:
+            return await self.app(scope, receive, send)
+
+        is_allowed, remaining, reset_in = await self.limiter.check_rate_limit(scope)
+
+        if not is_allowed:
+            response = ORJSONUTCResponse(
+                status_code=429,
+                content={"detail": {"error": "Too many requests", "retry_after": reset_in}},
+                headers={"Retry-After": str(reset_in)},
+            )
+            return await response(scope, receive, send)
+
+        limit_headers = (
+            (b"x-ratelimit-remaining", str(remaining).encode()),
+            (b"x-ratelimit-reset", str(int(time.time()) + reset_in).encode()),
         )
-        
-    response = await call_next(request)
-    
-    # Add rate limit headers
-    response.headers["X-RateLimit-Remaining"] = str(remaining)
-    response.headers["X-RateLimit-Reset"] = str(int(time.time()) + reset_in)
-    
-    return response
\ No newline at end of file
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", ()))
+                headers.extend(limit_headers)
+                message["headers"] = headers
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
@@ -0,0 +1,24 @@
+"""
+responses.py 📤
+────────────────────────────────────────────
+Shared response classes.
+
+- `ORJSONUTCResponse`: orjson-rendered JSON with every datetime emitted as
+  UTC ("Z" suffix); naive datetimes are treated as UTC
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import ORJSONResponse
+
+
+# Shared with code that encodes JSON chunks itself (e.g. streamed responses)
+ORJSON_UTC_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+
+
+class ORJSONUTCResponse(ORJSONResponse):
+    """ORJSONResponse that serializes datetimes as UTC `...Z` strings."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=ORJSON_UTC_OPTIONS)
@@ -1,7 +1,12 @@
-from pydantic import BaseModel, Field, EmailStr, constr
-from typing import Optional, List
+from pydantic import BaseModel, Field, EmailStr, StringConstraints, constr
+from typing import Annotated, Optional, List
 from datetime import datetime
 
+# Shared constrained types — patterns are compiled once when a model's
+# schema is built, and reused by every route module that imports them
+Slug = Annotated[str, StringConstraints(pattern=r'^[a-zA-Z0-9_-]+$')]
+AgentName = Annotated[str, StringConstraints(pattern=r'^[a-zA-Z0-9_-]+$', min_length=1, max_length=50)]
+
 # Auth Validators
 #class UserCredentials(BaseModel):
 #   username: constr(min_length=3, max_length=50)
@@ -24,7 +29,7 @@ class AgentResponse(BaseModel):
 
 # Chain Validators
 class ChainStep(BaseModel):
-    agent: constr(regex=r'^[a-zA-Z0-9_-]+$')
+    agent: AgentName
     prompt: constr(min_length=1, max_length=1000)
 
 class ChainRequest(BaseModel):
@@ -33,12 +38,12 @@ class ChainRequest(BaseModel):
 
 # Plugin Validators
 class PluginRequest(BaseModel):
-    name: constr(regex=r'^[a-zA-Z0-9_-]+$')
+    name: Slug
     input: dict
 
 # System Validators
 class SystemState(BaseModel):
-    mode: constr(regex=r'^(development|production|maintenance)$')
+    mode: Annotated[str, StringConstraints(pattern=r'^(development|production|maintenance)$')]
     flags: dict = Field(default_factory=dict)
     memory: dict = Field(default_factory=dict)
 
@@ -51,6 +56,6 @@ class SystemState(BaseModel):
 
 # Log Entry Validator
 class LogEntry(BaseModel):
-    level: constr(regex=r'^(debug|info|warning|error|critical)$')
+    level: Annotated[str, StringConstraints(pattern=r'^(debug|info|warning|error|critical)$')]
     message: str
     metadata: Optional[dict] = None
\ No newline at end of file
@@ -1,11 +1,18 @@
 import asyncio
 import logging
-from typing import Dict, Set, Any
+import time
+from typing import Dict, Set, Any, Optional
+import orjson
 from fastapi import WebSocket, WebSocketDisconnect
 from datetime import datetime
 
+from backend.app.core.utils.clock import utc_now_iso
+from backend.app.core.utils.responses import ORJSON_UTC_OPTIONS
+
 logger = logging.getLogger(__name__)
 
+HEARTBEAT_INTERVAL = 30  # seconds
+
 class ConnectionManager:
     """
     📡 Manages WebSocket connections, broadcasting, and heartbeat tasks
@@ -13,36 +20,35 @@ class ConnectionManager:
     
     Features:
     - 🔌 Tracks active client sockets
-    - 🫀 Sends periodic heartbeats for liveness
+    - 🫀 Sends periodic heartbeats for liveness (one shared timer task)
     - 📊 Maintains connection stats
     - 📢 Broadcasts messages to all clients (with exclusions)
     """
 
     def __init__(self):
         self.active_connections: Dict[str, WebSocket] = {}
-        self.connection_stats: Dict[str, Dict[str, Any]] = {}
-        self.heartbeat_tasks: Dict[str, asyncio.Task] = {}
+        # 📊 Per-field stats (SoA): one flat dict per counter, keyed by client id
+        # Times are raw time.monotonic() floats; formatted only when stats are read
+        self._connected_at: Dict[str, float] = {}
+        self._recv: Dict[str, int] = {}
+        self._sent: Dict[str, int] = {}
+        self._last_hb: Dict[str, float] = {}
+        self._heartbeat_task: Optional[asyncio.Task] = None
 
     async def connect(self, websocket: WebSocket, client_id: str):
         """
         🔌 Accept and register a new WebSocket connection.
-        - Starts heartbeat loop per connection.
+        - Picked up by the shared heartbeat loop on its next tick.
         - Stores connection metadata for visibility/debugging.
         """
         try:
             await websocket.accept()
             self.active_connections[client_id] = websocket
-            self.connection_stats[client_id] = {
-                "connected_at": datetime.utcnow(),
-                "messages_received": 0,
-                "messages_sent": 0,
-                "last_heartbeat": datetime.utcnow()
-            }
-
-            # 🚀 Launch heartbeat coroutine for this client
-            self.heartbeat_tasks[client_id] = asyncio.create_task(
-                self._heartbeat_loop(client_id)
-            )
+            now = time.monotonic()
+            self._connected_at[client_id] = now
+            self._recv[client_id] = 0
+            self._sent[client_id] = 0
+            self._last_hb[client_id] = now
 
             logger.info(f"[WebSocket] New connection: {client_id}")
 
@@ -53,7 +59,6 @@ class ConnectionManager:
     async def disconnect(self, client_id: str):
         """
         ❌ Disconnect a client and clean up resources.
-        - Cancels the heartbeat.
         - Removes from stats and connection pools.
         """
         if client_id in self.active_connections:
@@ -62,67 +67,119 @@ class ConnectionManager:
             except Exception as e:
                 logger.error(f"[WebSocket] Error closing {client_id}: {e}")
             finally:
-                if client_id in self.heartbeat_tasks:
-                    self.heartbeat_tasks[client_id].cancel()
-                    del self.heartbeat_tasks[client_id]
                 del self.active_connections[client_id]
-                del self.connection_stats[client_id]
+                for field in (self._connected_at, self._recv, self._sent, self._last_hb):
+                    field.pop(client_id, None)
                 logger.info(f"[WebSocket] Client disconnected: {client_id}")
 
+    def record_received(self, client_id: str):
+        """📥 Count one inbound message for `client_id`."""
+        if client_id in self._recv:
+            self._recv[client_id] += 1
+
     async def broadcast(self, message: Dict[str, Any], exclude: Set[str] = None):
         """
         📢 Send a message to all connected clients.
+        - Serializes the message once (orjson) and reuses the frame.
         - Skips clients in the `exclude` list.
         - Handles cleanup of disconnected clients.
         """
         exclude = exclude or set()
-        disconnected = []
-
-        for client_id, websocket in self.active_connections.items():
-            if client_id not in exclude:
-                try:
-                    await websocket.send_json(message)
-                    self.connection_stats[client_id]["messages_sent"] += 1
-                except Exception as e:
-                    logger.error(f"[WebSocket] Broadcast error for {client_id}: {e}")
-                    disconnected.append(client_id)
-
-        # 🧹 Remove any dead connections
-        for client_id in disconnected:
-            await self.disconnect(client_id)
+        # Encode once for every recipient, then fan out concurrently
+        frame = orjson.dumps(message, option=ORJSON_UTC_OPTIONS).decode()
+        clients = [(cid, ws) for cid, ws in self.active_connections.items() if cid not in exclude]
+        if not clients:
+            return
+
+        sent = self._sent
+        for client_id in await self._fan_out(frame, clients, "Broadcast"):
+            if client_id in sent:
+                sent[client_id] += 1
+
+    async def _fan_out(self, frame: str, clients: list, kind: str) -> list:
+        """
+        Send `frame` to every (client_id, websocket) concurrently.
+        - Dead sockets are closed concurrently too, not one by one.
+
+        Returns:
+            list[str]: Client ids that received the frame
+        """
+        results = await asyncio.gather(
+            *(websocket.send_text(frame) for _, websocket in clients),
+            return_exceptions=True,
+        )
+
+        delivered, failed = [], []
+        for (client_id, _), result in zip(clients, results):
+            if isinstance(result, Exception):
+                logger.error(f"[WebSocket] {kind} error for {client_id}: {result}")
+                failed.append(client_id)
+            else:
+                delivered.append(client_id)
+
+        if failed:
+            await asyncio.gather(*(self.disconnect(client_id) for client_id in failed))
+        return delivered
+
+    async def start_heartbeat(self):
+        """🫀 Start the shared heartbeat task (call once at app startup)."""
+        if self._heartbeat_task is None or self._heartbeat_task.done():
+            self._heartbeat_task = asyncio.create_task(self._heartbeat_loop())
+
+    async def stop_heartbeat(self):
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
+            try:
+                await self._heartbeat_task
+            except asyncio.CancelledError:
+                pass
+            self._heartbeat_task = None
 
-    async def _heartbeat_loop(self, client_id: str):
+    async def _heartbeat_loop(self):
         """
-        🫀 Periodically send a heartbeat to a connected client.
-        - Ensures clients remain active.
-        - Helps frontend detect disconnection/liveness.
+        🫀 Send one heartbeat frame to every client per interval.
+        - A single timer for all connections instead of one task each.
+        - The frame is encoded once and reused for every socket.
+        - Sockets whose send fails are disconnected.
         """
         while True:
+            await asyncio.sleep(HEARTBEAT_INTERVAL)
+            if not self.active_connections:
+                continue
             try:
-                if client_id not in self.active_connections:
-                    break
-
-                websocket = self.active_connections[client_id]
-                await websocket.send_json({
-                    "type": "heartbeat",
-                    "timestamp": datetime.utcnow().isoformat()
-                })
-
-                self.connection_stats[client_id]["last_heartbeat"] = datetime.utcnow()
-                await asyncio.sleep(30)
-
+                frame = orjson.dumps({"type": "heartbeat", "timestamp": utc_now_iso()}).decode()
+                clients = list(self.active_connections.items())
+                delivered = await self._fan_out(frame, clients, "Heartbeat")
+
+                now = time.monotonic()
+                last_hb = self._last_hb
+                for client_id in delivered:
+                    if client_id in last_hb:
+                        last_hb[client_id] = now
             except Exception as e:
-                logger.error(f"[WebSocket] Heartbeat error for {client_id}: {e}")
-                await self.disconnect(client_id)
-                break
+                logger.error(f"[WebSocket] Heartbeat loop error: {e}")
 
     def get_connection_stats(self) -> Dict[str, Any]:
         """
         📊 Return live WebSocket connection stats for diagnostics.
         """
+        # monotonic -> wall clock offset, taken once for the whole snapshot
+        offset = time.time() - time.monotonic()
+
+        def _wall(mono: float) -> datetime:
+            return datetime.utcfromtimestamp(mono + offset)
+
         return {
             "total_connections": len(self.active_connections),
-            "connections": self.connection_stats
+            "connections": {
+                client_id: {
+                    "connected_at": _wall(connected_at),
+                    "messages_received": self._recv[client_id],
+                    "messages_sent": self._sent[client_id],
+                    "last_heartbeat": _wall(self._last_hb[client_id])
+                }
+                for client_id, connected_at in self._connected_at.items()
+            }
         }
 
 # 🧠 Singleton WebSocket connection manager
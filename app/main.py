@@ -1,16 +1,27 @@
 # app/main.py 🌐
 """
 Entry point for the HyphaeOS FastAPI backend.
+
+Production:
+    gunicorn -c gunicorn_conf.py app.main:app
+(worker count, recycling and preload live in gunicorn_conf.py; uvicorn[standard]
+brings uvloop + httptools, which UvicornWorker picks up)
+
+Development:
+    uvicorn app.main:app --reload    # reload is dev-only
 """
 
+import asyncio
+import hashlib
+import importlib
 import logging
-import time
+from contextlib import asynccontextmanager, suppress
 from pathlib import Path
 
-from fastapi import FastAPI, Request
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from fastapi.staticfiles import StaticFiles
+import orjson
+from fastapi import FastAPI, Request, Response
+from fastapi.routing import APIRoute
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.openapi.docs import get_swagger_ui_html
 from fastapi.openapi.utils import get_openapi
 
@@ -18,83 +29,115 @@ from prometheus_fastapi_instrumentator import Instrumentator
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
-from fastapi_utils.tasks import repeat_every
 
 from .version import __version__
 from .core.utils.error_handlers import setup_error_handlers
 from .core.utils.logger import setup_logging
-from .core.utils.rate_limiter import rate_limit_middleware
-from .core.middleware.metrics_middleware import MetricsMiddleware
+from .core.utils.responses import ORJSONUTCResponse, ORJSON_UTC_OPTIONS
+from .core.utils.static_files import CachedStaticFiles
+from .core.utils.rate_limiter import RateLimitMiddleware
+from .core.middleware.observability import ObservabilityMiddleware
+from .core.middleware.cors import FrozenOriginCORSMiddleware
+from .core.middleware.fast_path import FastPathMiddleware
 from .core.config.env_loader import get_env_variable
 from .core.utils.dropbox_backup import backup_latest_logs
+from .services.log_writer import system_log_writer
+from .core.utils.websocket_manager import manager as ws_manager
+from .core.cache import redis_cache
+from .core.memory.redis_memory_engine import redis_memory
 
-# Routes
-from .api.routes import (
-    auth_routes, chain_routes, log_routes, mycocore_routes, neuroweave_routes,
-    plugin_routes, rootbloom_routes, sporelink_routes, state_routes,
-    system_routes, user_routes, verify_routes, agent_routes
-)
 
 # Setup logging
 setup_logging()
 logger = logging.getLogger(__name__)
 
+# Cron jobs
+BACKUP_INTERVAL_SECONDS = 3600
+
+async def _backup_loop():
+    """Hourly log backup; first run one interval after startup, upload off the loop."""
+    while True:
+        await asyncio.sleep(BACKUP_INTERVAL_SECONDS)
+        try:
+            await asyncio.to_thread(backup_latest_logs)
+        except Exception as e:
+            logger.error(f"Hourly log backup failed: {e}")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Wraps startup_event / shutdown_event (bottom of module) around the app's lifetime."""
+    include_all_routers(app)
+    await startup_event()
+    backup_task = asyncio.create_task(_backup_loop())
+    try:
+        yield
+    finally:
+        backup_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await backup_task
+        await shutdown_event()
+
 # Initialize FastAPI app
 app = FastAPI(
+    lifespan=lifespan,
     title="HyphaeOS API",
     description="🧠 HyphaeOS Multi-Agent Intelligence System API",
     version=__version__,
     docs_url=None,
-    redoc_url=None
+    redoc_url=None,
+    openapi_url=None,  # Served below from pre-serialized bytes
+    default_response_class=ORJSONUTCResponse,
 )
 
-# Prometheus metrics
-Instrumentator().instrument(app).expose(app)
+# Probes: bare side app for /health and /metrics, dispatched ahead of
+# every middleware below by FastPathMiddleware
+probes = FastAPI(docs_url=None, redoc_url=None, openapi_url=None,
+                 default_response_class=ORJSONUTCResponse)
+PROBE_PATHS = ("/health", "/metrics")
+
+@probes.get("/health")
+async def health_check():
+    return {"status": "ok"}
+
+# Prometheus metrics (recorded by ObservabilityMiddleware, scraped through probes)
+Instrumentator().expose(probes, endpoint="/metrics",
+                        include_in_schema=False, should_gzip=True)
 
 # CORS
-ALLOWED_ORIGINS = get_env_variable("ALLOWED_ORIGINS", "http://localhost:3000").split(",")
+# Normalized once; the middleware freezes them into a set for O(1) checks
+ALLOWED_ORIGINS = tuple(
+    o.strip().rstrip("/").lower()
+    for o in get_env_variable("ALLOWED_ORIGINS", "http://localhost:3000").split(",")
+    if o.strip()
+)
+# Browsers cache preflights this long (Firefox caps at 24h, Chromium at 2h)
+CORS_MAX_AGE = int(get_env_variable("CORS_MAX_AGE", "86400"))
 
 app.add_middleware(
-    CORSMiddleware,
+    FrozenOriginCORSMiddleware,
     allow_origins=ALLOWED_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
+    allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
     allow_headers=["Authorization", "Content-Type", "X-Request-ID", "X-Real-IP"],
     expose_headers=["X-Request-ID"],
-    max_age=3600,
+    max_age=CORS_MAX_AGE,
 )
 
 # Rate Limiting
 limiter = Limiter(key_func=get_remote_address)
 app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
-app.middleware("http")(rate_limit_middleware)
-
-# Security headers
-@app.middleware("http")
-async def add_security_headers(request: Request, call_next):
-    response = await call_next(request)
-    response.headers["X-Content-Type-Options"] = "nosniff"
-    response.headers["X-Frame-Options"] = "DENY"
-    response.headers["X-XSS-Protection"] = "1; mode=block"
-    response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
-    return response
-
-# Request logging
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    start_time = time.time()
-    response = await call_next(request)
-    duration = time.time() - start_time
-    logger.info(
-        f"{request.method} {request.url.path}",
-        extra={
-            "duration_ms": round(duration * 1000, 2),
-            "status_code": response.status_code,
-            "client_ip": request.client.host,
-        }
-    )
-    return response
+app.add_middleware(RateLimitMiddleware)
+
+# Security headers + request metrics + request logging, in one pass
+app.add_middleware(ObservabilityMiddleware, logger=logger)
+
+# Compression — outside everything except the probe fast path
+# (Starlette puts the most recently added middleware on the outside)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)  # 1 KiB
+
+# Probe fast path — added last so it runs first
+app.add_middleware(FastPathMiddleware, fast_app=probes, paths=PROBE_PATHS)
 
 # Custom OpenAPI
 def custom_openapi():
@@ -122,40 +165,72 @@ def custom_openapi():
 
 app.openapi = custom_openapi
 
-# Docs
+# Docs — rendered once; the page only depends on the (fixed) asset URLs
+_DOCS_HTML = get_swagger_ui_html(
+    openapi_url="/openapi.json",
+    title="HyphaeOS API Documentation",
+    swagger_js_url="https://cdn.jsdelivr.net/npm/swagger-ui-dist@5/swagger-ui-bundle.js",
+    swagger_css_url="https://cdn.jsdelivr.net/npm/swagger-ui-dist@5/swagger-ui.css",
+    swagger_favicon_url="https://fastapi.tiangolo.com/img/favicon.png",
+).body
+_DOCS_RESPONSE = Response(
+    content=_DOCS_HTML,
+    media_type="text/html",
+    headers={
+        "cache-control": "public, max-age=3600",
+        "etag": f'"{hashlib.md5(_DOCS_HTML, usedforsecurity=False).hexdigest()}"',
+    },
+)
+_OPENAPI_RESPONSE = None
+
 @app.get("/docs", include_in_schema=False)
 async def custom_swagger_ui_html():
-    return get_swagger_ui_html(
-        openapi_url="/openapi.json",
-        title="HyphaeOS API Documentation",
-        swagger_js_url="https://cdn.jsdelivr.net/npm/swagger-ui-dist@5/swagger-ui-bundle.js",
-        swagger_css_url="https://cdn.jsdelivr.net/npm/swagger-ui-dist@5/swagger-ui.css",
-        swagger_favicon_url="https://fastapi.tiangolo.com/img/favicon.png",
-    )
+    return _DOCS_RESPONSE
+
+@app.get("/openapi.json", include_in_schema=False)
+async def openapi_json():
+    # Serialized on first hit (after every router is included), then reused as raw bytes
+    global _OPENAPI_RESPONSE
+    if _OPENAPI_RESPONSE is None:
+        _OPENAPI_RESPONSE = Response(content=orjson.dumps(app.openapi(), option=ORJSON_UTC_OPTIONS), media_type="application/json")
+    return _OPENAPI_RESPONSE
+
+# Routes — (module under api/routes, tag), all mounted under /api.
+# Imported by include_all_routers() from the lifespan, not at module import,
+# so importing app.main (alembic, scripts, tooling) skips every router's deps
+ROUTERS = [
+    ("agent_routes", "agent"),
+    ("auth_routes", "auth"),
+    ("chain_routes", "chain"),
+    ("log_routes", "logs"),
+    ("mycocore_routes", "mycocore"),
+    ("neuroweave_routes", "neuroweave"),
+    ("plugin_routes", "plugins"),
+    ("rootbloom_routes", "rootbloom"),
+    ("sporelink_routes", "sporelink"),
+    ("state_routes", "state"),
+    ("system_routes", "system"),
+    ("user_routes", "users"),
+    ("verify_routes", "verify"),
+]
+_routers_included = False
+
+def _route_module(name: str):
+    return importlib.import_module(f".api.routes.{name}", package=__package__)
 
-# Routes
-app.include_router(agent_routes.router, prefix="/api", tags=["agent"])
-app.include_router(auth_routes.router, prefix="/api", tags=["auth"])
-app.include_router(chain_routes.router, prefix="/api", tags=["chain"])
-app.include_router(log_routes.router, prefix="/api", tags=["logs"])
-app.include_router(mycocore_routes.router, prefix="/api", tags=["mycocore"])
-app.include_router(neuroweave_routes.router, prefix="/api", tags=["neuroweave"])
-app.include_router(plugin_routes.router, prefix="/api", tags=["plugins"])
-app.include_router(rootbloom_routes.router, prefix="/api", tags=["rootbloom"])
-app.include_router(sporelink_routes.router, prefix="/api", tags=["sporelink"])
-app.include_router(state_routes.router, prefix="/api", tags=["state"])
-app.include_router(system_routes.router, prefix="/api", tags=["system"])
-app.include_router(user_routes.router, prefix="/api", tags=["users"])
-app.include_router(verify_routes.router, prefix="/api", tags=["verify"])
+def include_all_routers(app: FastAPI):
+    """Import and include every router in ROUTERS (once, even across repeated lifespans)."""
+    global _routers_included
+    if _routers_included:
+        return
+    for name, tag in ROUTERS:
+        app.include_router(_route_module(name).router, prefix="/api", tags=[tag])
+    _routers_included = True
 
 # Static files
 BASE_DIR = Path(__file__).resolve().parent
-app.mount("/", StaticFiles(directory=BASE_DIR / "static", html=True), name="static")
-
-# Healthcheck
-@app.get("/health", tags=["System"])
-async def health_check():
-    return {"status": "ok"}
+# Under /assets (not /): API misses 404 in the router instead of stat-ing the disk
+app.mount("/assets", CachedStaticFiles(directory=BASE_DIR / "static"), name="static")
 
 # Rate limit test
 @app.get("/rate-test")
@@ -163,20 +238,51 @@ async def health_check():
 async def rate_limited_route(request: Request):
     return {"message": "You're within the limit"}
 
-# Cron jobs
-@app.on_event("startup")
-@repeat_every(seconds=3600)
-def hourly_log_backup():
-    backup_latest_logs()
+def _uses_get_db(dependant) -> bool:
+    # Matched by name: routes import database via backend.app.*, main via relative imports
+    return any(
+        (getattr(d.call, "__name__", None) == "get_db"
+         and getattr(d.call, "__module__", "").endswith("services.database"))
+        or _uses_get_db(d)
+        for d in dependant.dependencies
+    )
+
+def warn_sync_db_routes():
+    """Log sync handlers that take an AsyncSession (they'd run in the threadpool)."""
+    for route in app.routes:
+        if (isinstance(route, APIRoute) and not asyncio.iscoroutinefunction(route.endpoint)
+                and _uses_get_db(route.dependant)):
+            logger.warning(f"Sync handler {route.endpoint.__name__} ({route.path}) depends on get_db; make it async def")
+
+async def backfill_memory_counts():
+    """Count memory keys written before dashboard:prefix_counts existed (first boot only)."""
+    try:
+        counted = await asyncio.to_thread(redis_memory.backfill_prefix_counts)
+    except Exception as e:
+        logger.warning(f"Memory key count backfill failed, will retry next startup: {e}")
+        return
+    if counted is not None:
+        logger.info(f"Backfilled dashboard memory key counts ({counted} keys)")
 
-@app.on_event("startup")
 async def startup_event():
     logger.info(f"Starting HyphaeOS API v{__version__}")
+    warn_sync_db_routes()
+    await system_log_writer.start()
+    await _route_module("mycocore_routes").start_snapshot_sampler()
+    await ws_manager.start_heartbeat()
+    await backfill_memory_counts()
 
-@app.on_event("shutdown")
 async def shutdown_event():
     logger.info("Shutting down HyphaeOS API")
+    await ws_manager.stop_heartbeat()
+    await _route_module("mycocore_routes").stop_snapshot_sampler()
+    await system_log_writer.stop()
+    await redis_cache.close_pool()
 
 if __name__ == "__main__":
+    import os
     import uvicorn
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
+    # No reload: the file watcher is dev-only and can't be combined with workers
+    uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=False,
+                workers=int(os.getenv("WEB_CONCURRENCY", (os.cpu_count() or 1) * 2 + 1)),
+                loop="uvloop", http="httptools", interface="asgi3")
@@ -0,0 +1,137 @@
+"""system_logs schema and indexes
+
+Revision ID: 7c4e2a9b5d10
+Revises: 1387200dc937
+Create Date: 2026-10-14 12:00:00.000000
+
+Brings system_logs in line with api/models/system_log_model.py:
+- (agent, timestamp) composite index
+- data as JSONB on PostgreSQL
+- timestamp as timezone-aware, NOT NULL, defaulted by the server
+
+and, for api/models/user_model.py, the partial users.verification_token
+index. Both tables' ids move from dashed 36-char strings to sa.Uuid:
+native UUID on PostgreSQL, 32-char hex on SQLite (existing ids are
+converted in place). No foreign keys reference either id.
+
+The earlier revisions never create system_logs (deployments got it from
+metadata.create_all), so it is created here when missing and altered
+in place otherwise.
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '7c4e2a9b5d10'
+down_revision = '1387200dc937'
+branch_labels = None
+depends_on = None
+
+def _ids_to_uuid(table, is_postgres):
+    """Convert `table.id` from a dashed UUID string to sa.Uuid."""
+    if is_postgres:
+        op.alter_column(table, 'id', existing_type=sa.String(), type_=postgresql.UUID(),
+                        postgresql_using='id::uuid')
+    else:
+        # sa.Uuid is CHAR(32) hex on SQLite
+        op.execute(f"UPDATE {table} SET id = lower(replace(id, '-', ''))")
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column('id', existing_type=sa.String(), type_=sa.Uuid())
+
+def _ids_to_str(table, is_postgres):
+    """Inverse of _ids_to_uuid: back to dashed 36-char strings."""
+    if is_postgres:
+        op.alter_column(table, 'id', existing_type=postgresql.UUID(), type_=sa.String(36),
+                        postgresql_using='id::text')
+    else:
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column('id', existing_type=sa.Uuid(), type_=sa.String(36))
+        op.execute(
+            f"UPDATE {table} SET id = substr(id, 1, 8) || '-' || substr(id, 9, 4) || '-' || "
+            "substr(id, 13, 4) || '-' || substr(id, 17, 4) || '-' || substr(id, 21)"
+        )
+
+def upgrade():
+    bind = op.get_bind()
+    is_postgres = bind.dialect.name == "postgresql"
+
+    if not sa.inspect(bind).has_table("system_logs"):
+        op.create_table(
+            'system_logs',
+            sa.Column('id', sa.Uuid(), nullable=False),
+            sa.Column('agent', sa.String(), nullable=False),
+            sa.Column('event', sa.String(), nullable=False),
+            sa.Column('data', sa.JSON().with_variant(postgresql.JSONB(), "postgresql"), nullable=True),
+            sa.Column('timestamp', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+            sa.PrimaryKeyConstraint('id')
+        )
+    else:
+        # Old rows may predate the NOT NULL; stamp them before tightening
+        op.execute('UPDATE system_logs SET "timestamp" = CURRENT_TIMESTAMP WHERE "timestamp" IS NULL')
+
+        if is_postgres:
+            # Existing values were written with datetime.utcnow(), i.e. naive UTC
+            op.alter_column(
+                'system_logs', 'timestamp',
+                existing_type=sa.DateTime(),
+                type_=sa.DateTime(timezone=True),
+                server_default=sa.func.now(),
+                nullable=False,
+                postgresql_using='"timestamp" AT TIME ZONE \'UTC\'',
+            )
+            op.alter_column(
+                'system_logs', 'data',
+                existing_type=sa.JSON(),
+                type_=postgresql.JSONB(),
+                postgresql_using='data::jsonb',
+            )
+        else:
+            # SQLite can't ALTER COLUMN; batch mode rebuilds the table
+            with op.batch_alter_table('system_logs') as batch_op:
+                batch_op.alter_column(
+                    'timestamp',
+                    existing_type=sa.DateTime(),
+                    type_=sa.DateTime(timezone=True),
+                    server_default=sa.func.now(),
+                    nullable=False,
+                )
+
+        _ids_to_uuid('system_logs', is_postgres)
+
+    op.create_index('ix_systemlog_agent_ts', 'system_logs', ['agent', 'timestamp'])
+
+    if sa.inspect(bind).has_table("users"):
+        _ids_to_uuid('users', is_postgres)
+        # Only rows still awaiting verification are ever looked up by token
+        op.create_index(
+            'ix_user_verification_token', 'users', ['verification_token'],
+            postgresql_where=sa.text("verification_token IS NOT NULL"),
+            sqlite_where=sa.text("verification_token IS NOT NULL"),
+        )
+
+def downgrade():
+    bind = op.get_bind()
+    is_postgres = bind.dialect.name == "postgresql"
+
+    if sa.inspect(bind).has_table("users"):
+        op.drop_index('ix_user_verification_token', table_name='users')
+        _ids_to_str('users', is_postgres)
+    op.drop_index('ix_systemlog_agent_ts', table_name='system_logs')
+    _ids_to_str('system_logs', is_postgres)
+
+    if is_postgres:
+        op.alter_column(
+            'system_logs', 'data',
+            existing_type=postgresql.JSONB(),
+            type_=sa.JSON(),
+            postgresql_using='data::json',
+        )
+        op.alter_column(
+            'system_logs', 'timestamp',
+            existing_type=sa.DateTime(timezone=True),
+            type_=sa.DateTime(),
+            server_default=None,
+            nullable=True,
+            postgresql_using='"timestamp" AT TIME ZONE \'UTC\'',
+        )
@@ -4,32 +4,53 @@ redis_client.py 🔌
 Redis interface module for HyphaeOS.
 
 Responsibilities:
-- Establish a connection to a local Redis instance
-- Expose a reusable Redis client for imports
+- Expose one pooled asyncio client (`redis_client`, + `get_redis` dependency)
+  shared by every coroutine in the worker
+- Expose a pooled asyncio bytes client for binary (msgpack) payloads
 - Provide a test method to verify availability
 
 Usage:
-    from backend.app.redis_client import redis_client
+    from backend.app.redis_client import redis_client, redis_bytes_client
 """
 
+import os
 import redis
+import redis.asyncio
 
-# 🔗 Connect to local Redis server
-redis_client = redis.StrictRedis(
-    host="localhost",     # 🏠 Redis server (local)
-    port=6379,            # 🔌 Default Redis port
-    db=0,                 # 🧱 Redis database index (0 by default)
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+ASYNC_POOL_MAX_CONNECTIONS = 100
+
+# ⚡ Non-blocking client for async code (routes, rate limiter, caches),
+# backed by one shared, bounded connection pool per worker
+async_pool = redis.asyncio.ConnectionPool.from_url(
+    REDIS_URL,
+    max_connections=ASYNC_POOL_MAX_CONNECTIONS,
     decode_responses=True  # 🔡 Automatically decode bytes to strings
 )
+redis_client = redis.asyncio.Redis(connection_pool=async_pool)
+redis_async_client = redis_client  # 🪪 Older name, kept for existing imports
+
+# 📦 Same server, raw bytes in/out (msgpack-encoded cache entries); its own
+# pool because decode_responses is a per-connection setting
+async_bytes_pool = redis.asyncio.ConnectionPool.from_url(
+    REDIS_URL,
+    max_connections=ASYNC_POOL_MAX_CONNECTIONS,
+    decode_responses=False
+)
+redis_bytes_client = redis.asyncio.Redis(connection_pool=async_bytes_pool)
+
+def get_redis() -> redis.asyncio.Redis:
+    """FastAPI dependency returning the shared pooled async client."""
+    return redis_async_client
 
-def test_redis_connection():
+async def test_redis_connection():
     """
     ✅ Ping Redis to confirm connectivity.
 
     Useful for diagnostics during startup or setup.
     """
     try:
-        redis_client.ping()
+        await redis_client.ping()
         print("[+] Redis connection test successful.")
     except redis.exceptions.ConnectionError:
         print("[!] Failed to connect to Redis. Make sure it's running.")
@@ -40,7 +40,7 @@ class AgentService:
         try:
             # Check cache first
             cache_key = f"agent:{agent_id}:prompt:{hash(prompt)}"
-            cached_response = cache.get(cache_key)
+            cached_response = await cache.get(cache_key)
             if cached_response:
                 AGENT_REQUESTS.labels(agent=agent_id, status="cache_hit").inc()
                 return cached_response
@@ -64,7 +64,7 @@ class AgentService:
             }
             
             # Cache successful response
-            cache.set(cache_key, result, expire=3600)
+            await cache.set(cache_key, result, expire=3600)
             
             # Record metrics
             AGENT_REQUESTS.labels(agent=agent_id, status="success").inc()
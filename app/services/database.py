@@ -1,7 +1,12 @@
 # app/services/database.py
 
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker
+import os
+from typing import AsyncIterator
+
+import orjson
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from sqlalchemy.engine import make_url
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, StaticPool
 from shared.config.env_loader import get_env_variable
 
 # Determine which DB to use via env
@@ -12,18 +17,45 @@ if DB_ENGINE == "postgres":
 else:
     DATABASE_URL = get_env_variable("SQLITE_URL", optional=False)
 
+# Pool shape follows the backend
+if DATABASE_URL.startswith("sqlite"):
+    # SQLite has a single writer and aiosqlite serializes on a thread anyway:
+    # pooling only contends on the write lock. In-memory DBs must share
+    # their one connection; file DBs open a cheap connection per session.
+    in_memory = make_url(DATABASE_URL).database in (None, "", ":memory:")
+    ENGINE_OPTIONS = {
+        "poolclass": StaticPool if in_memory else NullPool,
+        "connect_args": {"check_same_thread": False},
+    }
+else:
+    POOL_SIZE = min(32, (os.cpu_count() or 1) * 4)
+    ENGINE_OPTIONS = {
+        "poolclass": AsyncAdaptedQueuePool,
+        "pool_size": POOL_SIZE,
+        "max_overflow": POOL_SIZE * 2,
+        "pool_timeout": 30,
+        "pool_pre_ping": True,
+        "pool_recycle": 1800,
+        # LIFO checkout keeps a small hot set of connections warm; extras idle out
+        "pool_use_lifo": True,
+        "isolation_level": "READ COMMITTED",
+        # asyncpg: JIT only adds planning latency to short OLTP queries
+        "connect_args": {"server_settings": {"application_name": "hyphaeos", "jit": "off"}},
+    }
+
 # Create async engine and session
 engine = create_async_engine(
     DATABASE_URL,
     future=True,
     echo=False,
-    pool_size=5,
-    max_overflow=10,
-    pool_timeout=30,
+    # JSON/JSONB columns (e.g. SystemLog.data) go through orjson, not stdlib json
+    json_serializer=lambda obj: orjson.dumps(obj).decode(),
+    json_deserializer=orjson.loads,
+    **ENGINE_OPTIONS,
 )
 
-AsyncSessionLocal = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+AsyncSessionLocal = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
 
-async def get_db():
+async def get_db() -> AsyncIterator[AsyncSession]:
     async with AsyncSessionLocal() as session:
         yield session
@@ -1,12 +1,23 @@
-from fastapi import Depends, HTTPException, status
+from functools import lru_cache
+
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer
-from backend.app.services.token_service import verify_token
+from backend.app.services.token_service import verify_token_cached
 
 security = HTTPBearer()
 
+@lru_cache(maxsize=16)
 def require_role(required_role: str):
-    def role_guard(token=Depends(security)):
-        payload = verify_token(token.credentials)
+    """
+    Route guard for `required_role`.
+
+    Cached, so every route guarding the same role shares one dependency
+    callable (FastAPI then resolves it once per request). Async so it
+    runs on the loop rather than a threadpool hop; decodes go through
+    the short-TTL verified-token cache.
+    """
+    async def role_guard(request: Request, token=Depends(security)):
+        payload = verify_token_cached(token.credentials, request)
         if not payload:
             raise HTTPException(status_code=401, detail="Invalid or missing token")
 
@@ -0,0 +1,151 @@
+# app/services/log_writer.py
+
+"""
+SystemLogWriter 🗃️
+────────────────────────────────────────────
+Buffers SystemLog rows in memory and writes them in bulk.
+
+- Callers append rows without touching the DB
+- Rows are staged column-wise (struct-of-arrays) rather than as one
+  dict per row; the buffer is swapped out whole on flush
+- A background task flushes every 200ms or every 500 rows, whichever
+  comes first, straight on an engine connection (no ORM session):
+  PostgreSQL/asyncpg gets one binary COPY, other backends one
+  executemany INSERT in a single transaction
+"""
+
+import asyncio
+import logging
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import orjson
+from sqlalchemy import insert
+
+from backend.app.api.models.system_log_model import SystemLog
+from backend.app.services.database import engine
+
+logger = logging.getLogger("logs.writer")
+
+FLUSH_INTERVAL = 0.2
+MAX_BATCH = 500
+MAX_QUEUE = 10_000
+
+# asyncpg's binary COPY skips per-row parse/plan; JSON goes in as text
+# (SQLAlchemy registers str codecs for json/jsonb on its connections)
+USE_COPY = engine.dialect.driver == "asyncpg"
+COPY_COLUMNS = ["id", "agent", "event", "data", "timestamp"]
+
+
+class SystemLogBuffer:
+    """Parallel column lists for pending SystemLog rows."""
+
+    __slots__ = ("ids", "agents", "events", "data", "timestamps")
+
+    def __init__(self):
+        self.ids: List[uuid.UUID] = []
+        self.agents: List[str] = []
+        self.events: List[str] = []
+        self.data: List[Optional[dict]] = []
+        self.timestamps: List[datetime] = []
+
+    def __len__(self) -> int:
+        return len(self.agents)
+
+    def append(self, log_id: uuid.UUID, agent: str, event: str, data: Optional[dict], timestamp: datetime):
+        self.ids.append(log_id)
+        self.agents.append(agent)
+        self.events.append(event)
+        self.data.append(data)
+        self.timestamps.append(timestamp)
+
+    def records(self) -> Iterator[Tuple]:
+        """Zip the columns into COPY records (COPY_COLUMNS order, JSON pre-encoded)."""
+        data = [None if d is None else orjson.dumps(d).decode() for d in self.data]
+        return zip(self.ids, self.agents, self.events, data, self.timestamps)
+
+    def rows(self) -> List[Dict[str, Any]]:
+        """Zip the columns into executemany parameter sets."""
+        return [
+            {"id": log_id, "agent": agent, "event": event, "data": data, "timestamp": ts}
+            for log_id, agent, event, data, ts in zip(self.ids, self.agents, self.events, self.data, self.timestamps)
+        ]
+
+
+class SystemLogWriter:
+    def __init__(self, flush_interval: float = FLUSH_INTERVAL, max_batch: int = MAX_BATCH,
+                 max_queue: int = MAX_QUEUE):
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self.max_queue = max_queue
+        self._buffer = SystemLogBuffer()
+        self._ready = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+
+    def submit(self, agent: str, event: str, data: Optional[dict] = None) -> Optional[uuid.UUID]:
+        """
+        Stage one log row for the next flush.
+
+        Returns:
+            uuid.UUID or None: The row's id, or None if the buffer is full
+            and the row was dropped
+        """
+        buffer = self._buffer
+        if len(buffer) >= self.max_queue:
+            logger.warning(f"SystemLog buffer full; dropping [{agent}] {event}")
+            return None
+        log_id = uuid.uuid4()
+        buffer.append(log_id, agent, event, data, datetime.now(timezone.utc))
+        if len(buffer) >= self.max_batch:
+            self._ready.set()
+        return log_id
+
+    async def start(self):
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop the flusher and write whatever is still buffered."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self._flush(self._swap())
+
+    async def _run(self):
+        while True:
+            try:
+                await asyncio.wait_for(self._ready.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._ready.clear()
+            await self._flush(self._swap())
+
+    def _swap(self) -> SystemLogBuffer:
+        buffer, self._buffer = self._buffer, SystemLogBuffer()
+        return buffer
+
+    async def _flush(self, buffer: SystemLogBuffer):
+        if not len(buffer):
+            return
+        try:
+            if USE_COPY:
+                async with engine.connect() as conn:
+                    raw = await conn.get_raw_connection()
+                    # COPY is a single atomic statement; no transaction needed
+                    await raw.driver_connection.copy_records_to_table(
+                        SystemLog.__tablename__, records=buffer.records(), columns=COPY_COLUMNS
+                    )
+            else:
+                async with engine.begin() as conn:
+                    await conn.execute(insert(SystemLog), buffer.rows())
+        except Exception as e:
+            logger.error(f"Failed to flush {len(buffer)} system logs: {e}")
+
+
+# 🧠 Shared writer instance (started/stopped with the app)
+system_log_writer = SystemLogWriter()
@@ -16,7 +16,7 @@ class SystemService:
         try:
             # Try cache first
             cache_key = "system:metrics"
-            cached_metrics = cache.get(cache_key)
+            cached_metrics = await cache.get(cache_key)
             if cached_metrics:
                 return cached_metrics
                 
@@ -33,7 +33,7 @@ class SystemService:
             CPU_USAGE.set(metrics["cpu_usage"])
             
             # Cache for 1 minute
-            cache.set(cache_key, metrics, expire=60)
+            await cache.set(cache_key, metrics, expire=60)
             
             return metrics
             
@@ -1,12 +1,18 @@
 from datetime import datetime, timedelta
 from jose import JWTError, jwt
 import os
+import time
 
 SECRET_KEY = os.environ.get("JWT_SECRET")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 15
 REFRESH_TOKEN_EXPIRE_DAYS = 7
 
+# Verified-token cache: raw token -> (monotonic deadline, payload)
+VERIFIED_TTL_SECONDS = 60
+VERIFIED_MAX_ENTRIES = 10_000
+_verified = {}
+
 def create_access_token(data: dict):
     to_encode = data.copy()
     expire = datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
@@ -19,8 +25,65 @@ def create_refresh_token(data: dict):
     to_encode.update({"exp": expire})
     return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
-def verify_token(token: str):
+def verify_token(token: str, request=None):
+    """
+    Decode `token`, or None if invalid.
+
+    When a `request` is passed, the payload is memoized on
+    `request.state` so later dependencies in the same request that see
+    the same token skip the decode.
+    """
+    if request is not None and getattr(request.state, "jwt_token", None) == token:
+        return request.state.jwt_payload
     try:
-        return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
     except JWTError:
-        return None
\ No newline at end of file
+        return None
+    if request is not None:
+        request.state.jwt_token = token
+        request.state.jwt_payload = payload
+    return payload
+
+def verify_token_cached(token: str, request=None):
+    """
+    verify_token() with a short-lived cache of successful decodes.
+
+    A hit skips the signature check entirely. Entries live for at most
+    VERIFIED_TTL_SECONDS and never past the token's own `exp`; failures
+    are not cached. With a `request`, the payload is also memoized on
+    `request.state` like verify_token() does.
+    """
+    if request is not None and getattr(request.state, "jwt_token", None) == token:
+        return request.state.jwt_payload
+
+    now = time.monotonic()
+    hit = _verified.get(token)
+    if hit is not None and hit[0] > now:
+        payload = hit[1]
+    else:
+        if hit is not None:
+            del _verified[token]
+        payload = verify_token(token)
+        if payload is None:
+            return None
+
+        ttl = VERIFIED_TTL_SECONDS
+        exp = payload.get("exp")
+        if exp is not None:
+            ttl = min(ttl, exp - time.time())
+        if ttl > 0:
+            if len(_verified) >= VERIFIED_MAX_ENTRIES:
+                _prune_verified(now)
+            _verified[token] = (now + ttl, payload)
+
+    if request is not None:
+        request.state.jwt_token = token
+        request.state.jwt_payload = payload
+    return payload
+
+def _prune_verified(now: float):
+    for key in [k for k, (deadline, _) in _verified.items() if deadline <= now]:
+        del _verified[key]
+    # Still full: evict oldest insertions (dicts keep insertion order)
+    while len(_verified) >= VERIFIED_MAX_ENTRIES:
+        del _verified[next(iter(_verified))]
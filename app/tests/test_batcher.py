@@ -0,0 +1,88 @@
+import asyncio
+import pytest
+
+from backend.app.agents._batcher import AgentBatcher, get_batcher
+
+class FakeAgent:
+    """Records each ask_batch call; replies are derived from the prompts."""
+    name = "fake"
+
+    def __init__(self, delay=0.0, short_by=0, error=None):
+        self.batches = []
+        self.delay = delay
+        self.short_by = short_by
+        self.error = error
+
+    async def ask_batch(self, prompts):
+        self.batches.append(list(prompts))
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        replies = [f"re:{p}" for p in prompts]
+        return replies[:len(replies) - self.short_by]
+
+def _submit_all(batcher, prompts):
+    async def go():
+        return await asyncio.gather(*(batcher.submit(p) for p in prompts), return_exceptions=True)
+    return asyncio.run(go())
+
+def test_concurrent_prompts_share_one_batch():
+    agent = FakeAgent()
+    replies = _submit_all(AgentBatcher(agent, max_wait_ms=50), ["a", "b", "c"])
+
+    assert replies == ["re:a", "re:b", "re:c"]
+    assert agent.batches == [["a", "b", "c"]]
+
+def test_max_batch_flushes_before_the_deadline():
+    agent = FakeAgent()
+    replies = _submit_all(AgentBatcher(agent, max_batch=2, max_wait_ms=1000), ["a", "b", "c", "d", "e"])
+
+    assert replies == ["re:a", "re:b", "re:c", "re:d", "re:e"]
+    assert [len(b) for b in agent.batches] == [2, 2, 1]
+
+def test_deadline_flushes_a_partial_batch():
+    agent = FakeAgent()
+    batcher = AgentBatcher(agent, max_batch=32, max_wait_ms=5)
+
+    async def go():
+        first = await batcher.submit("a")
+        second = await batcher.submit("b")
+        return first, second
+
+    assert asyncio.run(go()) == ("re:a", "re:b")
+    assert agent.batches == [["a"], ["b"]]
+
+def test_short_reply_list_fails_only_the_unmatched_prompts():
+    agent = FakeAgent(short_by=1)
+    replies = _submit_all(AgentBatcher(agent, max_wait_ms=50), ["a", "b", "c"])
+
+    assert replies[:2] == ["re:a", "re:b"]
+    assert isinstance(replies[2], RuntimeError)
+
+def test_batch_exception_reaches_every_waiter():
+    error = ValueError("llm down")
+    replies = _submit_all(AgentBatcher(FakeAgent(error=error), max_wait_ms=50), ["a", "b", "c"])
+
+    assert replies == [error, error, error]
+
+def test_slow_batches_dispatch_concurrently():
+    agent = FakeAgent(delay=0.2)
+    batcher = AgentBatcher(agent, max_batch=1, max_wait_ms=1, max_inflight=4)
+
+    async def go():
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        replies = await asyncio.gather(*(batcher.submit(p) for p in "abcd"))
+        return replies, loop.time() - start
+
+    replies, elapsed = asyncio.run(go())
+    assert replies == ["re:a", "re:b", "re:c", "re:d"]
+    # Four 0.2s batches in flight together, not back to back
+    assert elapsed < 0.6
+
+def test_get_batcher_is_shared_per_key():
+    agent = FakeAgent()
+    assert get_batcher("fake-test", agent) is get_batcher("fake-test", agent)
+    with pytest.raises(TypeError):
+        get_batcher("fake-test-2")
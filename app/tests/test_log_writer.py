@@ -0,0 +1,59 @@
+import asyncio
+import orjson
+
+from backend.app.services.log_writer import SystemLogBuffer, SystemLogWriter, COPY_COLUMNS
+
+class CapturingWriter(SystemLogWriter):
+    """Writer whose flush records the swapped-out buffers instead of hitting the DB."""
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.flushed = []
+
+    async def _flush(self, buffer):
+        if len(buffer):
+            self.flushed.append(buffer)
+
+def test_buffer_zips_columns_in_copy_order():
+    buffer = SystemLogBuffer()
+    buffer.append("id-1", "neuroweave", "ask", {"k": 1}, "ts-1")
+    buffer.append("id-2", "rootbloom", "plan", None, "ts-2")
+
+    assert COPY_COLUMNS == ["id", "agent", "event", "data", "timestamp"]
+    records = list(buffer.records())
+    assert records[0] == ("id-1", "neuroweave", "ask", orjson.dumps({"k": 1}).decode(), "ts-1")
+    assert records[1][3] is None
+    assert buffer.rows()[1] == {"id": "id-2", "agent": "rootbloom", "event": "plan",
+                                "data": None, "timestamp": "ts-2"}
+
+def test_submit_drops_rows_once_the_buffer_is_full():
+    writer = CapturingWriter(max_queue=2)
+    assert writer.submit("a", "e1") is not None
+    assert writer.submit("a", "e2") is not None
+    assert writer.submit("a", "e3") is None
+    assert len(writer._buffer) == 2
+
+def test_full_batch_flushes_before_the_interval():
+    writer = CapturingWriter(flush_interval=10, max_batch=3)
+
+    async def go():
+        await writer.start()
+        for i in range(3):
+            writer.submit("a", f"e{i}")
+        await asyncio.sleep(0.05)
+        await writer.stop()
+
+    asyncio.run(go())
+    assert [buffer.events for buffer in writer.flushed] == [["e0", "e1", "e2"]]
+
+def test_interval_flush_and_stop_drain_everything():
+    writer = CapturingWriter(flush_interval=0.02, max_batch=100)
+
+    async def go():
+        await writer.start()
+        writer.submit("a", "early")
+        await asyncio.sleep(0.1)
+        writer.submit("a", "late")
+        await writer.stop()
+
+    asyncio.run(go())
+    assert [buffer.events for buffer in writer.flushed] == [["early"], ["late"]]
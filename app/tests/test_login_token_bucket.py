@@ -0,0 +1,53 @@
+import pytest
+
+from backend.app.api.routes import auth_routes
+from backend.app.api.routes.auth_routes import _take_login_token, LOGIN_BUCKET_CAPACITY, LOGIN_WINDOW_MS
+
+class FakeClock:
+    def __init__(self):
+        self.ms = 1_000_000
+
+    def monotonic_ns(self):
+        return self.ms * 1_000_000
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(auth_routes.time, "monotonic_ns", clock.monotonic_ns)
+    monkeypatch.setattr(auth_routes, "_BUCKETS", {})
+    return clock
+
+def test_capacity_then_denied(clock):
+    assert all(_take_login_token("login:1.2.3.4") for _ in range(LOGIN_BUCKET_CAPACITY))
+    assert not _take_login_token("login:1.2.3.4")
+    # Buckets are per key
+    assert _take_login_token("login:5.6.7.8")
+
+def test_refills_one_token_per_interval_keeping_partial_progress(clock):
+    per_token_ms = LOGIN_WINDOW_MS // LOGIN_BUCKET_CAPACITY
+    for _ in range(LOGIN_BUCKET_CAPACITY):
+        _take_login_token("login:ip")
+
+    clock.ms += per_token_ms // 2
+    assert not _take_login_token("login:ip")
+    # The half interval already waited still counts
+    clock.ms += per_token_ms // 2
+    assert _take_login_token("login:ip")
+    assert not _take_login_token("login:ip")
+
+def test_full_window_restores_capacity_without_overfilling(clock):
+    for _ in range(LOGIN_BUCKET_CAPACITY):
+        _take_login_token("login:ip")
+
+    clock.ms += LOGIN_WINDOW_MS * 3
+    assert all(_take_login_token("login:ip") for _ in range(LOGIN_BUCKET_CAPACITY))
+    assert not _take_login_token("login:ip")
+
+def test_prunes_refilled_buckets_when_full(clock, monkeypatch):
+    monkeypatch.setattr(auth_routes, "LOGIN_BUCKETS_MAX", 3)
+    for ip in ("a", "b", "c"):
+        _take_login_token(f"login:{ip}")
+
+    clock.ms += LOGIN_WINDOW_MS
+    assert _take_login_token("login:d")
+    assert set(auth_routes._BUCKETS) == {"login:d"}
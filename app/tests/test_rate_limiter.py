@@ -0,0 +1,68 @@
+import asyncio
+
+from backend.app.core.utils import rate_limiter as rl
+from backend.app.core.utils.rate_limiter import RateLimiter, LOCAL_ALLOW_RATIO
+
+LIMIT = 120  # default GET limit
+
+class FakeRedisCounter:
+    """Stands in for the rate-limit EVALSHA; shared between limiters like one Redis."""
+    def __init__(self):
+        self.counts = {}
+        self.calls = 0
+
+    async def __call__(self, keys, args):
+        self.calls += 1
+        self.counts[keys[0]] = self.counts.get(keys[0], 0) + args[1]
+        return [self.counts[keys[0]], 60]
+
+def _scope(ip="10.0.0.1"):
+    return {"type": "http", "method": "GET", "path": "/api/anything",
+            "headers": [], "client": (ip, 1234)}
+
+def _limiter(redis):
+    limiter = RateLimiter()
+    limiter._script = redis
+    return limiter
+
+def _hit(limiter, n):
+    async def go():
+        return [(await limiter.check_rate_limit(_scope()))[0] for _ in range(n)]
+    return asyncio.run(go())
+
+def test_single_worker_hands_off_to_redis_near_the_limit(monkeypatch):
+    monkeypatch.setattr(rl, "LOCAL_BUDGET_RATIO", 1 - LOCAL_ALLOW_RATIO)
+    redis = FakeRedisCounter()
+    limiter = _limiter(redis)
+
+    allowed = _hit(limiter, LIMIT)
+    assert all(allowed)
+    # Past the local threshold every hit goes to Redis, and nothing was dropped
+    calls_before = redis.calls
+    assert _hit(limiter, 1) == [False]
+    assert redis.calls == calls_before + 1
+    assert sum(redis.counts.values()) == LIMIT + 1
+
+def test_local_budget_is_split_across_workers(monkeypatch):
+    workers = 4
+    monkeypatch.setattr(rl, "LOCAL_BUDGET_RATIO", (1 - LOCAL_ALLOW_RATIO) / workers)
+    redis = FakeRedisCounter()
+    limiters = [_limiter(redis) for _ in range(workers)]
+
+    async def round_robin(n):
+        results = []
+        for i in range(n):
+            results.append((await limiters[i % workers].check_rate_limit(_scope()))[0])
+        return results
+
+    allowed = sum(asyncio.run(round_robin(LIMIT * 3)))
+    # Workers run ahead of Redis by at most limit * (1 - LOCAL_ALLOW_RATIO) in total
+    assert LIMIT <= allowed <= LIMIT * (2 - LOCAL_ALLOW_RATIO)
+
+def test_no_local_allowance_when_the_budget_rounds_to_zero(monkeypatch):
+    monkeypatch.setattr(rl, "LOCAL_BUDGET_RATIO", 0.001)
+    redis = FakeRedisCounter()
+    limiter = _limiter(redis)
+
+    _hit(limiter, 10)
+    assert redis.calls == 10
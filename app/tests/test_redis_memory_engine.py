@@ -0,0 +1,78 @@
+import pytest
+import redis
+
+from backend.app.core.memory.redis_memory_engine import (
+    RedisMemoryEngine, PREFIX_COUNTS_KEY, PREFIX_COUNTS_BACKFILL_KEY,
+)
+
+TEST_DB = 15
+
+@pytest.fixture
+def engine():
+    engine = RedisMemoryEngine(db=TEST_DB)
+    try:
+        engine.redis.ping()
+    except redis.ConnectionError:
+        pytest.skip("Redis not reachable on localhost")
+    engine.redis.flushdb()
+    yield engine
+    engine.redis.flushdb()
+
+def _counts(engine):
+    return {user: int(n) for user, n in engine.redis.hgetall(PREFIX_COUNTS_KEY).items()}
+
+def test_backfill_counts_pre_existing_keys(engine):
+    # Written before the counts hash existed
+    for i in range(3):
+        engine.redis.set(f"alice:old_{i}", "x")
+    engine.redis.set("llm:neuroweave:abc", "cached")
+
+    assert engine.backfill_prefix_counts() == 3
+    assert _counts(engine) == {"alice": 3}
+    assert engine.redis.get(PREFIX_COUNTS_BACKFILL_KEY) == "done"
+    # Only the first run does anything
+    assert engine.backfill_prefix_counts() is None
+
+def test_saves_during_backfill_are_neither_lost_nor_double_counted(engine):
+    for i in range(5):
+        engine.redis.set(f"alice:old_{i}", "x")
+        engine.redis.set(f"bob:old_{i}", "x")
+    # Saved after deploy but before the backfill ran
+    engine.save("alice", "early", "v")
+
+    real_smismember = engine.redis.smismember
+    calls = []
+
+    def saves_mid_scan(name, values):
+        if not calls:
+            engine.save("alice", "during_1", "v")
+            engine.save("carol", "during_1", "v")
+            engine.save("bob", "old_0", "overwrite")  # existing key, not new
+        calls.append(values)
+        return real_smismember(name, values)
+
+    engine.redis.smismember = saves_mid_scan
+    engine.backfill_prefix_counts()
+
+    assert _counts(engine) == {"alice": 7, "bob": 5, "carol": 1}
+
+    # Live counting carries on after the backfill
+    engine.save("dave", "k", "v")
+    assert _counts(engine)["dave"] == 1
+
+def test_clear_during_backfill_keeps_the_live_count(engine):
+    for i in range(4):
+        engine.redis.set(f"alice:old_{i}", "x")
+
+    real_smismember = engine.redis.smismember
+
+    def clear_mid_scan(name, values):
+        result = real_smismember(name, values)
+        engine.clear("alice")
+        engine.save("alice", "fresh", "v")
+        return result
+
+    engine.redis.smismember = clear_mid_scan
+    engine.backfill_prefix_counts()
+
+    assert _counts(engine) == {"alice": 1}
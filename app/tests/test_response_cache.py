@@ -0,0 +1,77 @@
+import asyncio
+import pytest
+
+from backend.app.core.cache import response_cache
+from backend.app.core.cache.response_cache import ResponseCache
+
+class FakeAsyncRedis:
+    """Dict-backed stand-in for the bytes-mode redis.asyncio client."""
+    def __init__(self, fail=False):
+        self.store = {}
+        self.fail = fail
+
+    async def get(self, key):
+        if self.fail:
+            raise ConnectionError("redis down")
+        return self.store.get(key)
+
+    async def setex(self, key, ttl, value):
+        if self.fail:
+            raise ConnectionError("redis down")
+        self.store[key] = value
+
+@pytest.fixture(autouse=True)
+def no_semantic_tier(monkeypatch):
+    monkeypatch.setattr(response_cache, "SentenceTransformer", None)
+
+def test_keys_ignore_case_and_whitespace_but_not_agent():
+    cache = ResponseCache("neuroweave")
+    assert cache.make_key("What is  the\tMarket doing?") == cache.make_key("what is the market doing?")
+    assert cache.make_key("hello") != ResponseCache("rootbloom").make_key("hello")
+
+def test_l1_hit_without_redis():
+    cache = ResponseCache("neuroweave")
+
+    async def go():
+        assert await cache.get("hello") is None
+        await cache.set("hello", "hi there")
+        return await cache.get("  HELLO ")
+
+    assert asyncio.run(go()) == "hi there"
+
+def test_l2_is_shared_between_instances_and_refills_l1():
+    redis = FakeAsyncRedis()
+    writer, reader = ResponseCache("neuroweave", redis=redis), ResponseCache("neuroweave", redis=redis)
+
+    async def go():
+        await writer.set("hello", "hi there")
+        assert [*redis.store] == [f"llm:neuroweave:{writer.make_key('hello')}"]
+        reply = await reader.get("hello")
+        redis.store.clear()
+        # Served from the reader's L1 now
+        return reply, await reader.get("hello")
+
+    assert asyncio.run(go()) == ("hi there", "hi there")
+
+def test_l1_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(response_cache, "L1_MAX_ENTRIES", 2)
+    cache = ResponseCache("neuroweave")
+
+    async def go():
+        await cache.set("a", "1")
+        await cache.set("b", "2")
+        await cache.get("a")  # a is now most recent
+        await cache.set("c", "3")
+        return [await cache.get(p) for p in ("a", "b", "c")]
+
+    assert asyncio.run(go()) == ["1", None, "3"]
+
+def test_redis_errors_degrade_to_a_miss():
+    cache = ResponseCache("neuroweave", redis=FakeAsyncRedis(fail=True))
+
+    async def go():
+        miss = await cache.get("hello")
+        await cache.set("hello", "hi there")
+        return miss, await cache.get("hello")
+
+    assert asyncio.run(go()) == (None, "hi there")
@@ -0,0 +1,53 @@
+import os
+import orjson
+import pytest
+
+from backend.app.core.users import roles
+from backend.app.core.users.roles import load_roles, set_role, get_user_role, is_authorized, make_role_check
+
+@pytest.fixture
+def roles_file(tmp_path, monkeypatch):
+    path = tmp_path / "roles.json"
+    monkeypatch.setattr(roles, "ROLES_FILE", str(path))
+    monkeypatch.setattr(roles, "_cache", {"mtime": 0, "data": None})
+    return path
+
+def _write(path, data, bump_ns=0):
+    path.write_bytes(orjson.dumps(data))
+    if bump_ns:
+        # Guarantee a new mtime even on coarse-grained filesystems
+        st = os.stat(path)
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + bump_ns))
+
+def test_missing_file_means_no_roles(roles_file):
+    assert load_roles() == {}
+    assert get_user_role("a@example.com") == "guest"
+
+def test_file_edits_reach_every_role_check(roles_file):
+    _write(roles_file, {"a@example.com": "user"})
+    is_admin = make_role_check("admin")
+    assert get_user_role("a@example.com") == "user"
+    assert not is_admin("a@example.com")
+
+    _write(roles_file, {"a@example.com": "admin"}, bump_ns=1_000_000_000)
+    assert get_user_role("a@example.com") == "admin"
+    assert is_authorized("a@example.com", "admin")
+    # The check built (and lru-cached) before the edit sees it too
+    assert is_admin("a@example.com")
+
+def test_unchanged_file_is_not_reparsed(roles_file, monkeypatch):
+    _write(roles_file, {"a@example.com": "user"})
+    first = load_roles()
+    monkeypatch.setattr(roles.orjson, "loads", lambda _: pytest.fail("re-parsed unchanged roles.json"))
+    assert load_roles() is first
+
+def test_set_role_persists_and_applies_immediately(roles_file):
+    _write(roles_file, {"a@example.com": "user"})
+    is_owner = make_role_check("owner")
+
+    updated = set_role("b@example.com", "owner")
+
+    assert updated == {"a@example.com": "user", "b@example.com": "owner"}
+    assert orjson.loads(roles_file.read_bytes()) == updated
+    assert get_user_role("b@example.com") == "owner"
+    assert is_owner("b@example.com")
@@ -0,0 +1,32 @@
+# gunicorn_conf.py 🦄
+"""
+Production process model for the HyphaeOS API.
+
+    gunicorn -c gunicorn_conf.py app.main:app
+
+- gunicorn master supervises N uvicorn workers (uvloop + httptools via
+  uvicorn[standard]) and restarts any that crash
+- N defaults to 2 * CPU + 1; override with WEB_CONCURRENCY
+- Workers recycle after ~1000 requests (jittered so they don't all restart
+  together) to cap slow memory growth
+- The app module is imported once in the master and forked (copy-on-write);
+  API routers are still included per worker, from the lifespan
+
+`reload=True` / `uvicorn --reload` is for local development only.
+"""
+
+import multiprocessing as mp
+import os
+
+bind = os.getenv("BIND", "0.0.0.0:8000")
+workers = int(os.getenv("WEB_CONCURRENCY", mp.cpu_count() * 2 + 1))
+worker_class = "uvicorn.workers.UvicornWorker"
+
+keepalive = 5
+max_requests = 1000
+max_requests_jitter = 100
+preload_app = True
+
+# Lifespan startup (router imports, DB/Redis warmup) can outlast the 30s default
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "60"))
+graceful_timeout = 30
@@ -9,15 +9,51 @@ Features:
 """
 
 import os
+import time
 import dropbox
+import requests
 from datetime import datetime
+from dropbox.exceptions import DropboxException, InternalServerError, RateLimitError
 
 DROPBOX_TOKEN = os.getenv("DROPBOX_API_TOKEN")
 
+CHUNK_SIZE = 4 * 1024 * 1024  # Upload-session chunk; bounds memory per upload
+MAX_ATTEMPTS = 4              # Per API call, with exponential backoff
+REQUEST_TIMEOUT = 30
+
+# Errors worth retrying: 5xx, 429 and network failures (not bad paths/tokens)
+_TRANSIENT_ERRORS = (InternalServerError, RateLimitError, requests.exceptions.RequestException)
+
+_dbx = None
+
+def _client() -> dropbox.Dropbox:
+    """Module-wide client, built on first use so its HTTP session (and TLS) is reused."""
+    global _dbx
+    if _dbx is None:
+        if not DROPBOX_TOKEN:
+            raise RuntimeError("❌ Dropbox token not set in .env")
+        _dbx = dropbox.Dropbox(DROPBOX_TOKEN, timeout=REQUEST_TIMEOUT)
+    return _dbx
+
+def _with_retry(call, *args):
+    """Run one Dropbox API call, retrying transient failures with backoff."""
+    for attempt in range(MAX_ATTEMPTS):
+        try:
+            return call(*args)
+        except _TRANSIENT_ERRORS as e:
+            if attempt == MAX_ATTEMPTS - 1:
+                raise
+            # 429s may say how long to wait
+            time.sleep(getattr(e, "backoff", None) or 2 ** attempt)
+
 def upload_log_to_dropbox(local_path: str, remote_dir: str = "/hyphaeos_logs") -> str:
     """
     Upload a file to Dropbox under a daily log folder.
 
+    Files larger than one chunk go through an upload session in
+    `CHUNK_SIZE` pieces, so memory stays flat and the 150 MB single-call
+    limit never applies. Each API call is retried on transient errors.
+
     Args:
         local_path (str): Full path to the log file to upload
         remote_dir (str): Destination Dropbox directory (default: "/hyphaeos_logs")
@@ -28,13 +64,26 @@ def upload_log_to_dropbox(local_path: str, remote_dir: str = "/hyphaeos_logs") -
     Raises:
         RuntimeError: If token is missing or upload fails
     """
-    if not DROPBOX_TOKEN:
-        raise RuntimeError("❌ Dropbox token not set in .env")
+    dbx = _client()
+    remote_path = f"{remote_dir}/{os.path.basename(local_path)}"
+    mode = dropbox.files.WriteMode.overwrite
+
+    try:
+        with open(local_path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size <= CHUNK_SIZE:
+                _with_retry(dbx.files_upload, f.read(), remote_path, mode)
+                return remote_path
 
-    dbx = dropbox.Dropbox(DROPBOX_TOKEN)
+            session = _with_retry(dbx.files_upload_session_start, f.read(CHUNK_SIZE))
+            cursor = dropbox.files.UploadSessionCursor(session_id=session.session_id, offset=f.tell())
+            while size - f.tell() > CHUNK_SIZE:
+                _with_retry(dbx.files_upload_session_append_v2, f.read(CHUNK_SIZE), cursor)
+                cursor.offset = f.tell()
 
-    with open(local_path, "rb") as f:
-        remote_path = f"{remote_dir}/{os.path.basename(local_path)}"
-        dbx.files_upload(f.read(), remote_path, mode=dropbox.files.WriteMode.overwrite)
+            commit = dropbox.files.CommitInfo(path=remote_path, mode=mode)
+            _with_retry(dbx.files_upload_session_finish, f.read(CHUNK_SIZE), cursor, commit)
+    except (DropboxException, requests.exceptions.RequestException) as e:
+        raise RuntimeError(f"❌ Dropbox upload failed for {local_path}: {e}") from e
 
     return remote_path